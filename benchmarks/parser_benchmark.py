@@ -0,0 +1,208 @@
+"""
+파서 오프라인 벤치마크
+- capture 모드로 저장한 페이지 HTML / SSE 응답 / 병합 데이터를 네트워크 없이 재생하여
+  단계별 파싱 시간과 메모리 할당(tracemalloc peak)을 측정
+
+사용법:
+    # 1. 실제 크롤링하면서 fixture 저장
+    CAPTURE_DIR=benchmarks/fixtures python main.py --batch companies.txt
+
+    # 2. 오프라인 벤치마크 (결과를 JSON으로 저장해 두면 이후 실행과 비교 가능)
+    python -m benchmarks.parser_benchmark --fixtures benchmarks/fixtures --repeat 20 --output bench.json
+    python -m benchmarks.parser_benchmark --fixtures benchmarks/fixtures --baseline bench.json --tolerance 0.2
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from crawl.jobkorea import parse_company_info_from_html, get_financial_history
+from crawl.saramin import find_company_in_search_result, parse_company_details, parse_financial_soup
+from crawl.ooai import parse_sse_response
+from common.common_field_template import new_company_data
+from filtering.data_field_filtering import korean_currency_to_number, filtering_company_info
+
+# fixture가 없어도 금액 변환은 측정할 수 있도록 기본 예시 포함
+SAMPLE_CURRENCY_VALUES = [
+    "1조 4,000억 원", "1,123억 8,000만원", "- 262억 4,876만원", "5,000만원",
+    "- 6,561만원", "2,764만원", "10억 4,653만원", "923만원", "123456", "",
+]
+
+def read_fixtures(fixtures_dir: str, site: str, kind: str) -> list:
+    """
+    {fixtures_dir}/{site}/{kind}/ 아래 fixture 파일 목록을 (파일명, 내용) 리스트로 반환
+    """
+    items = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, site, kind, "*"))):
+        with open(path, encoding="utf-8") as f:
+            items.append((os.path.basename(path), f.read()))
+    return items
+
+def collect_currency_values(merged_records: list) -> list:
+    """
+    병합 데이터 fixture에서 금액 문자열(최근 재무 필드, financial_history 값)을 모두 모음
+    """
+    values = list(SAMPLE_CURRENCY_VALUES)
+    for record in merged_records:
+        for key in ("latest_revenue", "latest_operating_income", "latest_net_income",
+                    "total_funding", "latest_valuation", "market_cap"):
+            if isinstance(record.get(key), str):
+                values.append(record[key])
+        history = record.get("financial_history")
+        if isinstance(history, dict):
+            for year_data in history.values():
+                values.extend(v for v in year_data.values() if isinstance(v, str))
+    return values
+
+def build_stages(fixtures_dir: str) -> dict:
+    """
+    측정할 단계 목록 생성: 단계명 → (입력 리스트, 입력 하나를 처리하는 함수)
+    BeautifulSoup 생성 비용이 포함되는 단계와, 미리 파싱한 soup을 받는 단계를 구분
+    """
+    stages = {}
+
+    # JobKorea 상세 페이지 (HTML → 회사 정보 dict, soup 생성 포함)
+    jobkorea_details = [(html, False) for _, html in read_fixtures(fixtures_dir, "jobkorea", "detail")]
+    jobkorea_popups = [(html, True) for _, html in read_fixtures(fixtures_dir, "jobkorea", "detail_popup")]
+    stages["jobkorea.parse_company_info"] = (
+        jobkorea_details + jobkorea_popups,
+        lambda item: parse_company_info_from_html(item[0], financial_popup=item[1]),
+    )
+    stages["jobkorea.get_financial_history"] = (
+        [BeautifulSoup(html, "html.parser") for html, _ in jobkorea_popups],
+        get_financial_history,
+    )
+
+    # Saramin 검색/상세/재무 페이지 (미리 파싱한 soup 기준)
+    stages["saramin.find_company_in_search_result"] = (
+        [BeautifulSoup(html, "html.parser") for _, html in read_fixtures(fixtures_dir, "saramin", "search")],
+        lambda soup: find_company_in_search_result(soup, ""),
+    )
+    stages["saramin.parse_company_details"] = (
+        [BeautifulSoup(html, "html.parser") for _, html in read_fixtures(fixtures_dir, "saramin", "detail")],
+        lambda soup: parse_company_details(soup, "", new_company_data()),
+    )
+    stages["saramin.extract_financial_info"] = (
+        [BeautifulSoup(html, "html.parser") for _, html in read_fixtures(fixtures_dir, "saramin", "finance")],
+        lambda soup: parse_financial_soup(soup, {"financial_history": {}}),
+    )
+
+    # oo.ai SSE 응답
+    stages["ooai.parse_sse_response"] = (
+        [body for _, body in read_fixtures(fixtures_dir, "ooai", "sse")],
+        parse_sse_response,
+    )
+
+    # 정제 단계
+    merged_records = [json.loads(body) for _, body in read_fixtures(fixtures_dir, "pipeline", "merged")]
+    stages["filtering.korean_currency_to_number"] = (collect_currency_values(merged_records), korean_currency_to_number)
+    stages["filtering.filtering_company_info"] = (merged_records, filtering_company_info)
+
+    return stages
+
+def measure_stage(inputs: list, func, repeat: int) -> dict:
+    """
+    단계 하나의 시간/메모리 측정
+    - 시간: 전체 입력을 repeat번 반복 처리한 총 시간 기준 호출당 평균
+    - 메모리: tracemalloc으로 입력별 1회 처리 시 peak 할당량 (시간 측정과 분리하여 측정)
+    """
+    if not inputs:
+        return {"inputs": 0}
+
+    # 출력 억제 (파서 내부 print가 측정을 방해하지 않도록)
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        func(inputs[0]) # warm-up
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for item in inputs:
+                func(item)
+        elapsed = time.perf_counter() - started
+
+        peaks = []
+        for item in inputs:
+            tracemalloc.start()
+            func(item)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peaks.append(peak)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    calls = repeat * len(inputs)
+    return {
+        "inputs": len(inputs),
+        "calls": calls,
+        "total_ms": elapsed * 1000,
+        "mean_us": elapsed / calls * 1e6,
+        "peak_kib_mean": sum(peaks) / len(peaks) / 1024,
+        "peak_kib_max": max(peaks) / 1024,
+    }
+
+def print_report(results: dict) -> None:
+    print(f"{'stage':<42}{'inputs':>7}{'calls':>8}{'mean(us)':>12}{'total(ms)':>12}{'peak KiB':>10}{'max KiB':>10}")
+    for stage, r in results.items():
+        if not r["inputs"]:
+            print(f"{stage:<42}{0:>7}  (fixture 없음)")
+            continue
+        print(f"{stage:<42}{r['inputs']:>7}{r['calls']:>8}{r['mean_us']:>12.1f}{r['total_ms']:>12.1f}"
+              f"{r['peak_kib_mean']:>10.1f}{r['peak_kib_max']:>10.1f}")
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    기준 결과 대비 호출당 평균 시간이 tolerance 비율 이상 느려진 단계 목록 반환
+    """
+    regressions = []
+    for stage, r in results.items():
+        base = baseline.get(stage)
+        if not r.get("inputs") or not base or not base.get("inputs"):
+            continue
+        ratio = r["mean_us"] / base["mean_us"] if base["mean_us"] else 0
+        if ratio > 1 + tolerance:
+            regressions.append((stage, base["mean_us"], r["mean_us"], ratio))
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="capture fixture 기반 파서 오프라인 벤치마크")
+    parser.add_argument("--fixtures", default="benchmarks/fixtures", help="capture 모드로 저장한 fixture 디렉터리")
+    parser.add_argument("--repeat", type=int, default=10, help="입력 전체를 반복 처리할 횟수")
+    parser.add_argument("--stage", action="append", help="측정할 단계 이름 (여러 번 지정 가능, 기본: 전체)")
+    parser.add_argument("--output", help="측정 결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 판단할 평균 시간 증가 비율 (기본 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    stages = build_stages(args.fixtures)
+    if args.stage:
+        stages = {name: stage for name, stage in stages.items() if name in args.stage}
+
+    results = {name: measure_stage(inputs, func, args.repeat) for name, (inputs, func) in stages.items()}
+    print_report(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"💾 결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        for stage, before, after, ratio in regressions:
+            print(f"❌ 성능 회귀: {stage} {before:.1f}us → {after:.1f}us (x{ratio:.2f})")
+        if regressions:
+            return 1
+        print("✅ 기준 대비 성능 회귀 없음")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+oo.ai 답변 캐시 (SQLite)
+- 키: 정규화한 기업명 + 필드 + 질의 문구 해시 (질의 템플릿/가이드 문구를 바꾸면 이전 답변은 사용하지 않음)
+- 필드별 유효 기간(OOAI_CACHE_FIELD_TTL_DAYS): 최근 동향처럼 자주 바뀌는 필드는 짧게
+- 항목 수가 OOAI_CACHE_MAX_ENTRIES를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU)
+- OOAI_CACHE_BYPASS 설정 시 조회 없이 항상 검색하고, 검색 결과로 캐시만 갱신
+"""
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from cache.resolution_cache import normalize_company_key
+from config.setting import (
+    OOAI_CACHE_ENABLED, OOAI_CACHE_BYPASS, OOAI_CACHE_PATH, OOAI_CACHE_TTL_DAYS, OOAI_CACHE_FIELD_TTL_DAYS,
+    OOAI_CACHE_MAX_ENTRIES,
+)
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ooai_answer_cache (
+    company_key TEXT NOT NULL,
+    field TEXT NOT NULL,
+    prompt_hash TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (company_key, field, prompt_hash)
+)
+"""
+
+_CREATE_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_ooai_answer_cache_last_used ON ooai_answer_cache (last_used_at)"
+
+_initialized_paths = set()
+
+def _connect():
+    """
+    캐시 DB 연결 생성 (호출마다 새 연결: 스레드/프로세스 간에 연결을 공유하지 않음)
+    """
+    directory = os.path.dirname(OOAI_CACHE_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(OOAI_CACHE_PATH, timeout=30)
+    if OOAI_CACHE_PATH not in _initialized_paths:
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.execute(_CREATE_INDEX_SQL)
+        conn.commit()
+        _initialized_paths.add(OOAI_CACHE_PATH)
+    return conn
+
+def prompt_hash(*parts: str) -> str:
+    """
+    질의 문구(템플릿, 가이드 등) 해시 (문구가 바뀌면 캐시 키도 바뀜)
+    """
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
+def field_ttl_seconds(field: str) -> float:
+    return OOAI_CACHE_FIELD_TTL_DAYS.get(field, OOAI_CACHE_TTL_DAYS) * 86400
+
+def get_cached_answer(company_name: str, field: str, prompt_key: str, bypass: bool = OOAI_CACHE_BYPASS):
+    """
+    캐시된 답변(plain_text_answer) 조회 (조회된 항목은 최근 사용 시각 갱신)
+
+    Args:
+        company_name (str): 기업명
+        field (str): 필드명 (ex: "competitors")
+        prompt_key (str): prompt_hash() 결과
+        bypass (bool): True면 조회하지 않음
+
+    Returns:
+        str: 캐시된 답변. 없거나 만료되었으면 None.
+    """
+    if not OOAI_CACHE_ENABLED or bypass:
+        return None
+
+    key = (normalize_company_key(company_name), field, prompt_key)
+    try:
+        with closing(_connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT answer, updated_at FROM ooai_answer_cache WHERE company_key = ? AND field = ? AND prompt_hash = ?",
+                key,
+            ).fetchone()
+            if not row:
+                return None
+            answer, updated_at = row
+            if time.time() - updated_at > field_ttl_seconds(field):
+                conn.execute("DELETE FROM ooai_answer_cache WHERE company_key = ? AND field = ? AND prompt_hash = ?", key)
+                return None
+            conn.execute(
+                "UPDATE ooai_answer_cache SET last_used_at = ? WHERE company_key = ? AND field = ? AND prompt_hash = ?",
+                (time.time(),) + key,
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ oo.ai 캐시 조회 오류: {e}")
+        return None
+    return answer
+
+def save_answer(company_name: str, field: str, prompt_key: str, answer: str) -> None:
+    """
+    답변 저장 (이미 있으면 갱신). 빈 답변은 저장하지 않음 (일시적인 검색 실패일 수 있으므로 다음 실행에서 다시 검색)
+    """
+    if not OOAI_CACHE_ENABLED or not answer:
+        return
+
+    now = time.time()
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ooai_answer_cache (company_key, field, prompt_hash, answer, updated_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (normalize_company_key(company_name), field, prompt_key, answer, now, now),
+            )
+            _evict(conn)
+    except sqlite3.Error as e:
+        print(f"⚠️ oo.ai 캐시 저장 오류: {e}")
+
+def _evict(conn) -> None:
+    # 최대 항목 수를 넘은 만큼 가장 오래 사용하지 않은 항목 삭제
+    count = conn.execute("SELECT COUNT(*) FROM ooai_answer_cache").fetchone()[0]
+    if count > OOAI_CACHE_MAX_ENTRIES:
+        conn.execute(
+            "DELETE FROM ooai_answer_cache WHERE rowid IN "
+            "(SELECT rowid FROM ooai_answer_cache ORDER BY last_used_at LIMIT ?)",
+            (count - OOAI_CACHE_MAX_ENTRIES,),
+        )
@@ -0,0 +1,126 @@
+"""
+기업명 → 사이트별 기업 상세 페이지 URL 해석 결과를 SQLite에 저장하는 캐시
+- 같은 기업을 다시 수집할 때 검색 단계를 건너뛰고 바로 상세 페이지로 이동
+- 404/리다이렉트 등으로 상세 페이지가 유효하지 않으면 invalidate_resolved_url()로 삭제
+- 캐시 키는 사이트별로 등록한 정규화 함수(register_key_normalizer)로 생성
+  (사이트의 기업명 일치 비교와 같은 기준이어야 서로 다른 기업이 같은 캐시 항목을 공유하지 않음)
+"""
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from config.setting import RESOLUTION_CACHE_ENABLED, RESOLUTION_CACHE_PATH, RESOLUTION_CACHE_TTL_DAYS
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS company_url_cache (
+    site TEXT NOT NULL,
+    query_key TEXT NOT NULL,
+    detail_url TEXT NOT NULL,
+    resolved_name TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (site, query_key)
+)
+"""
+
+_initialized_paths = set()
+_KEY_NORMALIZERS = {}
+
+def normalize_company_key(name: str) -> str:
+    """
+    캐시 키로 사용할 기업명 정규화 (영문/숫자/한글만 남기고 소문자화)
+    정규화 함수를 등록하지 않은 사이트와 oo.ai 답변 캐시에서 사용
+    ex: "삼성 전자" → "삼성전자", "Naver Corp." → "navercorp"
+    """
+    return ''.join(filter(str.isalnum, name or "")).lower()
+
+def register_key_normalizer(site: str, normalizer) -> None:
+    """
+    사이트별 캐시 키 정규화 함수 등록
+
+    Args:
+        site (str): 사이트명 (예: "jobkorea", "saramin")
+        normalizer (callable): 기업명을 받아 캐시 키 문자열 반환. 사이트가 검색 결과와 기업명을 비교할 때와 같은 정규화를 사용해야 함.
+    """
+    _KEY_NORMALIZERS[site] = normalizer
+
+def _cache_key(site: str, company_name: str) -> str:
+    return _KEY_NORMALIZERS.get(site, normalize_company_key)(company_name or "")
+
+def _connect():
+    """
+    캐시 DB 연결 생성 (호출마다 새 연결: 스레드/프로세스 간에 연결을 공유하지 않음)
+    """
+    directory = os.path.dirname(RESOLUTION_CACHE_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(RESOLUTION_CACHE_PATH, timeout=30)
+    if RESOLUTION_CACHE_PATH not in _initialized_paths:
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.commit()
+        _initialized_paths.add(RESOLUTION_CACHE_PATH)
+    return conn
+
+def get_cached_url(site: str, company_name: str):
+    """
+    캐시된 기업 상세 페이지 URL 조회
+    Args:
+        site (str): 사이트명 (예: "jobkorea", "saramin")
+        company_name (str): 검색한 기업명
+
+    Returns:
+        dict: {'detail_url': str, 'resolved_name': str}. 캐시가 없거나 만료되었으면 None.
+    """
+    if not RESOLUTION_CACHE_ENABLED:
+        return None
+
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT detail_url, resolved_name, updated_at FROM company_url_cache WHERE site = ? AND query_key = ?",
+                (site, _cache_key(site, company_name)),
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"⚠️ URL 캐시 조회 오류: {e}")
+        return None
+
+    if not row:
+        return None
+
+    detail_url, resolved_name, updated_at = row
+    if time.time() - updated_at > RESOLUTION_CACHE_TTL_DAYS * 86400:
+        return None
+    return {"detail_url": detail_url, "resolved_name": resolved_name}
+
+def save_resolved_url(site: str, company_name: str, detail_url: str, resolved_name: str = "") -> None:
+    """
+    검색으로 찾은 기업 상세 페이지 URL을 캐시에 저장 (이미 있으면 갱신)
+    """
+    if not RESOLUTION_CACHE_ENABLED or not detail_url:
+        return
+
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO company_url_cache (site, query_key, detail_url, resolved_name, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (site, _cache_key(site, company_name), detail_url, resolved_name, time.time()),
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ URL 캐시 저장 오류: {e}")
+
+def invalidate_resolved_url(site: str, company_name: str) -> None:
+    """
+    유효하지 않은(404, 리다이렉트 등) 캐시 항목 삭제
+    """
+    if not RESOLUTION_CACHE_ENABLED:
+        return
+
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM company_url_cache WHERE site = ? AND query_key = ?",
+                (site, _cache_key(site, company_name)),
+            )
+        print(f"🗑 [{site}] '{company_name}' URL 캐시 삭제")
+    except sqlite3.Error as e:
+        print(f"⚠️ URL 캐시 삭제 오류: {e}")
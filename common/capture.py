@@ -0,0 +1,44 @@
+"""
+크롤링 원본(페이지 HTML, SSE 응답, 병합 데이터) 저장 (capture 모드)
+- .env의 CAPTURE_DIR이 설정된 경우에만 동작
+- 저장 구조: {CAPTURE_DIR}/{site}/{kind}/{key}.{ext}
+- 저장된 파일은 benchmarks/parser_benchmark.py에서 네트워크 없이 파서 성능 측정에 사용
+"""
+import hashlib
+import os
+import re
+
+from config.setting import CAPTURE_DIR
+
+def is_capture_enabled() -> bool:
+    return bool(CAPTURE_DIR)
+
+def capture_file_name(key: str, ext: str) -> str:
+    """
+    파일명으로 쓸 수 있도록 key 정리 (한글/영문/숫자/-/_만 남기고 길이 제한, 충돌 방지용 짧은 해시 추가)
+    """
+    safe_key = re.sub(r'[^\w\-]+', '_', key).strip('_')[:60] or "capture"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+    return f"{safe_key}_{digest}.{ext}"
+
+def capture(site: str, kind: str, key: str, content: str, ext: str = "html") -> None:
+    """
+    capture 모드일 때 원본 데이터를 파일로 저장 (저장 실패는 크롤링에 영향을 주지 않음)
+
+    Args:
+        site (str): 사이트명 (예: "jobkorea", "saramin", "ooai", "pipeline")
+        kind (str): 데이터 종류 (예: "detail", "detail_popup", "search", "finance", "sse", "merged")
+        key (str): 파일 식별자 (기업명, 검색어 등)
+        content (str): 저장할 내용
+        ext (str): 확장자 (html, txt, json)
+    """
+    if not CAPTURE_DIR or content is None:
+        return
+
+    try:
+        directory = os.path.join(CAPTURE_DIR, site, kind)
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, capture_file_name(key, ext)), "w", encoding="utf-8") as f:
+            f.write(content)
+    except OSError as e:
+        print(f"⚠️ capture 저장 실패 ({site}/{kind}/{key}): {e}")
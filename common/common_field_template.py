@@ -35,4 +35,30 @@ basic_template = {
     "strengths": "", # 강점
     "risk_factors": "", # 위험 요인  
     "recent_trends": "", # 최근 동향
-}
\ No newline at end of file
+}
+
+# 기본 템플릿의 필드명 (템플릿 순서)
+COMPANY_FIELDS = tuple(basic_template)
+
+# 기본값이 가변 객체(dict)인 필드 - 복사 시 새 객체를 만들어야 함
+_MUTABLE_DEFAULT_FIELDS = tuple(key for key, value in basic_template.items() if isinstance(value, (dict, list)))
+
+def empty_field_value(key: str):
+    """
+    필드의 기본값 반환 (가변 기본값은 새 객체로 생성)
+    """
+    value = basic_template[key]
+    if isinstance(value, dict):
+        return {}
+    if isinstance(value, list):
+        return []
+    return value
+
+def new_company_data() -> dict:
+    """
+    기본 템플릿의 새 복사본 반환 (deepcopy 대신 사용: 가변 기본값만 새로 생성)
+    """
+    company_data = basic_template.copy()
+    for key in _MUTABLE_DEFAULT_FIELDS:
+        company_data[key] = empty_field_value(key)
+    return company_data
@@ -0,0 +1,70 @@
+"""
+기업 정보 레코드 (__slots__ 기반)
+- 기본 템플릿(basic_template)과 같은 36개 필드를 템플릿 순서대로 가짐
+- 필드 dict를 레코드마다 두지 않으므로 대량 배치 병합/내보내기 시 메모리 사용량이 dict의 일부 수준
+- JSON 출력, 기존 함수(dict 기반)와의 연동은 to_dict()/from_dict() 사용
+"""
+from common.common_field_template import COMPANY_FIELDS, basic_template, empty_field_value
+
+class CompanyRecord:
+    __slots__ = COMPANY_FIELDS
+
+    def __init__(self, **fields):
+        """
+        Args:
+            fields: 필드명=값. 지정하지 않은 필드는 기본 템플릿 값으로 채움.
+
+        Raises:
+            TypeError: 템플릿에 없는 필드명이 주어진 경우
+        """
+        unknown = fields.keys() - basic_template.keys()
+        if unknown:
+            raise TypeError(f"CompanyRecord에 없는 필드: {', '.join(sorted(unknown))}")
+        for key in COMPANY_FIELDS:
+            setattr(self, key, fields[key] if key in fields else empty_field_value(key))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompanyRecord":
+        """
+        dict에서 레코드 생성 (템플릿에 없는 키는 무시)
+        """
+        record = cls.__new__(cls)
+        for key in COMPANY_FIELDS:
+            setattr(record, key, data[key] if key in data else empty_field_value(key))
+        return record
+
+    def to_dict(self) -> dict:
+        """
+        템플릿 순서의 dict로 변환 (JSON 출력, 기존 dict 기반 함수 입력용)
+        """
+        return {key: getattr(self, key) for key in COMPANY_FIELDS}
+
+    def copy(self) -> "CompanyRecord":
+        """
+        레코드 복사. financial_history는 연도별 dict까지 복사하고, 나머지 값은 그대로 공유.
+        """
+        record = CompanyRecord.__new__(CompanyRecord)
+        for key in COMPANY_FIELDS:
+            setattr(record, key, getattr(self, key))
+        if isinstance(self.financial_history, dict):
+            record.financial_history = {
+                year: year_data.copy() if isinstance(year_data, dict) else year_data
+                for year, year_data in self.financial_history.items()
+            }
+        return record
+
+    def __eq__(self, other):
+        if not isinstance(other, CompanyRecord):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in COMPANY_FIELDS)
+
+    def __repr__(self):
+        return f"CompanyRecord(name={self.name!r})"
+
+    def __getstate__(self):
+        # __slots__ 객체의 pickle (멀티프로세스 배치에서 워커 → 부모로 전달)
+        return tuple(getattr(self, key) for key in COMPANY_FIELDS)
+
+    def __setstate__(self, state):
+        for key, value in zip(COMPANY_FIELDS, state):
+            setattr(self, key, value)
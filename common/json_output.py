@@ -0,0 +1,98 @@
+"""
+수집 결과 JSON 출력
+- decimal_default_encoder: 정제 데이터의 Decimal 금액을 JSON으로 직렬화
+- NdjsonWriter: 기업 하나 / 단계 하나를 compact JSON 한 줄로 바로 기록 (NDJSON 스트리밍 출력)
+"""
+import contextlib
+import json
+import sys
+import threading
+from decimal import Decimal
+
+# JSON 직렬화 시 Decimal 객체를 처리하기 위한 사용자 정의 함수
+def decimal_default_encoder(obj):
+    if isinstance(obj, Decimal):
+        # Decimal 객체를 float 또는 str으로 변환.
+        # 정밀도를 유지하려면 str이 더 안전합니다.
+        return str(obj)
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+def to_ndjson_line(record: dict) -> str:
+    """
+    dict를 줄바꿈 없는 compact JSON 한 줄로 변환 (끝에 개행 포함)
+    """
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=decimal_default_encoder) + "\n"
+
+class NdjsonWriter:
+    """
+    기업별/단계별 결과를 NDJSON 한 줄씩 기록
+    - 줄 형식: {"company_name": str, "stage": str, "data": dict}
+    - 한 줄을 쓸 때마다 flush (결과를 메모리에 모아두지 않고, 하위 로더가 바로 읽을 수 있도록)
+    - path가 None 또는 "-"이면 stdout에 기록. 이때 writer가 열려 있는 동안 print 출력(크롤링 로그, oo.ai 답변 출력,
+      fork된 배치 워커 프로세스의 로그)은 sys.stderr로 보내서 stdout에는 NDJSON 줄만 남도록 함
+      (sys.stdout만 바꾸고 프로세스의 파일 디스크립터 1은 건드리지 않음, close/with 블록 종료 시 원래대로 복구)
+
+    Example:
+        with NdjsonWriter("result.ndjson") as writer:
+            writer.write(company_name, "filtered", result["filtered"])
+    """
+    def __init__(self, path: str = None, stages=None):
+        """
+        Args:
+            path (str, optional): 출력 파일 경로 (기존 파일 뒤에 이어서 기록)
+            stages (iterable, optional): 기록할 단계 이름 (예: ["raw", "filtered"]). 없으면 전체 기록.
+        """
+        self.path = path if path and path != "-" else None
+        self.stages = set(stages) if stages else None
+        self._redirect = None
+        self._closed = False
+        if self.path:
+            self._file = open(self.path, "a", encoding="utf-8")
+        else:
+            self._file = self._take_stdout()
+        self._lock = threading.Lock()
+
+    def _take_stdout(self):
+        # 원래 sys.stdout은 NDJSON 전용으로 쓰고, writer가 열려 있는 동안 print 출력은 stderr로 보냄
+        output = sys.stdout
+        output.flush()
+        self._redirect = contextlib.redirect_stdout(sys.stderr)
+        self._redirect.__enter__()
+        return output
+
+    def write(self, company_name: str, stage: str, data) -> None:
+        """
+        단계 결과 한 줄 기록 (stages에 없는 단계는 무시)
+        """
+        if self.stages is not None and stage not in self.stages:
+            return
+        line = to_ndjson_line({"company_name": company_name, "stage": stage, "data": data})
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def write_result(self, company_name: str, result: dict) -> None:
+        """
+        run_company_pipeline 결과의 단계별 데이터를 순서대로 기록
+        """
+        for stage, data in result.items():
+            self.write(company_name, stage, data)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._redirect is None:
+            self._file.close()
+            return
+        # stdout은 닫지 않고 로그 출력만 원래 stdout으로 복구
+        self._file.flush()
+        self._redirect.__exit__(None, None, None)
+        self._redirect = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,3 +1,5 @@
+import re
+
 def ooai_field(company_name):
     return {
         "target_customers": f"{company_name} 기업의 주요 목표 고객층",
@@ -5,4 +7,63 @@ def ooai_field(company_name):
         "strengths": f"{company_name} 기업의 강점",
         "risk_factors": f"{company_name} 기업의 위험 요인",
         "recent_trends": f"{company_name} 기업의 최근 동향"
-    }
\ No newline at end of file
+    }
+
+# 필드별 개별 질의 가이드 (ooai_field 질의 뒤에 붙여서 사용)
+EXTRA_PROMPT_GUIDE = "에 대해 다음 가이드라인을 엄수하여 1문장으로 핵심만 요약해 주세요: 1. 불필요한 서론/결론 없이 바로 본론부터 시작. 2. 객관적인 정보만 포함. 3. 가능한 한 수치나 사실 기반으로 서술. 4. ~이다/입니다 체 종결 5. 관련 정보가 없을 경우 텍스트 대신 ''으로 출력."
+
+# 통합 질의 답변 형식 가이드 (항목마다 [[필드명]] 표시 뒤에 답변을 쓰도록 요청)
+COMBINED_PROMPT_GUIDE = " 위 항목 각각에 대해 다음 가이드라인을 엄수하여 답변해 주세요: 1. 항목마다 [[필드명]] 표시를 그대로 쓰고 바로 뒤에 1문장으로 핵심만 요약. 2. 불필요한 서론/결론 없이 바로 본론부터 시작. 3. 객관적인 정보만 포함. 4. 가능한 한 수치나 사실 기반으로 서술. 5. ~이다/입니다 체 종결 6. 관련 정보가 없을 경우 [[필드명]] 뒤에 ''만 출력."
+
+# 답변에 '' 또는 "" 만 있으면 정보 없음으로 처리
+_EMPTY_ANSWER_PATTERN = re.compile(r"^['\"‘’“”]{2}$")
+
+def combined_query(company_name, fields):
+    """
+    비어있는 필드 여러 개를 한 번에 묻는 oo.ai 검색어 생성
+
+    Args:
+        company_name (str): 기업명
+        fields (iterable): 필드명 목록 (ooai_field의 키)
+
+    Returns:
+        str: 검색어 (ex: "(주)깨끗한 기업에 대한 다음 항목: [[competitors]] (주)깨끗한 기업의 주요 경쟁사 / ... 위 항목 각각에 대해 ...")
+    """
+    templates = ooai_field(company_name)
+    items = " / ".join(f"[[{field}]] {templates[field]}" for field in fields)
+    return f"{company_name} 기업에 대한 다음 항목: {items}." + COMBINED_PROMPT_GUIDE
+
+def parse_combined_answer(answer, fields):
+    """
+    통합 질의 답변을 필드별 값으로 분리
+
+    Args:
+        answer (str): oo.ai plain_text_answer
+        fields (iterable): 질의한 필드명 목록
+
+    Returns:
+        dict: 필드명 → 답변. 표시를 찾지 못했거나 표시 뒤에 내용이 없는 필드는 제외 (개별 질의로 다시 검색).
+              정보가 없다고('') 답한 필드만 "".
+    """
+    fields = list(fields)
+    if not answer or not fields:
+        return {}
+
+    # [[필드명]] / [필드명] / 필드명: 형식 허용 (답변에서 괄호가 하나 빠지거나 콜론이 붙는 경우)
+    names = "|".join(re.escape(field) for field in fields)
+    marker = re.compile(rf"\[{{1,2}}\s*({names})\s*\]{{1,2}}\s*[:：\-]?\s*|(?<![\w\[])({names})\s*[:：]\s*")
+    matches = list(marker.finditer(answer))
+
+    parsed = {}
+    for i, match in enumerate(matches):
+        field = match.group(1) or match.group(2)
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(answer)
+        value = answer[match.end():end].strip().strip("/").strip()
+        if field in parsed and parsed[field]:
+            continue
+        if _EMPTY_ANSWER_PATTERN.match(value):
+            parsed[field] = ""
+        elif value:
+            parsed[field] = value
+        # 표시 뒤에 내용이 없으면 파싱 실패로 보고 제외 (개별 질의로 다시 검색)
+    return parsed
@@ -0,0 +1,130 @@
+"""
+사이트(호스트)별 요청 속도 제한 (token bucket)
+- HOST_RATE_LIMITS의 호스트마다 초당 rate개씩 토큰이 채워지고, 최대 burst개까지 쌓임
+- 요청 전에 wait_for_slot(url)을 호출하면 토큰이 생길 때까지 대기
+- 한 프로세스의 여러 스레드는 같은 버킷을 공유
+- 배치 워커 프로세스끼리 공유하려면 부모 프로세스에서 create_shared_buckets()로 만든 상태를
+  프로세스 풀의 initializer(install_shared_buckets)로 전달
+"""
+import multiprocessing
+import threading
+import time
+from urllib.parse import urlparse
+
+from common.tracing import span
+from config.setting import RATE_LIMIT_ENABLED, HOST_RATE_LIMITS
+
+class TokenBucket:
+    """
+    token bucket 하나
+    - state: [남은 토큰 수, 마지막 갱신 시각(time.monotonic)]
+    - 프로세스 간 공유 시 multiprocessing.Array('d', 2) (자체 lock 포함), 아니면 list + threading.Lock
+    """
+    def __init__(self, rate: float, burst: int, state=None):
+        self.rate = rate
+        self.burst = max(1, burst)
+        if state is None:
+            self._state = [float(self.burst), time.monotonic()]
+            self._lock = threading.Lock()
+        else:
+            self._state = state
+            self._lock = state.get_lock()
+
+    def try_acquire(self) -> float:
+        """
+        토큰 하나를 가져옴
+
+        Returns:
+            float: 0이면 획득 성공, 아니면 다음 토큰까지 기다려야 하는 시간(초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.burst, self._state[0] + (now - self._state[1]) * self.rate)
+            self._state[1] = now
+            if tokens >= 1:
+                self._state[0] = tokens - 1
+                return 0.0
+            self._state[0] = tokens
+            return (1 - tokens) / self.rate
+
+    def acquire(self) -> float:
+        """
+        토큰을 얻을 때까지 대기 (lock은 대기 중에 잡고 있지 않음)
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+def host_key(url: str):
+    """
+    URL의 호스트를 HOST_RATE_LIMITS의 키로 변환 (서브도메인 포함, ex: www.jobkorea.co.kr → jobkorea.co.kr)
+
+    Returns:
+        str: 제한 대상 호스트 키. 제한 대상이 아니면 None.
+    """
+    host = (urlparse(url).hostname or "").lower()
+    for key in HOST_RATE_LIMITS:
+        if host == key or host.endswith("." + key):
+            return key
+    return None
+
+def create_shared_buckets() -> dict:
+    """
+    프로세스 간 공유할 버킷 상태 생성 (부모 프로세스에서 호출)
+
+    Returns:
+        dict: 호스트 → multiprocessing.Array('d', [burst, 시각])
+    """
+    return {
+        host: multiprocessing.Array('d', [float(max(1, burst)), time.monotonic()])
+        for host, (rate, burst) in HOST_RATE_LIMITS.items()
+    }
+
+def install_shared_buckets(states: dict) -> None:
+    """
+    공유 버킷 상태를 현재 프로세스의 버킷으로 등록 (ProcessPoolExecutor의 initializer로 사용)
+    """
+    with _buckets_lock:
+        for host, state in states.items():
+            rate, burst = HOST_RATE_LIMITS[host]
+            _buckets[host] = TokenBucket(rate, burst, state)
+
+def get_bucket(host: str) -> TokenBucket:
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate, burst = HOST_RATE_LIMITS[host]
+            bucket = _buckets[host] = TokenBucket(rate, burst)
+        return bucket
+
+def wait_for_slot(url: str) -> float:
+    """
+    url의 호스트에 요청을 보낼 수 있을 때까지 대기 (제한 대상이 아니거나 RATE_LIMIT_ENABLED가 꺼져 있으면 바로 반환)
+
+    Returns:
+        float: 대기한 시간(초)
+    """
+    if not RATE_LIMIT_ENABLED:
+        return 0.0
+    host = host_key(url)
+    if host is None:
+        return 0.0
+    with span("rate_limit.wait", host=host):
+        return get_bucket(host).acquire()
+
+def rate_limited_get(driver, url: str) -> None:
+    """
+    속도 제한을 지켜서 driver.get(url) 실행
+    """
+    wait_for_slot(url)
+    driver.get(url)
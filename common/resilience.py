@@ -0,0 +1,194 @@
+"""
+크롤러/oo.ai 호출 공통 오류 처리 (재시도, 회로 차단)
+- classify_error(): 오류를 일시적(transient) / 속도 제한·차단(throttled) / 영구적(permanent)으로 분류
+- retry_call(): 일시적 오류만 jitter를 적용한 지수 backoff로 재시도 (RETRY_ATTEMPTS회까지)
+- 사이트별 circuit breaker: 연속 실패가 CIRCUIT_FAILURE_THRESHOLD회에 도달하면 CIRCUIT_COOLDOWN초 동안
+  해당 사이트 호출을 바로 실패 처리 (장애 중인 사이트의 대기 시간이 기업 수만큼 반복되지 않도록)
+- circuit breaker 상태는 프로세스별로 관리 (배치 워커 프로세스마다 독립적으로 판단)
+"""
+import random
+import threading
+import time
+
+import requests
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from config.setting import (
+    RETRY_ATTEMPTS, RETRY_BASE_DELAY, RETRY_MAX_DELAY, CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN,
+)
+
+TRANSIENT = "transient"
+THROTTLED = "throttled"
+PERMANENT = "permanent"
+
+# 재시도 대상 HTTP 상태 코드 (403/429는 속도 제한·차단, 나머지는 일시적 서버 오류)
+RETRYABLE_STATUS = (403, 408, 429, 500, 502, 503, 504)
+
+# 속도 제한·차단 응답은 일반 오류보다 길게 대기
+THROTTLED_DELAY_FACTOR = 4
+
+class CircuitOpenError(Exception):
+    """
+    사이트 회로가 차단된 상태라 호출하지 않음
+    """
+
+def classify_error(exc: Exception) -> str:
+    """
+    오류 분류
+
+    Returns:
+        str: TRANSIENT(네트워크/타임아웃/5xx), THROTTLED(403/429), PERMANENT(그 외, 재시도해도 같은 결과)
+    """
+    if isinstance(exc, requests.exceptions.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        if status in (403, 429):
+            return THROTTLED
+        if status in RETRYABLE_STATUS:
+            return TRANSIENT
+        return PERMANENT
+    if isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError)):
+        return TRANSIENT
+    if isinstance(exc, TimeoutException):
+        return TRANSIENT
+    if isinstance(exc, WebDriverException) and "net::ERR_" in str(exc):
+        return TRANSIENT
+    return PERMANENT
+
+def backoff_delay(attempt: int, kind: str = TRANSIENT) -> float:
+    """
+    재시도 대기 시간 (full jitter: 0 ~ min(최대, 기본 x 2^(attempt-1)) 사이 임의 값)
+    """
+    base = RETRY_BASE_DELAY * (THROTTLED_DELAY_FACTOR if kind == THROTTLED else 1)
+    return random.uniform(0, min(RETRY_MAX_DELAY, base * 2 ** (attempt - 1)))
+
+class CircuitBreaker:
+    """
+    사이트 하나의 회로 차단기
+    - closed: 정상 호출
+    - open: 호출 차단 (cooldown이 지나면 half_open으로 전환하고 시험 요청 1건 허용)
+    - half_open: 시험 요청 결과가 성공이면 closed, 실패면 다시 open
+    """
+    def __init__(self, site: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, cooldown: float = CIRCUIT_COOLDOWN):
+        self.site = site
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self._changed_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        호출 허용 여부 (half_open 전환 시 호출한 쪽이 시험 요청을 담당)
+        """
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if time.monotonic() - self._changed_at < self.cooldown:
+                return False
+            # open → half_open (또는 결과가 보고되지 않은 시험 요청을 다시 허용)
+            self.state = "half_open"
+            self._changed_at = time.monotonic()
+            print(f"🔁 [{self.site}] 회로 차단 시간 경과, 시험 요청 1건 허용")
+            return True
+
+    def is_open(self) -> bool:
+        """
+        차단 중 여부 (상태를 바꾸지 않음, cooldown이 지났으면 False)
+        """
+        with self._lock:
+            return self.state != "closed" and time.monotonic() - self._changed_at < self.cooldown
+
+    def remaining(self) -> float:
+        with self._lock:
+            return max(0.0, self.cooldown - (time.monotonic() - self._changed_at))
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != "closed":
+                print(f"✅ [{self.site}] 회로 복구")
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    print(f"⛔ [{self.site}] 연속 실패 {self.failures}회, {self.cooldown:.0f}초 동안 호출 차단")
+                self.state = "open"
+                self._changed_at = time.monotonic()
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(site: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(site)
+        if breaker is None:
+            breaker = _breakers[site] = CircuitBreaker(site)
+        return breaker
+
+def is_circuit_open(site: str) -> bool:
+    return get_breaker(site).is_open()
+
+def check_circuit(site: str) -> None:
+    """
+    사이트 호출 전 회로 상태 확인
+
+    Raises:
+        CircuitOpenError: 차단 중인 경우
+    """
+    breaker = get_breaker(site)
+    if not breaker.allow():
+        raise CircuitOpenError(f"[{site}] 회로 차단 중 (남은 시간 {breaker.remaining():.0f}초)")
+
+def report_success(site: str) -> None:
+    get_breaker(site).record_success()
+
+def report_failure(site: str, exc: Exception) -> str:
+    """
+    오류를 회로 차단기에 보고 (일시적 오류/속도 제한만 실패로 집계)
+
+    Returns:
+        str: 오류 분류
+    """
+    kind = classify_error(exc)
+    if kind != PERMANENT and not isinstance(exc, CircuitOpenError):
+        get_breaker(site).record_failure()
+    return kind
+
+def retry_call(func, *args, site: str = None, attempts: int = RETRY_ATTEMPTS, **kwargs):
+    """
+    func(*args, **kwargs)를 호출하고, 일시적 오류/속도 제한이면 backoff 후 재시도
+    site가 주어지면 호출 전 회로 상태를 확인하고 최종 결과를 회로 차단기에 보고
+
+    Raises:
+        CircuitOpenError: 사이트 회로가 차단된 경우 (func를 호출하지 않음)
+        Exception: 영구적 오류이거나 재시도 횟수를 모두 사용한 경우 마지막 오류
+    """
+    if site:
+        check_circuit(site)
+
+    attempts = max(1, attempts)
+    for attempt in range(1, attempts + 1):
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            kind = classify_error(e)
+            if kind == PERMANENT:
+                if site:
+                    report_success(site) # 사이트는 응답했으므로 장애로 보지 않음
+                raise
+            if attempt == attempts or (site and is_circuit_open(site)):
+                if site:
+                    get_breaker(site).record_failure()
+                raise
+            delay = backoff_delay(attempt, kind)
+            print(f"🔁 [{site or getattr(func, '__name__', 'call')}] {kind} 오류, {delay:.1f}초 후 재시도 ({attempt}/{attempts - 1}): {e}")
+            time.sleep(delay)
+        else:
+            if site:
+                report_success(site)
+            return result
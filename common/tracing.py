@@ -0,0 +1,219 @@
+"""
+파이프라인 단계별 소요 시간 기록 (경량 tracing)
+- start_trace()로 기업 하나의 trace를 시작하고, span()/traced()로 단계별 구간을 기록
+- trace가 시작되지 않은 상태에서는 span()이 아무것도 기록하지 않음 (단독 실행 시 오버헤드 없음)
+- 스레드 풀에서 실행되는 작업은 bind_trace()로 감싸야 같은 trace에 기록됨
+- dump_trace()로 기업별 JSON 파일 저장, profile_run()으로 실행 단위 cProfile/tracemalloc 프로파일 저장
+"""
+import contextvars
+import cProfile
+import functools
+import json
+import os
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from config.setting import TRACE_DIR, PROFILE_MODE, PROFILE_DIR
+
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+class Trace:
+    """
+    기업 하나에 대한 span 기록 모음 (여러 스레드에서 동시에 기록 가능)
+    """
+    def __init__(self, company_name: str):
+        self.company_name = company_name
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def add_span(self, record: dict) -> None:
+        with self._lock:
+            self.spans.append(record)
+
+    def offset_ms(self, perf_time: float) -> float:
+        return (perf_time - self._started) * 1000
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda record: record["start_ms"])
+        return {
+            "company_name": self.company_name,
+            "started_at": self.started_at,
+            "total_ms": round(self.offset_ms(time.perf_counter()), 3),
+            "spans": spans,
+        }
+
+def current_trace():
+    return _current_trace.get()
+
+@contextmanager
+def start_trace(company_name: str):
+    """
+    기업 하나의 trace 시작
+
+    Example:
+        with start_trace(company_name) as trace:
+            ...
+        dump_trace(trace)
+    """
+    trace = Trace(company_name)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+@contextmanager
+def use_trace(trace: Trace):
+    """
+    이미 만들어 둔 trace를 현재 스레드에서 이어서 기록
+    (여러 스레드를 거쳐 처리되는 기업 하나의 단계들을 같은 trace에 기록할 때 사용)
+    """
+    token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(token)
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    구간 하나의 소요 시간 기록 (현재 trace가 없으면 기록하지 않음)
+
+    Args:
+        name (str): 구간 이름 (예: "jobkorea.search", "ooai.search_api")
+        attrs: 함께 기록할 속성 (예: site="saramin", mode="http")
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+
+    parent = _current_span.get()
+    token = _current_span.set(name)
+    started = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        ended = time.perf_counter()
+        _current_span.reset(token)
+        record = {
+            "name": name,
+            "parent": parent,
+            "thread": threading.current_thread().name,
+            "start_ms": round(trace.offset_ms(started), 3),
+            "duration_ms": round((ended - started) * 1000, 3),
+        }
+        if attrs:
+            record["attrs"] = attrs
+        if error:
+            record["error"] = error
+        trace.add_span(record)
+
+def traced(name: str):
+    """
+    함수 전체를 span으로 기록하는 데코레이터
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def bind_trace(func):
+    """
+    현재 trace/span을 다른 스레드에서도 이어서 기록하도록 함수를 감쌈
+    (ThreadPoolExecutor.submit/map에 넘기는 함수에 사용)
+    """
+    trace = _current_trace.get()
+    parent = _current_span.get()
+    if trace is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(parent)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+    return wrapper
+
+def _safe_file_name(name: str) -> str:
+    return re.sub(r'[^\w\-]+', '_', name).strip('_')[:60] or "trace"
+
+def dump_trace(trace: Trace, directory: str = TRACE_DIR):
+    """
+    trace를 기업별 JSON 파일로 저장 ({directory}/{기업명}_{시각}.json)
+
+    Returns:
+        str: 저장한 파일 경로. directory가 비어 있으면 저장하지 않고 None.
+    """
+    if not directory or trace is None:
+        return None
+
+    os.makedirs(directory, exist_ok=True)
+    file_name = f"{_safe_file_name(trace.company_name)}_{time.strftime('%Y%m%d_%H%M%S', time.localtime(trace.started_at))}.json"
+    path = os.path.join(directory, file_name)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trace.to_dict(), f, ensure_ascii=False, indent=2)
+    return path
+
+@contextmanager
+def profile_run(run_name: str, mode: str = PROFILE_MODE, directory: str = PROFILE_DIR):
+    """
+    실행 단위 프로파일링 (PROFILE_MODE가 비어 있으면 아무것도 하지 않음)
+    - "cprofile": cProfile 결과를 {directory}/{run_name}_{시각}.prof 로 저장 (snakeviz, pstats 등으로 확인)
+    - "tracemalloc": 메모리 할당 상위 50개 위치를 {directory}/{run_name}_{시각}.tracemalloc.txt 로 저장
+    ※ cProfile은 호출한 스레드만 측정 (스레드 풀/워커 프로세스 내부는 trace의 span으로 확인)
+    """
+    if not mode:
+        yield
+        return
+
+    os.makedirs(directory, exist_ok=True)
+    base_path = os.path.join(directory, f"{_safe_file_name(run_name)}_{time.strftime('%Y%m%d_%H%M%S')}")
+
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(base_path + ".prof")
+            print(f"📊 cProfile 저장: {base_path}.prof")
+
+    elif mode == "tracemalloc":
+        tracemalloc.start(25)
+        try:
+            yield
+        finally:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            with open(base_path + ".tracemalloc.txt", "w", encoding="utf-8") as f:
+                f.write(f"peak: {peak / 1024 / 1024:.2f} MiB\n\n")
+                for stat in snapshot.statistics("lineno")[:50]:
+                    f.write(f"{stat}\n")
+            print(f"📊 tracemalloc 저장: {base_path}.tracemalloc.txt")
+
+    else:
+        print(f"⚠️ 알 수 없는 PROFILE_MODE: {mode} (cprofile, tracemalloc 중 선택)")
+        yield
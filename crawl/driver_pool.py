@@ -0,0 +1,290 @@
+"""
+잡코리아/사람인 크롤러가 공유하는 Chrome WebDriver 풀
+- 기업마다 브라우저를 새로 띄우지 않고, 사용이 끝난 드라이버를 초기화(쿠키/스토리지/창)한 뒤 재사용
+- 프로세스마다 독립된 풀을 가짐 (배치 워커 프로세스별로 warm 드라이버 유지)
+"""
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from multiprocessing import util
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+from common.tracing import span
+from config.setting import (
+    CHROME_DRIVER_PATH, USER_AGENT, DRIVER_POOL_SIZE, DRIVER_MAX_USES,
+    CHROME_LEAN_MODE, LEAN_EXTRA_BLOCKED_PATTERNS, LEAN_SITE_ALLOWLIST,
+)
+
+# lean 모드에서 차단할 리소스 (DOM 텍스트만 읽으므로 이미지/폰트/미디어는 불필요)
+LEAN_BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+]
+
+# lean 모드에서 차단할 광고/분석 등 제3자 스크립트
+LEAN_BLOCKED_THIRD_PARTY_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*googlesyndication.com*",
+    "*doubleclick.net*", "*googleadservices.com*", "*adservice.google.*",
+    "*facebook.net*", "*connect.facebook.*", "*criteo.*", "*kakaopixel*",
+    "*wcs.naver.net*", "*hotjar.com*", "*clarity.ms*", "*mobon.net*",
+    "*dable.io*", "*channel.io*", "*sentry.io*", "*newrelic.com*", "*nr-data.net*",
+]
+
+_idle_drivers = queue.LifoQueue() # 대기 중인 warm 드라이버 (가장 최근에 쓴 것부터 재사용)
+_all_drivers = set() # 이 프로세스에서 생성된 전체 드라이버 (종료 처리용)
+_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def get_chromedriver_path() -> str:
+    """
+    chromedriver 실행 파일 경로 반환
+    - .env의 CHROME_DRIVER_PATH가 있으면 그대로 사용
+    - 없으면 webdriver_manager로 설치/조회 (프로세스당 한 번만 수행)
+    """
+    return CHROME_DRIVER_PATH or ChromeDriverManager().install()
+
+def build_chrome_options() -> Options:
+    """
+    크롤러 공통 headless Chrome 옵션 생성
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--window-size=1920x1080")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--enable-unsafe-swiftshader")
+    chrome_options.add_argument("--log-level=3")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    return chrome_options
+
+def get_lean_blocked_patterns(site: str = None) -> list:
+    """
+    lean 모드에서 차단할 URL 패턴 목록
+    - 기본 리소스/제3자 스크립트 패턴 + LEAN_EXTRA_BLOCKED_PATTERNS
+    - 사이트별 허용 목록(LEAN_SITE_ALLOWLIST[site])에 있는 패턴은 제외 (필요한 리소스/XHR은 로딩되도록)
+    """
+    allowlist = set(LEAN_SITE_ALLOWLIST.get(site, [])) if site else set()
+    patterns = LEAN_BLOCKED_RESOURCE_PATTERNS + LEAN_BLOCKED_THIRD_PARTY_PATTERNS + LEAN_EXTRA_BLOCKED_PATTERNS
+    return [pattern for pattern in dict.fromkeys(patterns) if pattern not in allowlist]
+
+def apply_lean_profile(driver, site: str = None) -> None:
+    """
+    Chrome DevTools Protocol로 사이트별 차단 URL 패턴 적용 (CHROME_LEAN_MODE일 때만)
+    풀의 드라이버는 여러 사이트가 번갈아 사용하므로 빌려줄 때마다 다시 적용.
+    """
+    if not CHROME_LEAN_MODE:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": get_lean_blocked_patterns(site)})
+    except Exception as e:
+        print(f"⚠️ lean 모드 적용 실패 (전체 리소스 로딩으로 진행): {e}")
+
+def create_driver(site: str = None) -> webdriver.Chrome:
+    """
+    새 headless Chrome 드라이버 생성 (풀을 거치지 않음)
+
+    Args:
+        site (str, optional): 사용할 사이트명 ("jobkorea", "saramin"). lean 모드의 사이트별 허용 목록 적용에 사용.
+    """
+    driver = webdriver.Chrome(service=webdriver.ChromeService(get_chromedriver_path()), options=build_chrome_options())
+    apply_lean_profile(driver, site)
+    return driver
+
+def reset_driver(driver) -> None:
+    """
+    다음 기업 크롤링에 이전 상태가 남지 않도록 드라이버 초기화
+    - 추가로 열린 창/탭 닫기
+    - 현재 origin의 localStorage/sessionStorage 비우기
+    - 전체 도메인 쿠키 삭제 후 빈 페이지로 이동
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except Exception:
+        pass # about:blank 등 스토리지 접근이 불가능한 페이지
+
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.delete_all_cookies()
+    driver.get("about:blank")
+
+def _quit_driver(driver) -> None:
+    with _lock:
+        _all_drivers.discard(driver)
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+def _is_alive(driver) -> bool:
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+def apply_timeouts(driver, seconds: float) -> None:
+    """
+    페이지 로딩/스크립트 실행 제한 시간 설정 (한 번의 driver.get()이 크롤링 제한 시간을 넘겨 멈추지 않도록)
+    풀의 드라이버는 여러 사이트가 번갈아 사용하므로 빌려줄 때마다 다시 적용.
+    """
+    seconds = max(1.0, seconds)
+    try:
+        driver.set_page_load_timeout(seconds)
+        driver.set_script_timeout(seconds)
+    except Exception as e:
+        print(f"⚠️ 드라이버 제한 시간 설정 실패: {e}")
+
+def acquire_driver(site: str = None, timeout: float = None) -> webdriver.Chrome:
+    """
+    풀에서 warm 드라이버를 꺼내 반환. 사용 가능한 드라이버가 없으면 새로 생성.
+    사용이 끝나면 반드시 release_driver()로 반납해야 함.
+
+    Args:
+        site (str, optional): 사용할 사이트명. lean 모드에서 사이트별 차단 패턴 적용에 사용.
+        timeout (float, optional): 페이지 로딩/스크립트 실행 제한 시간(초)
+    """
+    driver = None
+    while True:
+        try:
+            candidate = _idle_drivers.get_nowait()
+        except queue.Empty:
+            break
+        if _is_alive(candidate):
+            apply_lean_profile(candidate, site)
+            driver = candidate
+            break
+        _quit_driver(candidate) # 죽은 드라이버(크래시 등)는 버리고 다음 것 확인
+
+    if driver is None:
+        with span("driver_pool.create_driver"):
+            driver = create_driver(site)
+        driver._pool_uses = 0
+        with _lock:
+            _all_drivers.add(driver)
+        print("✅ Chrome 드라이버 생성 (풀).")
+
+    if timeout is not None:
+        apply_timeouts(driver, timeout)
+    return driver
+
+def release_driver(driver, discard: bool = False) -> None:
+    """
+    사용한 드라이버를 초기화하여 풀에 반납
+    - discard=True 이거나 초기화에 실패하면 종료
+    - DRIVER_MAX_USES 회 이상 사용한 드라이버는 메모리 누적을 막기 위해 종료
+    - 풀이 DRIVER_POOL_SIZE 만큼 차 있으면 종료
+
+    Args:
+        driver (webdriver.Chrome): acquire_driver()로 받은 드라이버
+        discard (bool): True면 재사용하지 않고 바로 종료
+    """
+    if driver is None:
+        return
+
+    driver._pool_uses = getattr(driver, "_pool_uses", 0) + 1
+    if discard or driver._pool_uses >= DRIVER_MAX_USES or _idle_drivers.qsize() >= DRIVER_POOL_SIZE:
+        _quit_driver(driver)
+        return
+
+    try:
+        with span("driver_pool.reset_driver"):
+            reset_driver(driver)
+    except Exception as e:
+        print(f"⚠️ 드라이버 초기화 실패, 종료합니다: {e}")
+        _quit_driver(driver)
+        return
+
+    _idle_drivers.put(driver)
+
+def _overran(site: str, deadline: float) -> bool:
+    if deadline is None or time.monotonic() <= deadline:
+        return False
+    print(f"⚠️ [{site}] 크롤링 제한 시간을 넘겨 끝난 드라이버는 풀에 반납하지 않고 종료합니다.")
+    return True
+
+@contextmanager
+def borrowed_driver(site: str = None, timeout: float = None):
+    """
+    with 구문으로 드라이버를 빌려 쓰고 자동 반납하는 컨텍스트 매니저
+    - 블록 안에서 예외가 발생하면 드라이버 상태를 신뢰할 수 없으므로 종료
+    - timeout이 주어지면 페이지 로딩/스크립트 실행 제한 시간으로 적용하고,
+      블록이 timeout을 넘겨 끝나면 (호출한 쪽은 이미 포기한 크롤링) 드라이버를 반납하지 않고 종료
+
+    Example:
+        with borrowed_driver("jobkorea", timeout=120) as driver:
+            data = smart_crawl_jobkorea(company_name, driver=driver)
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    with span("driver_pool.acquire"):
+        driver = acquire_driver(site, timeout)
+    try:
+        yield driver
+    except BaseException:
+        release_driver(driver, discard=True)
+        raise
+    else:
+        release_driver(driver, discard=_overran(site, deadline))
+
+@contextmanager
+def lazy_borrowed_driver(site: str = None, timeout: float = None):
+    """
+    드라이버가 실제로 필요할 때만 풀에서 빌리는 컨텍스트 매니저
+    - 블록에는 드라이버 대신 드라이버를 반환하는 함수를 넘김 (처음 호출할 때 acquire_driver)
+    - 한 번도 호출하지 않으면 드라이버를 빌리지 않음 (HTTP로 끝나는 크롤링에서 Chrome을 점유하지 않도록)
+    - 반납 규칙과 timeout은 borrowed_driver와 동일 (제한 시간은 블록 시작 시점부터 계산)
+
+    Example:
+        with lazy_borrowed_driver("saramin") as get_driver:
+            data = crawl_from_saramin(company_name, driver_factory=get_driver)
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    borrowed = []
+
+    def get_driver():
+        if not borrowed:
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            with span("driver_pool.acquire"):
+                borrowed.append(acquire_driver(site, remaining))
+        return borrowed[0]
+
+    try:
+        yield get_driver
+    except BaseException:
+        if borrowed:
+            release_driver(borrowed[0], discard=True)
+        raise
+    else:
+        if borrowed:
+            release_driver(borrowed[0], discard=_overran(site, deadline))
+
+def close_all_drivers() -> None:
+    """
+    이 프로세스에서 생성한 모든 풀 드라이버 종료 (프로세스 종료 시 자동 호출)
+    """
+    while True:
+        try:
+            _idle_drivers.get_nowait()
+        except queue.Empty:
+            break
+    with _lock:
+        drivers = list(_all_drivers)
+    for driver in drivers:
+        _quit_driver(driver)
+
+# 메인 프로세스 종료 시와 multiprocessing 워커 프로세스 종료 시 모두 호출되도록 등록
+# (fork된 워커는 atexit 핸들러를 실행하지 않음)
+util.Finalize(None, close_all_drivers, exitpriority=10)
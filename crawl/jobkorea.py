@@ -1,73 +1,92 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
-from copy import deepcopy
-from common.common_field_template import basic_template
-from config.setting import USER_AGENT
+from urllib.parse import urlparse
+from cache.resolution_cache import get_cached_url, save_resolved_url, invalidate_resolved_url, register_key_normalizer
+from common.capture import capture
+from common.rate_limiter import rate_limited_get, wait_for_slot
+from common.resilience import CircuitOpenError, retry_call
+from common.common_field_template import new_company_data
+from common.tracing import span, traced
+from crawl.driver_pool import create_driver
 import json, time
-from webdriver_manager.chrome import ChromeDriverManager
 
 # 공통 유틸 함수
-def get_info(driver, label: str) -> str:
+def element_text(element) -> str:
     """
-    기업정보 테이블에서 label에 해당하는 값을 추출
+    BeautifulSoup 요소의 텍스트를 공백 하나로 정리하여 반환 (WebDriver의 element.text와 유사하게)
+    """
+    return " ".join(element.get_text().split())
+
+def build_label_index(soup) -> dict:
+    """
+    기업정보 테이블 전체를 한 번만 순회하여 label → value 인덱스 생성
+    ex: {"설립일": "2013.02.05", "대표자": "홍길동", ...}
+    - 문서 순서를 유지하며, 같은 label이 여러 번 나오면 첫 번째 값 사용
+    """
+    index = {}
+    for row in soup.select("table.table-basic-infomation-primary tr.field"):
+        ths = row.select("th.field-label")
+        tds = row.select("td.field-value")
+        for i, th in enumerate(ths):
+            if i >= len(tds):
+                continue
+            value = tds[i].select_one(".value")
+            index.setdefault(element_text(th), element_text(value) if value else "")
+    return index
+
+def get_info(label_index: dict, label: str) -> str:
+    """
+    label 인덱스에서 label을 포함하는 항목의 값을 반환
     ex: 설립일, 대표자, 산업 등
     """
-    try:
-        rows = driver.find_elements(By.CSS_SELECTOR, "table.table-basic-infomation-primary tr.field")
-        for row in rows:
-            ths = row.find_elements(By.CSS_SELECTOR, "th.field-label")
-            tds = row.find_elements(By.CSS_SELECTOR, "td.field-value")
-            for i, th in enumerate(ths):
-                if label in th.text and i < len(tds):
-                    return tds[i].find_element(By.CSS_SELECTOR, ".value").text.strip()       
-    except:
-        pass
+    for th_text, value in label_index.items():
+        if label in th_text:
+            return value
     return ""
 
-def get_employee_history(driver) -> str:
+def get_employee_history(soup) -> str:
     """ 
     고용현황 차트에서 연도별 직원 수 데이터를 추출하여 JSON 문자열로 반환
     """
-    try:
-        chart = driver.find_element(By.CSS_SELECTOR, "div.chart-bar-number-of-employees")
-        bars = chart.find_elements(By.CSS_SELECTOR, "div.bar")
-
-        history = {}
-        for bar in bars:
-            year = bar.find_element(By.CSS_SELECTOR, "div.label").text.strip()
-            value = bar.find_element(By.CSS_SELECTOR, "div.value").text.strip()
-            history[year] = value
+    chart = soup.select_one("div.chart-bar-number-of-employees")
+    if not chart:
+        return ""
 
-        return json.dumps(history, ensure_ascii=False)
+    history = {}
+    for bar in chart.select("div.bar"):
+        year = bar.select_one("div.label")
+        value = bar.select_one("div.value")
+        if not year or not value:
+            return ""
+        history[element_text(year)] = element_text(value)
 
-    except:
-        pass
-    return ""
+    return json.dumps(history, ensure_ascii=False)
 
-def get_company_introduction(driver) -> str:
+def get_company_introduction(soup) -> str:
     """ 
     근무환경 영역의 기업소개 란의 내용을 한 줄 텍스트로 추출
     """
-    try:
-        container = driver.find_element(By.CSS_SELECTOR, "div.working-environment-introduce div.introduce-body")
-        html = container.get_attribute("innerHTML")
-
-        # 태그 및 줄자꿈 제거
-        soup = BeautifulSoup(html, "html.parser")
-        text = soup.get_text(separator=" ", strip=True) # 줄 바꿈을 공백으로 처리
-        return text
-    except:
+    container = soup.select_one("div.working-environment-introduce div.introduce-body")
+    if not container:
         return ""
+    # 태그 및 줄바꿈 제거
+    return container.get_text(separator=" ", strip=True) # 줄 바꿈을 공백으로 처리
 
-def get_financial_history(driver) -> dict:
-    """ 
-    팝업으로 띄워지는 전체 재무현황 테이블에서 연도별 재무 데이터 추출
-    추출 데이터 : "자산 합계", "자본금", "자본금 합계", "매출 액", "영업 이익", "당기순이익"
+@traced("jobkorea.financial_popup")
+def open_financial_popup(driver) -> bool:
+    """
+    "재무현황 전체보기" 버튼이 있으면 클릭하여 전체 재무현황 팝업을 띄움
+
+    Returns:
+        bool: 버튼 존재 여부 (True면 팝업 테이블에서, False면 그래프에서 재무 정보를 수집)
     """
+    popup_button = driver.find_elements(By.CSS_SELECTOR, "a.button-view-financial-status")
+    if not popup_button:
+        return False
+
     try:
         # 재무현황 전체보기 버튼 클릭
         view_more_btn = WebDriverWait(driver, 10).until(
@@ -75,37 +94,42 @@ def get_financial_history(driver) -> dict:
         )
         driver.execute_script("arguments[0].click();", view_more_btn)
         time.sleep(1)  # 팝업 뜰 때까지 잠깐 대기
+    except Exception as e:
+        print(f"⚠️ 재무현황 전체보기 팝업 열기 실패: {e}")
+    return True
 
-        # 팝업 테이블 로딩 대기
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        table = soup.select_one("table.table-financial-statements")
-        if not table:
-            return {}
-
-        # 연도 추출
-        year_ths = table.select("thead tr th")[1:]
-        years = [th.text.strip()[:4] for th in year_ths if th.text.strip()[:4].isdigit()]
-
-        # 추출 필드
-        fields = ["자산 합계", "자본금", "자본금 합계", "매출 액", "영업 이익", "당기순이익"]
-        data_by_year = {year : {} for year in years}
+def get_financial_history(soup) -> dict:
+    """ 
+    팝업으로 띄워지는 전체 재무현황 테이블에서 연도별 재무 데이터 추출
+    추출 데이터 : "자산 합계", "자본금", "자본금 합계", "매출 액", "영업 이익", "당기순이익"
+    """
+    table = soup.select_one("table.table-financial-statements")
+    if not table:
+        return {}
 
-        # 데이터 추출
-        for row in table.select("tbody tr"):
-            cells = row.select("td")
-            if not cells:
-                continue
-            category = cells[0].text.strip()
-            if category not in fields:
-                continue
-            for i, year in enumerate(years):
+    # 연도 추출
+    year_ths = table.select("thead tr th")[1:]
+    years = [th.text.strip()[:4] for th in year_ths if th.text.strip()[:4].isdigit()]
+
+    # 추출 필드
+    fields = ["자산 합계", "자본금", "자본금 합계", "매출 액", "영업 이익", "당기순이익"]
+    data_by_year = {year : {} for year in years}
+
+    # 데이터 추출
+    for row in table.select("tbody tr"):
+        cells = row.select("td")
+        if not cells:
+            continue
+        category = cells[0].text.strip()
+        if category not in fields:
+            continue
+        for i, year in enumerate(years):
+            if i + 1 < len(cells):
                 data_by_year[year][category.replace(" ", "")] = cells[i + 1].text.strip()
 
-        return data_by_year
-    except:
-        return ""
+    return data_by_year
 
-def get_financial_graph(driver) -> dict:
+def get_financial_graph(soup) -> dict:
     """
     재무분석 카드에 있는 막대 그래프 형태의 재무 데이터를 연도별로 정리함 
     - 필드명을 정해진 형식으로 변경
@@ -118,62 +142,43 @@ def get_financial_graph(driver) -> dict:
     }
     financial_data = {}
 
-    cards = driver.find_elements(By.CSS_SELECTOR, ".financial-analysis-card")
-    for card in cards:
-        try:
-            title = card.find_element(By.CSS_SELECTOR, "h3.header").text.strip()
-            if title not in field_mappings:
-                continue  # 매핑에 없는 필드는 건너뜀
+    for card in soup.select(".financial-analysis-card"):
+        header = card.select_one("h3.header")
+        if not header:
+            continue
+        title = element_text(header)
+        if title not in field_mappings:
+            continue  # 매핑에 없는 필드는 건너뜀
 
-            mapped_key = field_mappings[title]  # 저장할 필드명
+        mapped_key = field_mappings[title]  # 저장할 필드명
 
-            bars = card.find_elements(By.CSS_SELECTOR, ".chart-bar-wrap .bar")
-            for bar in bars:
-                year = bar.find_element(By.CSS_SELECTOR, ".label").text.strip()
-                value = bar.find_element(By.CSS_SELECTOR, ".value").text.strip()
-                financial_data.setdefault(year, {})[mapped_key] = value
-        except:
-            continue  # 일부 카드에 차트가 없을 수도 있음
+        for bar in card.select(".chart-bar-wrap .bar"):
+            year = bar.select_one(".label")
+            value = bar.select_one(".value")
+            if not year or not value:
+                break  # 일부 카드에 차트가 없을 수도 있음
+            financial_data.setdefault(element_text(year), {})[mapped_key] = element_text(value)
 
     return financial_data
 
-def get_financial_info(driver) -> dict:
-    """
-    재무 정보 수집 함수
-    - 전체보기 버튼 존재 여부에 따라 두 방식 중 하나 선택 
-    """
-    try:
-        # "재무현황 전체보기" 버튼 존재 여부 확인
-        popup_button = driver.find_elements(By.CSS_SELECTOR, "a.button-view-financial-status")
-
-        if popup_button:
-            # 버튼 클릭 후 팝업창 정보 수집
-            return get_financial_history(driver)
-        else:
-            # 버튼이 없을 경우, 그래프 정보 수집
-            return get_financial_graph(driver)
-    
-    except:
-        return {}
-
-def parse_company_info(driver) -> dict:
+@traced("jobkorea.parse_html")
+def parse_company_info_from_html(html: str, financial_popup: bool = False) -> dict:
     """
-    JobKorea 기업 상세 페이지를 분석하여 구조화된 회사 정보를 반환하는 함수
+    JobKorea 기업 상세 페이지 HTML 스냅샷 한 장에서 구조화된 회사 정보를 추출
+    (WebDriver 호출 없이 BeautifulSoup 파싱 한 번 + label 인덱스 한 번 생성으로 모든 필드 처리)
 
-    - WebDriver를 통해 렌더링된 페이지에서 주요 정보를 수집
-    - 회사명, 회사유형, 설립연도, 산업군, 대표자 등 기본 정보 추출
-    - 최근 재무 정보(매출, 영업이익, 순이익, 회계연도)와 히스토리 포함
-    - 결과는 기본 템플릿(basic_template)에 맞춰 딕셔너리 형태로 반환
+    Args:
+        html (str): 기업 상세 페이지의 page_source
+        financial_popup (bool): 재무현황 전체보기 팝업이 열린 상태의 스냅샷인지 여부
 
     Returns:
-        dict: 구조화된 회사 정보 딕셔너리
+        dict: 기본 템플릿(basic_template) 구조의 회사 정보 딕셔너리
     """
-    WebDriverWait(driver, 10).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "div.company-body-infomation"))
-    )
+    soup = BeautifulSoup(html, "html.parser")
+    label_index = build_label_index(soup)
 
     # 기업명 추출 및 회사 유형 추론
-    name = driver.find_element(By.CSS_SELECTOR, "#corpHistName").get_attribute("value").strip()
+    name = soup.select_one("#corpHistName").get("value", "").strip()
     if any(keyword in name for keyword in ["주식회사", "(주)", "㈜"]):
         company_type = "주식회사"
         is_listed = True
@@ -184,28 +189,28 @@ def parse_company_info(driver) -> dict:
         company_type = ""
         is_listed = False
 
-    # 재무 관련 필드
-    financial_history = get_financial_info(driver)
+    # 재무 관련 필드 (전체보기 팝업이 있으면 팝업 테이블, 없으면 그래프)
+    financial_history = get_financial_history(soup) if financial_popup else get_financial_graph(soup)
     latest_year = max(financial_history.keys(), default="")
     latest_revenue = financial_history.get(latest_year, {}).get("매출액", "")
     latest_operating_income = financial_history.get(latest_year, {}).get("영업이익", "")
     latest_net_income = financial_history.get(latest_year, {}).get("당기순이익", "")
 
-    company_data = deepcopy(basic_template)
+    company_data = new_company_data()
 
     company_data.update({
         "name": name, # 회사명
-        "established_year": get_info(driver, "설립일")[:4], # 설립 연도
+        "established_year": get_info(label_index, "설립일")[:4], # 설립 연도
         "company_type": company_type, # 회사 유형 (주식회사, 유한회사 등)
         "is_listed": is_listed, # 상장 여부
-        "homepage": get_info(driver, "홈페이지"), # 회사 홈페이지 URL
-        "description": get_company_introduction(driver), # 회사 설명
-        "address": get_info(driver, "주소"), # 회사 주소
-        "industry": get_info(driver, "산업"), # 산업 분야 정보
-        "products_services": get_info(driver, "주요사업"), # 제품/서비스 이름 배열
-        "key_executive": get_info(driver, "대표자"), # 주요 경영진(대표자) 이름
-        "employee_count": get_info(driver, "사원수"), # 현재 직원 수
-        "employee_history": get_employee_history(driver), # 과거 직원 수 추이
+        "homepage": get_info(label_index, "홈페이지"), # 회사 홈페이지 URL
+        "description": get_company_introduction(soup), # 회사 설명
+        "address": get_info(label_index, "주소"), # 회사 주소
+        "industry": get_info(label_index, "산업"), # 산업 분야 정보
+        "products_services": get_info(label_index, "주요사업"), # 제품/서비스 이름 배열
+        "key_executive": get_info(label_index, "대표자"), # 주요 경영진(대표자) 이름
+        "employee_count": get_info(label_index, "사원수"), # 현재 직원 수
+        "employee_history": get_employee_history(soup), # 과거 직원 수 추이
         "latest_revenue": latest_revenue, # 최근 매출액 (원)
         "latest_operating_income": latest_operating_income, # 최근 영업이익 (원)
         "latest_net_income": latest_net_income, # 최근 순이익 (원)
@@ -215,102 +220,187 @@ def parse_company_info(driver) -> dict:
     
     return company_data
 
-
-def smart_crawl_jobkorea(company_name: str) -> dict:
+def parse_company_info(driver, capture_key: str = None) -> dict:
     """
-    JobKorea에서 특정 기업의 상세 페이지를 찾고,
-    해당 페이지에서 기업 정보를 크롤링하여 구조화된 데이터 형태로 반환하는 메인 함수
+    JobKorea 기업 상세 페이지를 분석하여 구조화된 회사 정보를 반환하는 함수
 
-    Args:
-        company_name (str): 검색할 기업명
+    - 페이지 로딩 대기 후, 재무현황 전체보기 팝업이 있으면 먼저 열어둠
+    - 이후 page_source 스냅샷 한 장으로 모든 필드를 추출 (parse_company_info_from_html)
+    - 회사명, 회사유형, 설립연도, 산업군, 대표자 등 기본 정보 추출
+    - 최근 재무 정보(매출, 영업이익, 순이익, 회계연도)와 히스토리 포함
+    - 결과는 기본 템플릿(basic_template)에 맞춰 딕셔너리 형태로 반환
+    - capture 모드면 스냅샷 HTML을 저장 (capture_key: 파일 식별자, 보통 기업명)
 
     Returns:
-        dict: 기본 템플릿 구조를 따르는 기업 정보 딕셔너리 (정보가 없으면 ""으로 채워짐)
+        dict: 구조화된 회사 정보 딕셔너리
     """
-    
-    print(f"=== '{company_name}' 기업 정보 수집 시작 ===")
+    with span("jobkorea.wait_detail"):
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.company-body-infomation"))
+        )
 
-    chrome_options = Options()
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--window-size=1920x1080")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--enable-unsafe-swiftshader")
-    chrome_options.add_argument("--log-level=3")
-    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    financial_popup = open_financial_popup(driver)
 
-    driver = webdriver.Chrome(service=webdriver.ChromeService(ChromeDriverManager().install()), options=chrome_options)
+    html = driver.page_source
+    capture("jobkorea", "detail_popup" if financial_popup else "detail", capture_key or driver.current_url, html)
 
-    # 회사명 비교를 위한 정규화 함수
-    def normalize(text: str) -> str:
-        return ''.join(filter(str.isalnum, text)).lower()
+    return parse_company_info_from_html(html, financial_popup=financial_popup)
 
-    try:
-        # 기업 검색
-        search_url = f"https://www.jobkorea.co.kr/Search?stext={company_name}"
-        driver.get(search_url)
 
-        # '기업정보' 탭 클릭
-        corp_tab = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.XPATH, "//button[.//span[text()='기업정보']]"))
+@traced("jobkorea.open_cached_detail")
+def open_cached_detail_page(driver, detail_url: str) -> bool:
+    """
+    캐시된 기업 상세 페이지로 바로 이동하고, 유효한 기업정보 페이지인지 확인
+
+    Returns:
+        bool: 기업정보 영역이 로딩되고 다른 주소로 리다이렉트되지 않았으면 True (404/리다이렉트 시 False)
+    """
+    rate_limited_get(driver, detail_url)
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.company-body-infomation"))
         )
-        corp_tab.click()
-        time.sleep(2)  # 렌더링 대기
+    except TimeoutException:
+        return False
+    return urlparse(driver.current_url).path == urlparse(detail_url).path
+
+# 회사명 비교를 위한 정규화 함수
+def normalize_company_name(text: str) -> str:
+    return ''.join(filter(str.isalnum, text)).lower()
+
+# URL 캐시 키도 검색 결과 비교와 같은 기준으로 정규화
+register_key_normalizer("jobkorea", normalize_company_name)
+
+@traced("jobkorea.search")
+def search_company_url(driver, company_name: str) -> tuple:
+    """
+    JobKorea 검색 결과 '기업정보' 탭에서 기업명이 정확히 일치하는 기업의 상세 페이지 링크를 찾음 (최대 5페이지)
+
+    Returns:
+        tuple: (info_url, matched_name). 찾지 못하면 ("", "")
+    """
+    search_url = f"https://www.jobkorea.co.kr/Search?stext={company_name}"
+    rate_limited_get(driver, search_url)
+
+    # '기업정보' 탭 클릭
+    corp_tab = WebDriverWait(driver, 10).until(
+        EC.element_to_be_clickable((By.XPATH, "//button[.//span[text()='기업정보']]"))
+    )
+    corp_tab.click()
+    time.sleep(2)  # 렌더링 대기
 
-        normalized_target = normalize(company_name)
-        info_url = ""
+    normalized_target = normalize_company_name(company_name)
+    info_url = ""
+    matched_name = ""
 
-        # 1~5페이지까지 탐색
-        for page in range(1, 6):
-            # 기업 리스트 대기
+    # 1~5페이지까지 탐색
+    for page in range(1, 6):
+        # 기업 리스트 대기 (목록이 나타나지 않으면 검색 결과 없음으로 처리: 재시도/회로 차단 실패로 집계하지 않음)
+        try:
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.XPATH, "//div[@data-sentry-element='Tabs.Content' and contains(@id, '-content-corp')]//a[@data-sentry-element='BaseLink']"))
             )
+        except TimeoutException:
+            if page == 1:
+                print(f"❌ '{company_name}' 기업정보 검색 결과가 없습니다.")
+            break
+
+        # 기업 리스트 중 이름이 정확히 일치하는 항목 클릭
+        company_elements = driver.find_elements(By.XPATH, "//div[@data-sentry-element='Tabs.Content' and contains(@id, '-content-corp')]//a[@data-sentry-element='BaseLink']")
+        for a in company_elements:
+            name = a.text.strip()
+            if not name:
+                # 빈 항목은 출력도, 비교도 하지 않음
+                continue
+
+            print(f"검색된 회사명: {name}")
 
-            # 기업 리스트 중 이름이 정확히 일치하는 항목 클릭
-            company_elements = driver.find_elements(By.XPATH, "//div[@data-sentry-element='Tabs.Content' and contains(@id, '-content-corp')]//a[@data-sentry-element='BaseLink']")
-            for a in company_elements:
-                name = a.text.strip()
-                if not name:
-                    # 빈 항목은 출력도, 비교도 하지 않음
-                    continue
-
-                print(f"검색된 회사명: {name}")
-
-                if normalize(name) == normalized_target:
-                    info_url = a.get_attribute("href")
-                    break
-            
-            # 찾으면 종료
-            if info_url:
+            if normalize_company_name(name) == normalized_target:
+                info_url = a.get_attribute("href")
+                matched_name = name
                 break
-            
-            # 다음 페이지로 이동
-            if page < 5:
-                try:
-                    next_page_xpath = f"//a[@data-sentry-element='NextLink' and contains(@href, 'Page_No={page + 1}') and contains(@href, 'tabType=corp')]"
-                    next_page_button = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, next_page_xpath))
-                    )
-                    next_page_button.click()
-                    time.sleep(2)
-                except Exception as e:
-                    print(f"{page+1}페이지 이동 실패:", e)
-                    break
-
-        if not info_url:
-            print(f"'{company_name}'과 일치하는 기업을 찾을 수 없습니다.")
-            return deepcopy(basic_template) # 실패 시 리턴할 기본 템플릿
-
-        print("▶ 기업정보 링크:", info_url)
-        driver.get(info_url)
-
-        return parse_company_info(driver)
+        
+        # 찾으면 종료
+        if info_url:
+            break
+        
+        # 다음 페이지로 이동
+        if page < 5:
+            try:
+                next_page_xpath = f"//a[@data-sentry-element='NextLink' and contains(@href, 'Page_No={page + 1}') and contains(@href, 'tabType=corp')]"
+                next_page_button = WebDriverWait(driver, 5).until(
+                    EC.element_to_be_clickable((By.XPATH, next_page_xpath))
+                )
+                wait_for_slot(search_url) # 페이지 이동도 요청 속도 제한 적용
+                next_page_button.click()
+                time.sleep(2)
+            except Exception as e:
+                print(f"{page+1}페이지 이동 실패:", e)
+                break
+
+    return info_url, matched_name
+
+def crawl_company_page(driver, company_name: str) -> dict:
+    """
+    상세 페이지 URL 확인(캐시 또는 검색) 후 기업 정보 파싱 (오류는 호출한 쪽으로 전달)
+    """
+    # 캐시된 상세 페이지 URL이 있으면 검색 단계 생략
+    cached = get_cached_url("jobkorea", company_name)
+    if cached:
+        print("💾 캐시된 기업정보 링크:", cached["detail_url"])
+        if open_cached_detail_page(driver, cached["detail_url"]):
+            return parse_company_info(driver, capture_key=company_name)
+        print("⚠️ 캐시된 링크가 유효하지 않아 다시 검색합니다.")
+        invalidate_resolved_url("jobkorea", company_name)
+
+    # 기업 검색
+    info_url, matched_name = search_company_url(driver, company_name)
+
+    if not info_url:
+        print(f"'{company_name}'과 일치하는 기업을 찾을 수 없습니다.")
+        return new_company_data() # 실패 시 리턴할 기본 템플릿
+
+    print("▶ 기업정보 링크:", info_url)
+    save_resolved_url("jobkorea", company_name, info_url, matched_name)
+    with span("jobkorea.open_detail"):
+        rate_limited_get(driver, info_url)
+
+    return parse_company_info(driver, capture_key=company_name)
+
+@traced("jobkorea.crawl")
+def smart_crawl_jobkorea(company_name: str, driver=None) -> dict:
+    """
+    JobKorea에서 특정 기업의 상세 페이지를 찾고,
+    해당 페이지에서 기업 정보를 크롤링하여 구조화된 데이터 형태로 반환하는 메인 함수
+    - 타임아웃 등 일시적 오류는 backoff 후 재시도, 잡코리아 회로가 차단된 상태면 바로 기본 템플릿 반환
+
+    Args:
+        company_name (str): 검색할 기업명
+        driver (webdriver.Chrome, optional): 외부에서 주입한 드라이버 (예: 드라이버 풀).
+                                             주입된 드라이버는 종료하지 않으며, 없으면 새로 생성 후 종료.
+
+    Returns:
+        dict: 기본 템플릿 구조를 따르는 기업 정보 딕셔너리 (정보가 없으면 ""으로 채워짐)
+    """
+    
+    print(f"=== '{company_name}' 기업 정보 수집 시작 ===")
+
+    owns_driver = driver is None
+    if owns_driver:
+        with span("jobkorea.driver_start"):
+            driver = create_driver("jobkorea")
+
+    try:
+        return retry_call(crawl_company_page, driver, company_name, site="jobkorea")
+
+    except CircuitOpenError as e:
+        print(f"⛔ {e}: '{company_name}' 잡코리아 수집 생략")
+        return new_company_data()
 
     except Exception as e:
         print(f"[예외 발생] smart_crawl_jobkorea: {e}")
-        return deepcopy(basic_template) # 실패 시 리턴할 기본 템플릿
+        return new_company_data() # 실패 시 리턴할 기본 템플릿
 
     finally:
-        driver.quit()
\ No newline at end of file
+        if owns_driver:
+            driver.quit()
\ No newline at end of file
@@ -1,17 +1,194 @@
 import json
+import os
 import re
+import threading
 import urllib.parse
 import requests
-from config.setting import USER_AGENT 
-from common.ooai_extra_field import ooai_field
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from config.setting import (
+    USER_AGENT, OOAI_CONCURRENCY, OOAI_POOL_SIZE, OOAI_STREAMING, OOAI_COMBINED_QUERY, OOAI_CACHE_BYPASS, VERBOSE_OUTPUT,
+)
+from cache.ooai_answer_cache import get_cached_answer, save_answer, prompt_hash
+from common.capture import capture, is_capture_enabled
+from common.ooai_extra_field import ooai_field, combined_query, parse_combined_answer, EXTRA_PROMPT_GUIDE, COMBINED_PROMPT_GUIDE
+from common.rate_limiter import wait_for_slot
+from common.resilience import CircuitOpenError, RETRYABLE_STATUS, retry_call
+from common.tracing import span, traced, bind_trace
 
-def ooai_crawler(query: str) -> dict:
+class OoaiClient:
+    """
+    oo.ai 검색 클라이언트
+    - requests.Session의 커넥션 풀로 TCP/TLS 연결을 재사용
+    - CSRF 토큰을 한 번 받아 캐시하고, 검색 API가 토큰을 거부할 때만 다시 발급
+    - 여러 스레드에서 함께 사용 가능
+    """
+    BASE_URL = "https://oo.ai"
+    TOKEN_REJECTED_STATUS = (401, 403, 419) # 토큰 만료/불일치로 판단할 응답 코드
+
+    def __init__(self, pool_size: int = OOAI_POOL_SIZE):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self._token = None
+        self._token_lock = threading.Lock()
+
+    def get_token(self, query: str) -> str:
+        """
+        캐시된 CSRF 토큰 반환. 없으면 검색 페이지 HTML에서 추출하여 캐시.
+
+        Raises:
+            requests.exceptions.RequestException: 검색 페이지 접근 실패
+        """
+        with self._token_lock:
+            if self._token:
+                return self._token
+
+            url = f'{self.BASE_URL}/search?q={urllib.parse.quote(query)}'
+            wait_for_slot(url)
+            with span("ooai.csrf_token"):
+                response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+
+            # 정규표현식을 사용하여 token 값 추출
+            token_match = re.search(r'token:\s*"([^"]+)"', response.text)
+            if token_match:
+                self._token = token_match.group(1)
+                # 추출된 토큰을 출력
+                print({"json": {"csrf_token": self._token}})
+            return self._token
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        거부된 토큰을 캐시에서 제거 (다른 스레드가 이미 새로 발급받은 토큰은 유지)
+        """
+        with self._token_lock:
+            if self._token == token:
+                self._token = None
+
+    def post_search(self, query: str, token: str, stream: bool = False) -> requests.Response:
+        """
+        검색 API 호출 (SSE 응답). stream=True면 응답 본문을 미리 읽지 않음.
+        """
+        encoded_query = urllib.parse.quote(query)
+        search_url = f"{self.BASE_URL}/api/search?q={encoded_query}&lang=ko&tz=Asia/Seoul"
+        headers = {
+            "accept": "*/*",
+            "accept-language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+            "cookie": "_variant=stable; lang=ko",
+            "origin": self.BASE_URL,
+            "referer": f"{self.BASE_URL}/search?q={encoded_query}",
+            "user-agent": USER_AGENT,
+            "x-csrf-token": f"Bearer {token}"
+        }
+        wait_for_slot(search_url)
+        return self.session.post(search_url, headers=headers, timeout=20, stream=stream)
+
+    def _post_search_checked(self, query: str, token: str, stream: bool) -> requests.Response:
+        # 일시적 오류 응답은 예외로 바꿔 retry_call이 재시도하도록 함 (토큰 거부 응답은 search()에서 처리)
+        response = self.post_search(query, token, stream=stream)
+        if response.status_code in RETRYABLE_STATUS and response.status_code not in self.TOKEN_REJECTED_STATUS:
+            response.close()
+            response.raise_for_status()
+        return response
+
+    def search(self, query: str, stream: bool = OOAI_STREAMING) -> dict:
+        """
+        검색어로 oo.ai를 검색하고 SSE 응답을 파싱하여 반환 (반환 형식은 ooai_crawler와 동일)
+        토큰이 거부되면 한 번만 재발급 후 재시도.
+        일시적 오류(연결 오류, 타임아웃, 5xx, 429)는 backoff 후 재시도하고, oo.ai 회로가 차단된 상태면 바로 빈 결과 반환.
+        stream=True면 응답을 읽는 도중 최종 답변이 나오는 즉시 연결을 닫음.
+        (capture 모드에서는 전체 SSE 응답을 저장해야 하므로 스트리밍하지 않음)
+        """
+        stream = stream and not is_capture_enabled()
+        for attempt in range(2):
+            # 1. CSRF 토큰 (캐시 우선)
+            try:
+                token = retry_call(self.get_token, query, site="ooai")
+            except CircuitOpenError as e:
+                print(f"⛔ {e}: [{query}] 검색 생략")
+                return {}
+            except requests.exceptions.RequestException as e:
+                print(f"[{query}] 초기 페이지 접근 오류: {e}")
+                return {}
+
+            # 추출된 토큰이 없다면 에러 메시지 출력
+            if not token:
+                print(f"[{query}] CSRF 토큰을 찾을 수 없습니다.")
+                return {}
+
+            # 2. 검색 API 호출
+            try:
+                with span("ooai.search_api", stream=stream):
+                    response = retry_call(self._post_search_checked, query, token, stream, site="ooai")
+                if response.status_code in self.TOKEN_REJECTED_STATUS and attempt == 0:
+                    print(f"[{query}] CSRF 토큰이 거부되어 재발급합니다. (HTTP {response.status_code})")
+                    response.close()
+                    self.invalidate_token(token)
+                    continue
+                response.raise_for_status()
+
+                with span("ooai.read_sse", stream=stream):
+                    if stream:
+                        parsed_data = parse_sse_stream(response)
+                    else:
+                        capture("ooai", "sse", query, response.text, "txt")
+                        parsed_data = parse_sse_response(response.text)
+            except CircuitOpenError as e:
+                print(f"⛔ {e}: [{query}] 검색 생략")
+                return {}
+            except requests.exceptions.RequestException as e:
+                print(f"[{query}] 검색 API 호출 오류: {e}")
+                return {}
+
+            if VERBOSE_OUTPUT:
+                print(json.dumps(parsed_data, ensure_ascii=False, indent=4))
+
+            return parsed_data
+        return {}
+
+_default_client = None
+_default_client_pid = None
+_default_pool_size = OOAI_POOL_SIZE
+_default_client_lock = threading.Lock()
+
+def get_default_client() -> OoaiClient:
+    """
+    프로세스별 기본 OoaiClient 반환 (fork된 워커 프로세스는 부모의 소켓을 공유하지 않도록 새로 생성)
+    """
+    global _default_client, _default_client_pid
+    with _default_client_lock:
+        if _default_client is None or _default_client_pid != os.getpid():
+            _default_client = OoaiClient(_default_pool_size)
+            _default_client_pid = os.getpid()
+        return _default_client
+
+def ensure_default_pool_size(pool_size: int) -> None:
+    """
+    기본 OoaiClient의 커넥션 풀 크기를 최소 pool_size로 설정
+    (여러 스레드가 동시에 enrich_company_data를 실행할 때 풀이 모자라 연결이 버려지지 않도록, 워커 시작 전에 호출)
+    """
+    global _default_client, _default_pool_size
+    with _default_client_lock:
+        if pool_size <= _default_pool_size:
+            return
+        _default_pool_size = pool_size
+        _default_client = None # 다음 get_default_client()에서 새 크기로 생성
+
+@traced("ooai.crawler")
+def ooai_crawler(query: str, client: OoaiClient = None, cache_key: tuple = None, bypass_cache: bool = OOAI_CACHE_BYPASS) -> dict:
     """
     oo.ai 웹사이트에 특정 쿼리를 검색하고, 검색 결과를 파싱하여 딕셔너리 형태로 반환
     CSRF 토큰 추출, 검색 API 호출, SSE 응답 파싱 과정을 포함.
+    커넥션 풀과 CSRF 토큰은 OoaiClient에서 재사용.
+    cache_key가 주어지면 답변 캐시를 먼저 조회하고, 캐시에 있으면 검색하지 않고 바로 반환
+    (이때 search_id, full_html_answer는 None).
 
     Args:
     query(str): 검색할 검색어 (예: "삼성전자 주요 타겟 고객층") 
+    client(OoaiClient, optional): 사용할 클라이언트. 없으면 프로세스 기본 클라이언트 사용.
+    cache_key(tuple, optional): 답변 캐시 키 (기업명, 필드명, prompt_hash). 없으면 캐시를 사용하지 않음.
+    bypass_cache(bool): True면 캐시를 조회하지 않고 검색 (검색 결과로 캐시는 갱신)
   
     Returns:
     dict: 검색 결과와 관련된 정보 담은 딕셔너리.
@@ -24,94 +201,59 @@ def ooai_crawler(query: str) -> dict:
         }
         검색 실패(초기 페이지 접근 오류, CSRF 토큰 없음, 검색 API 호출 오류) 시 빈 딕셔너리 `{}`를 반환.
     """  
-    encoded_query = urllib.parse.quote(query)
-
-    # 1. CSRF 토큰 추출
-    url = f'https://oo.ai/search?q={encoded_query}'
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"[{query}] 초기 페이지 접근 오류: {e}")
-        return {}
-
-    html = response.text
-    token = None
-    # 정규표현식을 사용하여 token 값 추출
-    token_match = re.search(r'token:\s*"([^"]+)"', html)
-    if token_match:
-        token = token_match.group(1)
-
-    # 추출된 토큰이 없다면 에러 메시지 출력
-    if not token:
-        print(f"[{query}] CSRF 토큰을 찾을 수 없습니다.")
-        return {}
-    
-    # 추출된 토큰을 출력
-    print({"json": {"csrf_token": token}})
-
-    # 2. 검색 API 호출
-    search_url = f"https://oo.ai/api/search?q={encoded_query}&lang=ko&tz=Asia/Seoul"
-    headers = {
-        "accept": "*/*",
-        "accept-language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        "cookie": "_variant=stable; lang=ko",
-        "origin": "https://oo.ai",
-        "referer": f"https://oo.ai/search?q={encoded_query}",
-        "user-agent": USER_AGENT,
-        "x-csrf-token": f"Bearer {token}"
-    }
+    if cache_key:
+        cached = get_cached_answer(*cache_key, bypass=bypass_cache)
+        if cached:
+            print(f"💾 [{query[:30]}] 캐시된 답변 사용")
+            return {'json': {'search_id': None, 'full_html_answer': None, 'plain_text_answer': cached}}
 
-    try:
-        response = requests.post(search_url, headers=headers, timeout=20)
-        response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        print(f"[{query}] 검색 API 호출 오류: {e}")
-        return {}
-    
-    parsed_data = parse_sse_response(response.text)
-    print(json.dumps(parsed_data, ensure_ascii=False, indent=4))
-
-    return parsed_data
+    search_result = (client or get_default_client()).search(query)
+    if cache_key and search_result:
+        save_answer(*cache_key, search_result['json'].get('plain_text_answer'))
+    return search_result
 
-def parse_sse_response(stream_data:str) -> dict:
+def iter_sse_data(lines):
     """
-    SSE 형식의 응답을 파싱하여 최종 답변 및 검색 ID를 추출.
-    HTML 태그를 제거한 순수 텍스트 답변도 함께 생성.
+    SSE 라인 이터러블에서 'data:' 라인의 JSON 객체를 순서대로 꺼내는 제너레이터.
+    JSON 파싱 오류가 있는 라인은 건너뜀.
 
     Args:
-        stream_data(str) : SEE 형식의 문자열 데이터. 각 라인은 'data:'로 시작하며 JSON 객체를 포함.
-    
-    Returns:
-        dict: 파싱된 검색 결과가 담긴 딕셔너리.
-            {
-                'json': {
-                    'search_id': str or None,          # 추출된 검색 ID. 없으면 None.
-                    'full_html_answer': str or None,   # 원본 HTML 형식의 답변. 없으면 None.
-                    'plain_text_answer': str or None   # HTML 태그가 제거된 순수 텍스트 답변. 없으면 None.
-                }
-            }
+        lines(iterable): SSE 응답의 라인 (str)
     """
-    lines = stream_data.split('\n')
-    final_answer_html = None
-    sid = None
     for line in lines:
         if line.startswith('data:'):
             try:
                 json_data_string = line[5:].strip()
                 if json_data_string:
-                    parsed_data = json.loads(json_data_string)
-                    if parsed_data.get('type') == 'save':
-                        if 'answer' in parsed_data:
-                            final_answer_html = parsed_data['answer']
-                        if 'id' in parsed_data:
-                            sid = parsed_data['id']
-                        if final_answer_html and sid:
-                            break
+                    yield json.loads(json_data_string)
             except Exception:
                 # JSON 파싱 오류는 무시하고 다음 라인으로 진행
                 continue
 
+def find_save_event(events) -> tuple:
+    """
+    SSE 이벤트 중 type == 'save' 이벤트에서 최종 답변(HTML)과 검색 ID를 추출.
+    둘 다 찾는 즉시 중단하므로, 스트리밍 이터러블을 넘기면 나머지 응답은 읽지 않음.
+
+    Returns:
+        tuple: (final_answer_html, sid). 없으면 각각 None.
+    """
+    final_answer_html = None
+    sid = None
+    for parsed_data in events:
+        if parsed_data.get('type') == 'save':
+            if 'answer' in parsed_data:
+                final_answer_html = parsed_data['answer']
+            if 'id' in parsed_data:
+                sid = parsed_data['id']
+            if final_answer_html and sid:
+                break
+    return final_answer_html, sid
+
+def build_sse_result(final_answer_html, sid) -> dict:
+    """
+    최종 답변(HTML)과 검색 ID로 결과 딕셔너리 생성. HTML 태그를 제거한 순수 텍스트 답변도 함께 생성.
+    """
     plain_text_answer = None
     if final_answer_html:
         # <webblock> 태그와 그 내용 제거
@@ -127,15 +269,88 @@ def parse_sse_response(stream_data:str) -> dict:
         }
     }
 
-def enrich_company_data(company_name: str, existing_data: dict) -> dict:
+def parse_sse_response(stream_data:str) -> dict:
+    """
+    SSE 형식의 응답을 파싱하여 최종 답변 및 검색 ID를 추출.
+    HTML 태그를 제거한 순수 텍스트 답변도 함께 생성.
+
+    Args:
+        stream_data(str) : SEE 형식의 문자열 데이터. 각 라인은 'data:'로 시작하며 JSON 객체를 포함.
+    
+    Returns:
+        dict: 파싱된 검색 결과가 담긴 딕셔너리.
+            {
+                'json': {
+                    'search_id': str or None,          # 추출된 검색 ID. 없으면 None.
+                    'full_html_answer': str or None,   # 원본 HTML 형식의 답변. 없으면 None.
+                    'plain_text_answer': str or None   # HTML 태그가 제거된 순수 텍스트 답변. 없으면 None.
+                }
+            }
+    """
+    final_answer_html, sid = find_save_event(iter_sse_data(stream_data.split('\n')))
+    return build_sse_result(final_answer_html, sid)
+
+def parse_sse_stream(response) -> dict:
+    """
+    stream=True로 받은 SSE 응답을 라인 단위로 읽으며 파싱.
+    'save' 이벤트에서 답변과 검색 ID를 모두 찾으면 나머지 응답을 읽지 않고 연결을 닫음.
+    (전체 응답을 메모리에 올리지 않으므로 긴 답변에서도 메모리 사용량이 일정)
+
+    Args:
+        response(requests.Response): stream=True로 요청한 검색 API 응답
+
+    Returns:
+        dict: parse_sse_response와 동일한 형식의 결과
+    """
+    try:
+        # SSE는 UTF-8 고정 (Content-Type에 charset이 없어도 UTF-8로 디코딩)
+        lines = (line.decode('utf-8', errors='replace') for line in response.iter_lines())
+        final_answer_html, sid = find_save_event(iter_sse_data(lines))
+    finally:
+        response.close()
+    return build_sse_result(final_answer_html, sid)
+
+def field_prompt_key(field: str) -> str:
+    """
+    필드 답변의 캐시 키에 사용하는 질의 문구 해시 (필드 질의 템플릿 + 개별/통합 질의 가이드)
+    """
+    return prompt_hash(ooai_field("{company_name}")[field], EXTRA_PROMPT_GUIDE, COMBINED_PROMPT_GUIDE)
+
+@traced("ooai.combined_search")
+def combined_search(company_name: str, fields: list) -> dict:
+    """
+    비어있는 필드 여러 개를 한 번의 oo.ai 검색으로 요청하고 답변을 필드별로 분리 (분리한 답변은 필드별로 캐시에 저장)
+
+    Returns:
+        dict: 필드명 → 답변 (답변에서 찾지 못한 필드는 제외)
+    """
+    print(f"🧩 통합 검색 시도: {', '.join(fields)}")
+    search_result = ooai_crawler(combined_query(company_name, fields))
+    answer = search_result['json'].get('plain_text_answer') if search_result else None
+    parsed = parse_combined_answer(answer, fields)
+    print(f"🧩 통합 검색 답변에서 {len(parsed)}/{len(fields)}개 필드 확인")
+    for field, field_answer in parsed.items():
+        save_answer(company_name, field, field_prompt_key(field), field_answer)
+    return parsed
+
+@traced("ooai.enrich")
+def enrich_company_data(company_name: str, existing_data: dict, concurrency: int = OOAI_CONCURRENCY,
+                        combined: bool = OOAI_COMBINED_QUERY, bypass_cache: bool = OOAI_CACHE_BYPASS) -> dict:
     """
     기존에 수집된 기업 데이터에서 비어있는 특정 필드들을 oo.ai 검색을 통해 보완.
     주요 목표 고객층, 경쟁사, 강점, 위험 요인, 최근 동향 등의 정보를 검색하여 `existing_data`를 업데이트.
+    답변 캐시에 유효한 답변이 있는 필드는 검색하지 않음.
+    combined=True고 비어있는 필드가 2개 이상이면 먼저 한 번의 통합 검색으로 요청하고,
+    통합 검색 답변에서 찾지 못한 필드만 개별 검색.
+    개별 검색은 최대 `concurrency`개까지 동시에 요청 (1 이하면 순차 요청).
 
     Args:
         company_name(str): 기업명. oo.ai 검색 쿼리를 구성하는 데 사용.
         existing_data(dict): 현재까지 수집된 기업 데이터가 담긴 딕셔너리.
                              이 딕셔너리의 비어있는 필드를 보완.(필드: 값)
+        concurrency(int): oo.ai 동시 요청 수 제한.
+        combined(bool): 통합 검색 사용 여부 (기본 OOAI_COMBINED_QUERY=false, 필드별 개별 검색).
+        bypass_cache(bool): True면 답변 캐시를 조회하지 않고 검색 (검색 결과로 캐시는 갱신).
     
     Returns:
         dict: oo.ai 검색을 통해 보완된 기업 데이터가 담긴 딕셔너리.
@@ -143,24 +358,50 @@ def enrich_company_data(company_name: str, existing_data: dict) -> dict:
     """
     # oo.ai 보완할 필드 템플릿 적용 
     fields_to_enrich = ooai_field(company_name)
-    
-    extra_prompt_guide = "에 대해 다음 가이드라인을 엄수하여 1문장으로 핵심만 요약해 주세요: 1. 불필요한 서론/결론 없이 바로 본론부터 시작. 2. 객관적인 정보만 포함. 3. 가능한 한 수치나 사실 기반으로 서술. 4. ~이다/입니다 체 종결 5. 관련 정보가 없을 경우 텍스트 대신 ''으로 출력."
-    
+
     final_data = existing_data.copy()
 
-    for field, query_template in fields_to_enrich.items():
-        # 현재 필드 값이 비어있는지 확인
-        if not final_data.get(field):
-            print(f"🔍'{field}' 필드가 비어있습니다. OO.ai에서 검색을 시도합니다: '{query_template}'")
-            search_result = ooai_crawler(query_template + extra_prompt_guide)
-            
-            if search_result and search_result['json'].get('plain_text_answer'):
-                answer = search_result['json']['plain_text_answer']
-                final_data[field] = answer
-                print(f"✅'{field}' 필드 채움")
-            else:
-                print(f"❌ '{field}' 필드에 대한 OO.ai 검색 결과가 없거나 유효하지 않습니다.")
-                final_data[field] = ""
+    # 현재 필드 값이 비어있는 필드만 검색 대상
+    missing_fields = {field: query_template for field, query_template in fields_to_enrich.items() if not final_data.get(field)}
+    for field, query_template in missing_fields.items():
+        print(f"🔍'{field}' 필드가 비어있습니다. OO.ai에서 검색을 시도합니다: '{query_template}'")
+
+    # 캐시된 답변이 있는 필드는 검색하지 않음
+    for field in list(missing_fields):
+        cached = get_cached_answer(company_name, field, field_prompt_key(field), bypass=bypass_cache)
+        if cached:
+            final_data[field] = cached
+            del missing_fields[field]
+            print(f"💾'{field}' 필드 채움 (캐시)")
+
+    # 통합 검색으로 채운 필드 (정보 없음으로 답한 필드는 ""로 확정하고 개별 검색하지 않음)
+    if combined and len(missing_fields) > 1:
+        combined_answers = combined_search(company_name, list(missing_fields))
+        for field, answer in combined_answers.items():
+            final_data[field] = answer
+            print(f"✅'{field}' 필드 채움 (통합 검색)" if answer else f"❌ '{field}' 필드에 대한 OO.ai 검색 결과가 없습니다. (통합 검색)")
+        missing_fields = {field: query_template for field, query_template in missing_fields.items() if field not in combined_answers}
+
+    def search_field(field: str) -> dict:
+        # 캐시는 위에서 이미 조회했으므로 검색 결과 저장만 함
+        return ooai_crawler(missing_fields[field] + EXTRA_PROMPT_GUIDE,
+                            cache_key=(company_name, field, field_prompt_key(field)), bypass_cache=True)
+
+    if concurrency > 1 and len(missing_fields) > 1:
+        # 비어있는 필드의 검색을 한 번에 요청하고 응답을 기다림 (네트워크 대기 시간 중첩)
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(missing_fields)), thread_name_prefix="ooai") as executor:
+            search_results = list(executor.map(bind_trace(search_field), missing_fields))
+    else:
+        search_results = [search_field(field) for field in missing_fields]
+
+    for field, search_result in zip(missing_fields, search_results):
+        if search_result and search_result['json'].get('plain_text_answer'):
+            answer = search_result['json']['plain_text_answer']
+            final_data[field] = answer
+            print(f"✅'{field}' 필드 채움")
+        else:
+            print(f"❌ '{field}' 필드에 대한 OO.ai 검색 결과가 없거나 유효하지 않습니다.")
+            final_data[field] = ""
 
     return final_data
 
@@ -1,19 +1,29 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
-from copy import deepcopy
 
+import os
 import requests
 import re
 import json
+import urllib.parse
 
-from config.setting import CHROME_DRIVER_PATH, USER_AGENT
-from common.common_field_template import basic_template
-from webdriver_manager.chrome import ChromeDriverManager
+from common.capture import capture, is_capture_enabled
+from common.rate_limiter import rate_limited_get, wait_for_slot
+from common.resilience import CircuitOpenError, RETRYABLE_STATUS, check_circuit, report_failure, report_success, retry_call
+from common.common_field_template import new_company_data
+from common.tracing import span, traced
+from config.setting import USER_AGENT, SARAMIN_HTTP_FIRST
+from cache.resolution_cache import get_cached_url, save_resolved_url, invalidate_resolved_url, register_key_normalizer
+from crawl.driver_pool import create_driver
+
+SARAMIN_BASIC_URL = "https://www.saramin.co.kr"
+
+# HTTP fast path용 세션 (프로세스별로 생성)
+_http_session = None
+_http_session_pid = None
 
 # 기업명에서 (주), (주식회사) 접두사/접미사, 공백 제거
 def filtering_company_name(name: str) -> str:
@@ -49,6 +59,9 @@ def compare_company_name(searching_keyword, searched_company: str):
 
     return result
 
+# URL 캐시 키: compare_company_name은 검색어를 그대로 비교하므로 검색어 원문을 키로 사용
+register_key_normalizer("saramin", lambda keyword: keyword)
+
 
 # 재무현황 탭 이동
 def get_financial_info_after_button(driver, target_button_text, wait_time=10):
@@ -79,7 +92,8 @@ def get_financial_info_after_button(driver, target_button_text, wait_time=10):
                 break
 
         if found_button:
-            # 3. 버튼 클릭
+            # 3. 버튼 클릭 (재무정보 요청도 속도 제한 적용)
+            wait_for_slot(driver.current_url)
             found_button.click()
             # print(f"👉 버튼'{target_button_text}' 클릭.")
 
@@ -98,23 +112,97 @@ def get_financial_info_after_button(driver, target_button_text, wait_time=10):
             print(f"⚠️ 오류 발생: '{target_button_text}' 버튼을 찾거나 클릭하는 중 문제가 발생 - {e}")
             return None
 
-# 재무현황 데이터 추출
-def extract_financial_info(driver, company_data):
+class StaleUrlError(Exception):
+    """
+    캐시된 상세 페이지 URL이 더 이상 유효하지 않음 (404/410 또는 다른 경로로 리다이렉트)
+    """
+
+# HTTP 요청으로 페이지 HTML 가져오기
+def fetch_html(url: str, timeout: int = 10, strict: bool = False):
     """
-    재무현황(매출, 영업이익, 순이익, 자본금)에 대한 재무정보 데이터 추출
+    브라우저 없이 requests로 페이지 HTML을 가져옴 (서버 렌더링 페이지용 fast path)
     Args:
-        driver (webdriver.Chrome): Selenium 웹 드라이버 인스턴스.
+        url (str): 가져올 페이지 URL.
+        timeout (int, optional): 요청 제한 시간(초).
+        strict (bool, optional): True면 404/410 응답이나 다른 경로로의 리다이렉트를 StaleUrlError로 알림 (캐시된 URL 검증용).
+
+    Returns:
+        str: 페이지 HTML. 요청 실패 또는 200이 아닌 응답이면 None.
+
+    Raises:
+        CircuitOpenError: 사람인 회로가 차단된 경우
+    """
+    global _http_session, _http_session_pid
+    if _http_session is None or _http_session_pid != os.getpid():
+        _http_session = requests.Session()
+        _http_session.headers.update({"user-agent": USER_AGENT or "", "accept-language": "ko-KR,ko;q=0.9"})
+        _http_session_pid = os.getpid()
+
+    def request():
+        wait_for_slot(url)
+        with span("saramin.http_get", url=url):
+            response = _http_session.get(url, timeout=timeout)
+        if response.status_code in RETRYABLE_STATUS:
+            response.raise_for_status() # 일시적 오류/속도 제한은 retry_call에서 재시도
+        return response
+
+    try:
+        response = retry_call(request, site="saramin")
+        redirected = urllib.parse.urlparse(response.url).path != urllib.parse.urlparse(url).path
+        if strict and (response.status_code in (404, 410) or redirected):
+            raise StaleUrlError(f"HTTP {response.status_code}, 최종 URL {response.url}")
+        if response.status_code != 200:
+            print(f"⚠️ HTTP 요청 실패 (HTTP {response.status_code}): {url}")
+            return None
+        return response.text
+    except requests.exceptions.RequestException as e:
+        print(f"⚠️ HTTP 요청 오류: {url} - {e}")
+        return None
+
+def fetch_soup_if_rendered(url: str, required_selector: str, strict: bool = False):
+    """
+    HTTP로 페이지를 가져와 필요한 요소(required_selector)가 서버 렌더링되어 있으면 BeautifulSoup 객체 반환.
+    요소가 없으면(클라이언트 렌더링 등) None을 반환하여 Selenium으로 대체하도록 함.
+    strict=True면 404/리다이렉트 시 StaleUrlError 발생.
+    """
+    html = fetch_html(url, strict=strict)
+    if not html:
+        return None
+    soup = BeautifulSoup(html, 'html.parser')
+    if not soup.select_one(required_selector):
+        print(f"⚠️ HTTP 응답에 '{required_selector}' 요소가 없어 브라우저로 대체합니다: {url}")
+        return None
+    return soup
+
+# 상세 페이지의 재무정보 메뉴 확인
+def has_finance_menu(soup, target_button_text: str = "재무정보"):
+    """
+    HTTP로 받은 기업 상세 페이지에 재무정보 메뉴 버튼이 있는지 확인
+    Args:
+        soup (BeautifulSoup): 기업 상세 페이지 HTML을 파싱한 객체.
+        target_button_text (str, optional): 재무정보 버튼에 표시된 텍스트.
+
+    Returns:
+        bool: 메뉴가 렌더링되어 있으면 버튼 존재 여부. 메뉴 자체가 없으면(클라이언트 렌더링 등) None.
+    """
+    buttons = soup.select("ul.menu_list button")
+    if not buttons:
+        return None
+    return any(button.get_text(strip=True) == target_button_text for button in buttons)
+
+# 재무현황 데이터 파싱
+@traced("saramin.parse_finance")
+def parse_financial_soup(financial_soup, company_data):
+    """
+    재무정보 페이지 HTML에서 재무현황(매출, 영업이익, 순이익, 자본금) 데이터를 추출
+    Args:
+        financial_soup (BeautifulSoup): 재무정보 탭/페이지 HTML을 파싱한 객체.
         company_data (dict): 기업 정보가 저장될 딕셔너리. 추출된 재무 데이터는 'financial_history' 키 아래에 추가됨.
                              'financial_history'는 {년도: {필드명: 값}} 형태의 중첩 딕셔너리.
     
     Returns:
         None: 함수는 직접 값을 반환하지 않고, `company_data` 딕셔너리를 직접 수정.
-    
     """
-    # print(f"=== extract_financial_info 함수 실행 ===")
-    # 재무정보 탭으로 이동
-    financial_soup = get_financial_info_after_button(driver, "재무정보")
-
     # 재무현황 데이터 div 선택        
     financial_sections = financial_soup.find_all('div', class_='box_finance')
 
@@ -149,12 +237,196 @@ def extract_financial_info(driver, company_data):
 
                 # print(f"✅ {field_name} => 년도{year}:{value_str}")
 
+# 재무현황 데이터 추출
+@traced("saramin.browser_finance")
+def extract_financial_info(driver, company_data, capture_key: str = None):
+    """
+    재무정보 버튼을 클릭하여 재무현황(매출, 영업이익, 순이익, 자본금)에 대한 재무정보 데이터 추출
+    Args:
+        driver (webdriver.Chrome): Selenium 웹 드라이버 인스턴스. (기업 상세 페이지가 열려 있어야 함)
+        company_data (dict): 기업 정보가 저장될 딕셔너리. 추출된 재무 데이터는 'financial_history' 키 아래에 추가됨.
+        capture_key (str, optional): capture 모드에서 재무정보 HTML을 저장할 파일 식별자.
+    
+    Returns:
+        None: 함수는 직접 값을 반환하지 않고, `company_data` 딕셔너리를 직접 수정.
+    
+    """
+    # print(f"=== extract_financial_info 함수 실행 ===")
+    # 재무정보 탭으로 이동
+    financial_soup = get_financial_info_after_button(driver, "재무정보")
+    if financial_soup is None:
+        return
+
+    if is_capture_enabled():
+        capture("saramin", "finance", capture_key or driver.current_url, str(financial_soup))
+    parse_financial_soup(financial_soup, company_data)
+
+def search_result_count(soup) -> int:
+    """
+    검색 결과 페이지의 검색 결과 수 (.cnt_result). 없으면 0.
+    """
+    cnt_result_span = soup.select_one('.cnt_result')
+    if cnt_result_span:
+        match = re.search(r'\d+', cnt_result_span.get_text(strip=True))
+        if match:
+            return int(match.group(0))
+    return 0
+
+# 검색 결과에서 기업 찾기
+@traced("saramin.parse_search")
+def find_company_in_search_result(soup, search_keyword: str):
+    """
+    사람인 기업 검색 결과 페이지에서 검색 기업명과 일치하는 기업을 찾음
+    Args:
+        soup (BeautifulSoup): 검색 결과 페이지 HTML을 파싱한 객체.
+        search_keyword (str): 검색한 기업명.
+
+    Returns:
+        tuple: (corp_name, saramin_company_url). 일치하는 기업이 없으면 None.
+    """
+    # 1-1. 검색 결과 수 확인 및 첫 번째 기업 링크 추출
+    result_count = search_result_count(soup)
+
+    # print(f"사람인 검색 결과 수: {result_count}건")
+
+    # 1-2. result_count > 0 AND search_keyword == corp_name
+    if result_count == 0:
+        print(f"❌ 검색 키워드 '{search_keyword}'에 대한 검색 결과가 0건입니다.")
+        return None
+
+    company_popup_names = soup.select('.company_popup')
+    # print(f">> company_popup_names (조회된 개수): {len(company_popup_names)}")
+
+    # 1-3. 검색 기업명(search_keyword)과 여러 검색 결과 중 기업명(corp_name)이 일치하는 것 선택
+    for corp_name_element in company_popup_names:
+        corp_name = corp_name_element.attrs.get('title')
+
+        if not corp_name:
+            continue
+
+        corp_name = corp_name.strip()
+
+        if compare_company_name(search_keyword, corp_name):
+            saramin_company_url = ""
+            company_name_link_suffix = corp_name_element.attrs.get('href')
+            if company_name_link_suffix:
+                saramin_company_url = requests.compat.urljoin(SARAMIN_BASIC_URL, company_name_link_suffix)
+            
+            # print(f"✅ 사람인에서 찾은 기업명: '{corp_name}'")
+            # print(f"✅ 사람인 기업 상세 링크: {saramin_company_url}")
+            return corp_name, saramin_company_url
+
+    print(f"❌ '{search_keyword}'에 일치하는 검색 결과가 존재하지 않습니다.")
+    return None
+
+# 기업 상세 페이지 파싱
+@traced("saramin.parse_detail")
+def parse_company_details(soup, corp_name: str, company_data):
+    """
+    [기업소개] 탭 HTML에서 기업 기본 정보를 추출하여 company_data에 저장
+    Args:
+        soup (BeautifulSoup): 기업 상세 페이지 HTML을 파싱한 객체.
+        corp_name (str): 검색 결과의 기업명 (회사 유형 판별에 사용).
+        company_data (dict): 기업 정보가 저장될 딕셔너리.
+
+    Returns:
+        None: 함수는 직접 값을 반환하지 않고, `company_data` 딕셔너리를 직접 수정.
+    """
+    # 회사 유형(주식회사, 유한회사 등)
+    if "(주)" in corp_name or "(주식회사)" in corp_name:
+        company_data["company_type"] = "주식회사"
+        company_data["is_listed"] = True
+    elif "(유)" in corp_name or "(유한회사)" in corp_name:
+        company_data["company_type"] = "유한회사" 
+    else:
+        company_data["is_listed"] = False
+
+    # 직원수
+    employee_count_element = soup.select_one('.company_summary_item:nth-child(3) .box_align')
+    if employee_count_element:
+        company_data["employee_count"] = employee_count_element.select_one('.company_summary_tit').text.strip()
+
+    # 산업 분야
+    industry_element = soup.select_one('.company_details_group:nth-child(1) dd')
+    if industry_element:
+        company_data["industry"] = industry_element.text.strip()
+    
+    # 제품/서비스 명(JSON)
+    products_services_element = soup.select_one('dt:-soup-contains("브랜드명") + dd > p')
+    if products_services_element:
+        company_data["products_services"] = products_services_element.text.strip()
+
+    # CEO
+    key_executives_element = soup.select_one('.company_details_group:nth-child(2) dd')
+    if key_executives_element:
+        company_data['key_executive'] = key_executives_element.text.strip()
+
+    # 홈페이지 URL
+    homepage_element = soup.select_one('dt:-soup-contains("홈페이지") + dd > a')
+    if homepage_element:
+        company_data["homepage"] = homepage_element.get('href')
+    
+    # 회사 주소
+    address_element = soup.select_one('dt:-soup-contains("주소") + dd > p')
+    if address_element:
+        company_data["address"] = address_element.text.strip() # 주소만 출력(지도 제외)
+
+    # 설립일
+    founded_element = soup.select_one('.company_summary_item:nth-child(1) .company_summary_desc')
+    if founded_element:
+        raw_date = founded_element.text.strip() # yyyy-mm-dd 형식
+
+        company_data["established_year"] = raw_date
+        print(f"설립일 = {raw_date}")
+
+    # 회사 요약/설명
+    summary_element = soup.select_one('.company_introduce .txt')
+    if summary_element:
+        company_data["description"] = summary_element.text.strip()
+
+    # 로고 URL
+    logo_element = soup.select_one('.box_logo img')
+    if logo_element and 'src' in logo_element.attrs:
+        logo_url = logo_element['src']
+        print(f"logo_url = {logo_url}")
+
+# 최신 재무 정보 채우기
+def fill_latest_financial_info(company_data):
+    """
+    "financial_history" 에서 최근 매출액,영업이익,당기순이익,회계연도를 채움
+    """
+    if company_data["financial_history"]:
+        latest_year = max(company_data["financial_history"].keys(), key=int)
+
+        latest_financial_data = company_data["financial_history"][latest_year]
+
+        company_data["latest_fiscal_year"] = latest_year
+        company_data["latest_revenue"] = latest_financial_data.get("매출액")
+        company_data["latest_operating_income"] = latest_financial_data.get("영업이익")
+        company_data["latest_net_income"] = latest_financial_data.get("당기순이익")
+    else:
+        print("🚫 financial_history가 비어 있어 최신 재무 정보를 추출할 수 없습니다.")
+
 # === 사람인 웹크롤링 === 
-def crawl_from_saramin(search_keyword: str) -> dict:
+@traced("saramin.crawl")
+def crawl_from_saramin(search_keyword: str, driver=None, use_http: bool = SARAMIN_HTTP_FIRST, use_cache: bool = True,
+                       driver_factory=None) -> dict:
     """
     사람인 웹사이트에서 기업 정보를 크롤링하여 딕셔너리 형태로 반환
+    - use_http=True면 검색/상세 페이지를 먼저 requests로 가져오고,
+      필요한 요소(.company_popup, .company_details)가 없을 때만 Selenium으로 대체
+    - 재무현황은 재무정보 탭 클릭이 필요하므로 브라우저로 수집하되,
+      HTTP로 받은 상세 페이지에 재무정보 메뉴가 없으면 재무 데이터가 없는 기업으로 보고 생략
+    - HTTP 요청의 일시적 오류는 backoff 후 재시도, 사람인 회로가 차단된 상태면 바로 기본 템플릿 반환
+    - 기업명 → 상세 페이지 URL 캐시가 있으면 검색 단계를 생략하고, 캐시 URL이 유효하지 않으면 삭제 후 다시 검색
     Args:
         search_keyword (str): 사람인에서 검색할 기업의 이름.
+        driver (webdriver.Chrome, optional): 외부에서 주입한 드라이버 (예: 드라이버 풀).
+                                             주입된 드라이버는 종료하지 않으며, 없으면 필요할 때 새로 생성 후 종료.
+        use_http (bool, optional): HTTP fast path 사용 여부.
+        use_cache (bool, optional): 상세 페이지 URL 캐시 사용 여부.
+        driver_factory (callable, optional): Selenium이 필요할 때 호출하여 드라이버를 받는 함수 (예: lazy_borrowed_driver).
+                                             받은 드라이버는 종료하지 않음 (반납은 호출한 쪽에서 처리).
     Returns:
         dict: 크롤링된 기업 정보가 담긴 딕셔너리.
               검색 결과가 없거나 오류 발생 시, 기본 템플릿에 해당하는 정보만 포함.
@@ -162,197 +434,151 @@ def crawl_from_saramin(search_keyword: str) -> dict:
     print(f"=== crawl_from_saramin 함수 실행 - '{search_keyword}' 기업 정보 수집 시작 ===")
 
     # 공통 필드 템플릿 적용 
-    company_data = deepcopy(basic_template)
+    company_data = new_company_data()
 
-    saramin_company_url = ""
-    logo_url = ""
+    try:
+        check_circuit("saramin")
+    except CircuitOpenError as e:
+        print(f"⛔ {e}: '{search_keyword}' 사람인 수집 생략")
+        return company_data
+
+    owns_driver = driver is None and driver_factory is None
+
+    # Selenium이 필요할 때만 드라이버 생성 (driver_factory가 있으면 받아서 사용)
+    def get_driver():
+        nonlocal driver
+        if driver is None:
+            if driver_factory is not None:
+                driver = driver_factory()
+            else:
+                with span("saramin.driver_start"):
+                    driver = create_driver("saramin")
+                print("✅ Chrome 드라이버 초기화 성공.")
+        return driver
 
-    driver = None
     try:
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument(f"user-agent={USER_AGENT}")
-        chrome_options.add_argument("--log-level=3")
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-
-        service = Service(executable_path=CHROME_DRIVER_PATH)
-        driver = webdriver.Chrome(service=webdriver.ChromeService(ChromeDriverManager().install()), options=chrome_options)
-        print("✅ Chrome 드라이버 초기화 성공.")
-        
-        SARAMIN_BASIC_URL = "https://www.saramin.co.kr"
-        # 검색어 URL 인코딩 및 검색 URL 생성
-        encoded_search_keyword = requests.utils.quote(search_keyword)
-        initial_search_url = f"{SARAMIN_BASIC_URL}/zf_user/search/company?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={encoded_search_keyword}"
-        
-        # --- 1단계: 검색 결과 페이지로 이동 ---
-        print(f"👉 사람인 '{encoded_search_keyword}' 검색 페이지로 이동: {initial_search_url}")
-        driver.get(initial_search_url)
-
-        # 검색 결과 페이지 로딩 대기
-        try:
-            # `.cnt_result`는 검색 결과 수를, `.corp_name > a`는 첫 번째 회사 링크를 의미
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '.cnt_result, .corp_name > a'))
-            )
-            # print("✅ 사람인 검색 결과 페이지 로딩 완료.")
-        except Exception as e:
-            print(f"⚠️ 사람인 검색 결과 페이지 로딩 실패 또는 요소 미발견: {e}")
-            print(f"❌ '{search_keyword}'에 대한 검색 결과를 찾을 수 없습니다.")
-            return company_data # 검색 결과가 없으면 여기서 함수 종료
-
-        # 로드된 검색 결과 페이지 HTML 파싱
-        html = driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # 1-1. 검색 결과 수 확인 및 첫 번째 기업 링크 추출
-        cnt_result_span = soup.select_one('.cnt_result')
-        result_count = 0
-        if cnt_result_span:
-            cnt_text = cnt_result_span.get_text(strip=True)
-            match = re.search(r'\d+', cnt_text)
-            if match:
-                result_count = int(match.group(0))
+        cached = get_cached_url("saramin", search_keyword) if use_cache else None
+        if cached:
+            # 캐시된 상세 페이지 URL이 있으면 검색 단계 생략
+            corp_name, saramin_company_url = cached["resolved_name"], cached["detail_url"]
+            print(f"💾 캐시된 기업 상세 링크: {saramin_company_url}")
+        else:
+            # 검색어 URL 인코딩 및 검색 URL 생성
+            encoded_search_keyword = requests.utils.quote(search_keyword)
+            initial_search_url = f"{SARAMIN_BASIC_URL}/zf_user/search/company?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword={encoded_search_keyword}"
         
-        # print(f"사람인 검색 결과 수: {result_count}건")
-
-        # 1-2. result_count > 0 AND search_keyword == corp_name
-        if result_count > 0:
-            company_popup_names = soup.select('.company_popup')
-            # print(f">> company_popup_names (조회된 개수): {len(company_popup_names)}")
-
-            # 1-3. 검색 기업명(search_keyword)과 여러 검색 결과 중 기업명(corp_name)이 일치하는 것 선택
-            found_match = False
-
-            for corp_name_element in company_popup_names:
-                corp_name = corp_name_element.attrs.get('title')
-
-                if not corp_name:
-                    continue
-
-                corp_name = corp_name.strip()
-
-                result = compare_company_name(search_keyword, corp_name)
-
-                if result == True:
-                    company_data["name"] = corp_name
-                    company_name_link_suffix = corp_name_element.attrs.get('href')
-                    if company_name_link_suffix:
-                        saramin_company_url = requests.compat.urljoin(SARAMIN_BASIC_URL, company_name_link_suffix)
-                    
-                    # print(f"✅ 사람인에서 찾은 기업명: '{company_data['name']}'")
-                    # print(f"✅ 사람인 기업 상세 링크: {saramin_company_url}")
-                    
-                    found_match = True                
-                    break
-            
-            if not found_match:
-                print(f"❌ '{search_keyword}'에 일치하는 검색 결과가 존재하지 않습니다.")
+            # --- 1단계: 검색 결과 페이지로 이동 ---
+            print(f"👉 사람인 '{encoded_search_keyword}' 검색 페이지로 이동: {initial_search_url}")
+            soup = fetch_soup_if_rendered(initial_search_url, '.cnt_result, .company_popup') if use_http else None
+            if soup is not None and search_result_count(soup) > 0 and not soup.select_one('.company_popup'):
+                # 검색 결과 수는 있지만 결과 목록이 클라이언트 렌더링된 경우
+                print(f"⚠️ HTTP 응답에 '.company_popup' 요소가 없어 브라우저로 대체합니다: {initial_search_url}")
+                soup = None
+
+            if soup is None:
+                with span("saramin.browser_get", page="search"):
+                    rate_limited_get(get_driver(), initial_search_url)
+
+                # 검색 결과 페이지 로딩 대기
+                try:
+                    # `.cnt_result`는 검색 결과 수를, `.corp_name > a`는 첫 번째 회사 링크를 의미
+                    with span("saramin.wait", page="search"):
+                        WebDriverWait(driver, 10).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, '.cnt_result, .corp_name > a'))
+                        )
+                    # print("✅ 사람인 검색 결과 페이지 로딩 완료.")
+                    report_success("saramin")
+                except TimeoutException:
+                    # 검색 결과 요소가 없음 = 결과 없음 (사이트는 응답했으므로 회로 차단 실패로 집계하지 않음)
+                    report_success("saramin")
+                    print(f"❌ '{search_keyword}'에 대한 검색 결과를 찾을 수 없습니다.")
+                    return company_data
+                except Exception as e:
+                    report_failure("saramin", e)
+                    print(f"⚠️ 사람인 검색 결과 페이지 로딩 실패 또는 요소 미발견: {e}")
+                    print(f"❌ '{search_keyword}'에 대한 검색 결과를 찾을 수 없습니다.")
+                    return company_data # 검색 결과가 없으면 여기서 함수 종료
+
+                # 로드된 검색 결과 페이지 HTML 파싱
+                soup = BeautifulSoup(driver.page_source, 'html.parser')
+
+            if is_capture_enabled():
+                capture("saramin", "search", search_keyword, str(soup))
+
+            found = find_company_in_search_result(soup, search_keyword)
+            if not found:
                 return company_data
-        else: # result_count == 0인 경우 
-            print(f"❌ 검색 키워드 '{search_keyword}'에 대한 검색 결과가 0건입니다.")
-            return company_data
+            corp_name, saramin_company_url = found
+            save_resolved_url("saramin", search_keyword, saramin_company_url, corp_name)
+
+        company_data["name"] = corp_name
 
         # --- 2단계: 기업 상세 페이지로 이동하여 정보 추출 ---
         if saramin_company_url != "":
             print(f"👉 기업 상세 페이지로 이동: {saramin_company_url}")
+            detail_loaded_in_driver = False
             try:
-                driver.get(saramin_company_url)
-                WebDriverWait(driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, '.company_details')) # 상세 정보 컨테이너
-                )
-                # print("✅ 회사 상세 페이지 로딩 완료.")
-            except Exception as e:
-                print(f"⚠️ 회사 상세 페이지 로딩 실패 또는 요소 미발견 (URL: {saramin_company_url}): {e}")
-                print("크롤링을 계속 시도하지만, 정보가 불완전할 수 있습니다.")
-                pass # 실패 시에도 다음 정보 추출 로직 진행
-
-            # 상세 페이지 HTML 파싱
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+                soup = fetch_soup_if_rendered(saramin_company_url, '.company_details', strict=bool(cached)) if use_http else None
+            except StaleUrlError as e:
+                print(f"⚠️ 캐시된 링크가 유효하지 않아 다시 검색합니다: {e}")
+                invalidate_resolved_url("saramin", search_keyword)
+                return crawl_from_saramin(search_keyword, driver=driver, use_http=use_http, use_cache=False, driver_factory=driver_factory)
+
+            if soup is None:
+                try:
+                    with span("saramin.browser_get", page="detail"):
+                        rate_limited_get(get_driver(), saramin_company_url)
+                    with span("saramin.wait", page="detail"):
+                        WebDriverWait(driver, 15).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, '.company_details')) # 상세 정보 컨테이너
+                        )
+                    # print("✅ 회사 상세 페이지 로딩 완료.")
+                    if cached and urllib.parse.urlparse(driver.current_url).path != urllib.parse.urlparse(saramin_company_url).path:
+                        raise StaleUrlError(f"리다이렉트: {driver.current_url}")
+                except Exception as e:
+                    if cached:
+                        print(f"⚠️ 캐시된 링크가 유효하지 않아 다시 검색합니다: {e}")
+                        invalidate_resolved_url("saramin", search_keyword)
+                        return crawl_from_saramin(search_keyword, driver=driver, use_http=use_http, use_cache=False, driver_factory=driver_factory)
+                    report_failure("saramin", e)
+                    print(f"⚠️ 회사 상세 페이지 로딩 실패 또는 요소 미발견 (URL: {saramin_company_url}): {e}")
+                    print("크롤링을 계속 시도하지만, 정보가 불완전할 수 있습니다.")
+                    pass # 실패 시에도 다음 정보 추출 로직 진행
+
+                # 상세 페이지 HTML 파싱
+                detail_loaded_in_driver = True
+                soup = BeautifulSoup(driver.page_source, 'html.parser')
+
+            if is_capture_enabled():
+                capture("saramin", "detail", search_keyword, str(soup))
 
             # --- [기업소개] 탭에서 정보 추출 --- 
-            # 회사 유형(주식회사, 유한회사 등)
-            if "(주)" in corp_name or "(주식회사)" in corp_name:
-                company_data["company_type"] = "주식회사"
-                company_data["is_listed"] = True
-            elif "(유)" in corp_name or "(유한회사)" in corp_name:
-                company_data["company_type"] = "유한회사" 
-            else:
-                company_data["is_listed"] = False
-
-            # 직원수
-            employee_count_element = soup.select_one('.company_summary_item:nth-child(3) .box_align')
-            if employee_count_element:
-                company_data["employee_count"] = employee_count_element.select_one('.company_summary_tit').text.strip()
-
-            # 산업 분야
-            industry_element = soup.select_one('.company_details_group:nth-child(1) dd')
-            if industry_element:
-                company_data["industry"] = industry_element.text.strip()
-            
-            # 제품/서비스 명(JSON)
-            products_services_element = soup.select_one('dt:-soup-contains("브랜드명") + dd > p')
-            if products_services_element:
-                company_data["products_services"] = products_services_element.text.strip()
-
-            # CEO
-            key_executives_element = soup.select_one('.company_details_group:nth-child(2) dd')
-            if key_executives_element:
-                company_data['key_executive'] = key_executives_element.text.strip()
-
-            # 홈페이지 URL
-            homepage_element = soup.select_one('dt:-soup-contains("홈페이지") + dd > a')
-            if homepage_element:
-                company_data["homepage"] = homepage_element.get('href')
-            
-            # 회사 주소
-            address_element = soup.select_one('dt:-soup-contains("주소") + dd > p')
-            if address_element:
-                company_data["address"] = address_element.text.strip() # 주소만 출력(지도 제외)
-
-            # 설립일
-            founded_element = soup.select_one('.company_summary_item:nth-child(1) .company_summary_desc')
-            if founded_element:
-                raw_date = founded_element.text.strip() # yyyy-mm-dd 형식
-
-                company_data["established_year"] = raw_date
-                print(f"설립일 = {raw_date}")
-
-            # 회사 요약/설명
-            summary_element = soup.select_one('.company_introduce .txt')
-            if summary_element:
-                company_data["description"] = summary_element.text.strip()
-
-            # 로고 URL
-            logo_element = soup.select_one('.box_logo img')
-            if logo_element and 'src' in logo_element.attrs:
-                logo_url = logo_element['src']
-                print(f"logo_url = {logo_url}")
+            parse_company_details(soup, corp_name, company_data)
 
             # --- 3단계: 기업 상세 페이지의 [재무정보] 탭에서 재무현황 financial_history 추출 ---
-            extract_financial_info(driver, company_data)
-
-            # "financial_history" 에서 최근 매출액,영업이익,당기순이익,회계연도 출력
-            if company_data["financial_history"]:
-                latest_year = max(company_data["financial_history"].keys(), key=int)
-
-                latest_financial_data = company_data["financial_history"][latest_year]
-
-                company_data["latest_fiscal_year"] = latest_year
-                company_data["latest_revenue"] = latest_financial_data.get("매출액")
-                company_data["latest_operating_income"] = latest_financial_data.get("영업이익")
-                company_data["latest_net_income"] = latest_financial_data.get("당기순이익")
+            # 재무현황이 상세 페이지에 렌더링되어 있으면 그대로 사용하고,
+            # HTTP로 받은 상세 페이지에 재무정보 메뉴가 없으면 재무 데이터가 없는 기업으로 보고 브라우저를 쓰지 않음
+            finance_menu = has_finance_menu(soup) if not detail_loaded_in_driver else None
+            if soup.select_one('.box_finance'):
+                parse_financial_soup(soup, company_data)
+            elif finance_menu is False:
+                print(f"ℹ️ '{corp_name}' 재무정보 메뉴가 없어 재무현황 수집을 생략합니다.")
             else:
-                print("🚫 financial_history가 비어 있어 최신 재무 정보를 추출할 수 없습니다.")
+                # 재무정보 버튼 클릭은 상세 페이지가 브라우저에 열려 있어야 함
+                if not detail_loaded_in_driver:
+                    with span("saramin.browser_get", page="detail"):
+                        rate_limited_get(get_driver(), saramin_company_url)
+                extract_financial_info(driver, company_data, capture_key=search_keyword)
+
+            fill_latest_financial_info(company_data)
 
     except Exception as e:
+        report_failure("saramin", e)
         print(f"🚫 크롤링 중 치명적인 오류 발생: {e}")
         pass
 
     finally:
-        if driver:
+        if owns_driver and driver:
             driver.quit()
             print("✅ Chrome 드라이버 종료.")
 
@@ -0,0 +1,122 @@
+"""
+MySQL 저장 백엔드
+- pymysql은 MySQL 백엔드를 사용할 때만 import (SQLite만 쓰는 로컬 환경에서는 설치 불필요)
+- 여러 행을 INSERT ... ON DUPLICATE KEY UPDATE 한 문장으로 executemany 처리
+"""
+from config.setting import MYSQL_HOST, MYSQL_PORT, MYSQL_USER, MYSQL_PASSWORD, MYSQL_DATABASE
+
+# company_info 컬럼 타입 (filtering_company_info의 정제 스키마와 동일)
+COMPANY_INFO_COLUMN_TYPES = {
+    "name": "VARCHAR(100)",
+    "established_year": "INT",
+    "company_type": "VARCHAR(50)",
+    "is_listed": "BOOLEAN",
+    "homepage": "VARCHAR(255)",
+    "description": "TEXT",
+    "address": "VARCHAR(255)",
+    "industry": "JSON",
+    "products_services": "JSON",
+    "key_executive": "VARCHAR(100)",
+    "employee_count": "INT",
+    "employee_history": "JSON",
+    "latest_revenue": "DECIMAL(20,2)",
+    "latest_operating_income": "DECIMAL(20,2)",
+    "latest_net_income": "DECIMAL(20,2)",
+    "latest_fiscal_year": "INT",
+    "financial_history": "JSON",
+    "total_funding": "DECIMAL(20,2)",
+    "latest_funding_round": "VARCHAR(50)",
+    "latest_funding_date": "DATE",
+    "latest_valuation": "DECIMAL(20,2)",
+    "investment_history": "JSON",
+    "investors": "JSON",
+    "market_cap": "DECIMAL(20,2)",
+    "stock_ticker": "VARCHAR(20)",
+    "stock_exchange": "VARCHAR(50)",
+    "patent_count": "INT",
+    "trademark_count": "INT",
+    "ip_details": "JSON",
+    "tech_stack": "JSON",
+    "recent_news": "JSON",
+    "target_customers": "TEXT",
+    "competitors": "TEXT",
+    "strengths": "TEXT",
+    "risk_factors": "TEXT",
+    "recent_trends": "TEXT",
+}
+
+def connect():
+    """
+    MySQL 연결 생성 (autocommit 해제: 배치 단위로 commit)
+
+    Raises:
+        ImportError: pymysql이 설치되어 있지 않은 경우
+    """
+    try:
+        import pymysql
+    except ImportError as e:
+        raise ImportError("MySQL 백엔드를 사용하려면 pymysql을 설치해주세요. (pip install PyMySQL)") from e
+
+    return pymysql.connect(
+        host=MYSQL_HOST,
+        port=MYSQL_PORT,
+        user=MYSQL_USER,
+        password=MYSQL_PASSWORD,
+        database=MYSQL_DATABASE,
+        charset="utf8mb4",
+        autocommit=False,
+    )
+
+def create_tables(conn) -> None:
+    """
+    company_raw, company_info 테이블 생성 (없을 때만)
+    """
+    info_columns = ",\n".join(f"    `{column}` {column_type} NULL" for column, column_type in COMPANY_INFO_COLUMN_TYPES.items())
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS company_raw (
+                company_name VARCHAR(100) NOT NULL PRIMARY KEY,
+                raw_data JSON NULL,
+                updated_at DATETIME NOT NULL
+            ) DEFAULT CHARSET=utf8mb4
+        """)
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS company_info (
+                company_name VARCHAR(100) NOT NULL PRIMARY KEY,
+            {info_columns},
+                updated_at DATETIME NOT NULL
+            ) DEFAULT CHARSET=utf8mb4
+        """)
+    conn.commit()
+
+def upsert_many(conn, table: str, key_column: str, columns: list, rows: list) -> None:
+    """
+    여러 행을 한 번에 upsert (키가 이미 있으면 나머지 컬럼 갱신). commit은 호출한 쪽에서 수행.
+
+    Args:
+        conn: connect()로 만든 연결
+        table (str): 테이블명
+        key_column (str): 기본 키 컬럼명
+        columns (list): 저장할 컬럼명 (key_column 포함, rows의 값 순서와 동일)
+        rows (list): 값 튜플 리스트
+    """
+    column_sql = ", ".join(f"`{column}`" for column in columns)
+    placeholders = ", ".join(["%s"] * len(columns))
+    update_sql = ", ".join(f"`{column}` = VALUES(`{column}`)" for column in columns if column != key_column)
+    sql = f"INSERT INTO `{table}` ({column_sql}) VALUES ({placeholders}) ON DUPLICATE KEY UPDATE {update_sql}"
+    with conn.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+def existing_keys(conn, table: str, key_column: str, keys: list) -> set:
+    """
+    keys 중 테이블에 이미 있는 키 조회
+    """
+    found = set()
+    keys = list(keys)
+    with conn.cursor() as cursor:
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(f"SELECT `{key_column}` FROM `{table}` WHERE `{key_column}` IN ({placeholders})", chunk)
+            found.update(row[0] for row in cursor.fetchall())
+    return found
@@ -0,0 +1,205 @@
+"""
+수집 결과(raw/정제 데이터)를 모아서 DB에 일괄 저장하는 sink
+- 기업마다 INSERT하지 않고 DB_BATCH_SIZE 개씩 모아 executemany로 upsert
+- 한 번의 flush는 하나의 트랜잭션 (실패 시 rollback 후 버퍼 유지)
+- 백엔드: "mysql" (db/db_mysql.py), "sqlite" (db/db_sqlite.py, 로컬 테스트용)
+- 변경 감지 결과(delta)가 있으면 바뀐 컬럼만 upsert하고, 변경이 없는 기업은 저장하지 않음
+  (변경 감지 상태는 대상 DB와 별도 파일이므로, flush 시 대상 DB에 행이 없는 기업은 전체 컬럼을 저장)
+"""
+import json
+import threading
+import time
+
+from common.common_field_template import COMPANY_FIELDS
+from config.setting import DB_BACKEND, DB_BATCH_SIZE
+from filtering.change_detection import save_fingerprints
+
+RAW_COLUMNS = ["company_name", "raw_data", "updated_at"]
+INFO_COLUMNS = ["company_name", *COMPANY_FIELDS, "updated_at"]
+
+def get_backend(name: str = DB_BACKEND):
+    """
+    백엔드 이름으로 백엔드 모듈 반환 (connect / create_tables / upsert_many / existing_keys 제공)
+    """
+    if name == "mysql":
+        from db import db_mysql
+        return db_mysql
+    if name == "sqlite":
+        from db import db_sqlite
+        return db_sqlite
+    raise ValueError(f"지원하지 않는 DB_BACKEND: {name} (mysql, sqlite 중 선택)")
+
+def _to_column_value(value):
+    # 정제되지 않은 dict/list 값은 JSON 문자열로 저장
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False) if value else None
+    return value
+
+class DatabaseSink:
+    """
+    raw/정제 데이터 일괄 저장기
+
+    Example:
+        with DatabaseSink() as sink:
+            for name in company_names:
+                sink.add_result(name, run_company_pipeline(name))
+        # with 블록을 벗어날 때 남은 데이터 flush 후 연결 종료
+    """
+    def __init__(self, backend: str = DB_BACKEND, batch_size: int = DB_BATCH_SIZE):
+        self.backend = get_backend(backend)
+        self.batch_size = max(1, batch_size)
+        self._raw_rows = {}
+        self._info_rows = {} # 기업명 → (정제 데이터, 변경 내역 또는 None, 함께 저장할 raw 데이터 또는 None)
+        self.skipped = 0 # 변경이 없어 저장하지 않은 기업 수
+        self._lock = threading.Lock()
+        self._conn = self.backend.connect()
+        self.backend.create_tables(self._conn)
+
+    def add_raw(self, company_name: str, raw_data: dict) -> None:
+        """
+        사이트별 원본 데이터 추가 (같은 기업이 버퍼에 있으면 최신 값으로 교체)
+        """
+        with self._lock:
+            self._raw_rows[company_name] = self._raw_row(company_name, raw_data)
+        self._flush_if_full()
+
+    def add_company_info(self, company_name: str, filtered_data: dict, delta: dict = None) -> None:
+        """
+        정제 데이터 추가 (filtering_company_info 결과)
+
+        Args:
+            delta (dict, optional): compute_delta() 결과. 있으면 변경된 컬럼만 저장하고, 변경이 없으면 저장하지 않음.
+                                    (대상 DB에 행이 없으면 delta와 관계없이 전체 컬럼 저장)
+        """
+        with self._lock:
+            self._info_rows[company_name] = (filtered_data, delta, None)
+        self._flush_if_full()
+
+    def add_result(self, company_name: str, result: dict) -> None:
+        """
+        run_company_pipeline 결과의 raw/정제 데이터를 함께 추가 (같은 트랜잭션으로 저장됨)
+        result에 변경 감지 결과("delta")가 있고 변경이 없으면 raw/정제 데이터 모두 저장하지 않음
+        """
+        with self._lock:
+            self._info_rows[company_name] = (result["filtered"], result.get("delta"), result["raw"])
+        self._flush_if_full()
+
+    def _build_info_rows(self, info_items: list, existing: set) -> tuple:
+        """
+        버퍼의 정제 데이터를 저장할 행으로 변환
+
+        Returns:
+            tuple: (info_rows [(컬럼 tuple, 값 tuple)], raw_rows, 저장 후 fingerprint를 갱신할 deltas, 건너뛴 기업 수)
+        """
+        info_rows, raw_rows, deltas, skipped = [], [], {}, 0
+        for company_name, (filtered_data, delta, raw_data) in info_items:
+            if delta is None or delta["is_new"] or company_name not in existing:
+                # 새 기업이거나 대상 DB에 행이 없음 (DB 초기화, 백엔드/경로 변경 등) → 전체 컬럼 저장
+                info_rows.append((tuple(INFO_COLUMNS), self._info_row(company_name, filtered_data)))
+            elif not delta["changed"]:
+                skipped += 1
+                continue
+            else:
+                changed = [key for key in COMPANY_FIELDS if key in delta["changed_fields"]]
+                row = (company_name, *(_to_column_value(filtered_data.get(key)) for key in changed), time.strftime("%Y-%m-%d %H:%M:%S"))
+                info_rows.append((("company_name", *changed, "updated_at"), row))
+
+            if raw_data is not None:
+                raw_rows.append(self._raw_row(company_name, raw_data))
+            if delta is not None:
+                deltas[company_name] = delta
+        return info_rows, raw_rows, deltas, skipped
+
+    @staticmethod
+    def _raw_row(company_name: str, raw_data: dict) -> tuple:
+        return (company_name, json.dumps(raw_data, ensure_ascii=False), time.strftime("%Y-%m-%d %H:%M:%S"))
+
+    @staticmethod
+    def _info_row(company_name: str, filtered_data: dict) -> tuple:
+        return (
+            company_name,
+            *(_to_column_value(filtered_data.get(key)) for key in COMPANY_FIELDS),
+            time.strftime("%Y-%m-%d %H:%M:%S"),
+        )
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return max(len(self._raw_rows), len(self._info_rows))
+
+    def _flush_if_full(self) -> None:
+        if self.pending_count() >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        버퍼의 데이터를 하나의 트랜잭션으로 저장
+
+        Returns:
+            int: 저장한 행 수 (raw + company_info)
+
+        Raises:
+            Exception: DB 오류 (rollback 후 버퍼는 유지되어 다음 flush에서 다시 시도)
+        """
+        with self._lock:
+            info_items = list(self._info_rows.items())
+            if not self._raw_rows and not info_items:
+                return 0
+
+            try:
+                # 변경 감지 결과가 있는 기업은 대상 DB에 행이 있을 때만 변경 컬럼 저장/건너뛰기
+                check_names = [name for name, (_, delta, _) in info_items if delta is not None and not delta["is_new"]]
+                existing = self.backend.existing_keys(self._conn, "company_info", "company_name", check_names) if check_names else set()
+                info_rows, result_raw_rows, deltas, skipped = self._build_info_rows(info_items, existing)
+                raw_rows = list(self._raw_rows.values()) + result_raw_rows
+
+                # 저장할 컬럼 구성이 같은 행끼리 묶어서 executemany
+                info_groups = {}
+                for columns, row in info_rows:
+                    info_groups.setdefault(columns, []).append(row)
+
+                if raw_rows:
+                    self.backend.upsert_many(self._conn, "company_raw", "company_name", RAW_COLUMNS, raw_rows)
+                for columns, rows in info_groups.items():
+                    self.backend.upsert_many(self._conn, "company_info", "company_name", list(columns), rows)
+                self._conn.commit()
+            except Exception as e:
+                self._conn.rollback()
+                print(f"❌ DB 저장 실패 (rollback, raw {len(self._raw_rows)}건 / 정제 데이터 {len(info_items)}건 보류): {e}")
+                raise
+
+            save_fingerprints(deltas)
+            self.skipped += skipped
+            self._raw_rows.clear()
+            self._info_rows.clear()
+
+        print(f"💾 DB 저장: raw {len(raw_rows)}건, company_info {len(info_rows)}건 (변경 없음 누적 {self.skipped}건)")
+        return len(raw_rows) + len(info_rows)
+
+    def close(self) -> None:
+        """
+        남은 데이터 flush 후 연결 종료
+        """
+        try:
+            self.flush()
+        finally:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def save_raw_data(company_name: str, raw_data: dict, backend: str = DB_BACKEND) -> None:
+    """
+    기업 하나의 원본 데이터 즉시 저장 (단건 실행용, 배치는 DatabaseSink 사용)
+    """
+    with DatabaseSink(backend, batch_size=1) as sink:
+        sink.add_raw(company_name, raw_data)
+
+def save_company_info(company_name: str, filtered_data: dict, backend: str = DB_BACKEND) -> None:
+    """
+    기업 하나의 정제 데이터 즉시 저장 (단건 실행용, 배치는 DatabaseSink 사용)
+    """
+    with DatabaseSink(backend, batch_size=1) as sink:
+        sink.add_company_info(company_name, filtered_data)
@@ -0,0 +1,73 @@
+"""
+SQLite 저장 백엔드 (로컬 테스트용, MySQL과 같은 테이블/컬럼 구조)
+- decimal(20,2) 금액은 정밀도 유지를 위해 문자열로 저장
+- json 컬럼은 JSON 문자열(TEXT)로 저장
+"""
+import os
+import sqlite3
+from decimal import Decimal
+
+from config.setting import SQLITE_DB_PATH
+from db.db_mysql import COMPANY_INFO_COLUMN_TYPES
+
+sqlite3.register_adapter(Decimal, str)
+
+def connect(path: str = SQLITE_DB_PATH):
+    """
+    SQLite 연결 생성 (배치 단위로 commit)
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return sqlite3.connect(path, timeout=30)
+
+def create_tables(conn) -> None:
+    """
+    company_raw, company_info 테이블 생성 (없을 때만)
+    """
+    info_columns = ",\n".join(f"    {column}" for column in COMPANY_INFO_COLUMN_TYPES)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS company_raw (
+            company_name TEXT NOT NULL PRIMARY KEY,
+            raw_data TEXT,
+            updated_at TEXT NOT NULL
+        )
+    """)
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS company_info (
+            company_name TEXT NOT NULL PRIMARY KEY,
+        {info_columns},
+            updated_at TEXT NOT NULL
+        )
+    """)
+    conn.commit()
+
+def upsert_many(conn, table: str, key_column: str, columns: list, rows: list) -> None:
+    """
+    여러 행을 한 번에 upsert (키가 이미 있으면 나머지 컬럼 갱신). commit은 호출한 쪽에서 수행.
+
+    Args:
+        conn: connect()로 만든 연결
+        table (str): 테이블명
+        key_column (str): 기본 키 컬럼명
+        columns (list): 저장할 컬럼명 (key_column 포함, rows의 값 순서와 동일)
+        rows (list): 값 튜플 리스트
+    """
+    column_sql = ", ".join(f'"{column}"' for column in columns)
+    placeholders = ", ".join(["?"] * len(columns))
+    update_sql = ", ".join(f'"{column}" = excluded."{column}"' for column in columns if column != key_column)
+    sql = f'INSERT INTO "{table}" ({column_sql}) VALUES ({placeholders}) ON CONFLICT("{key_column}") DO UPDATE SET {update_sql}'
+    conn.executemany(sql, rows)
+
+def existing_keys(conn, table: str, key_column: str, keys: list) -> set:
+    """
+    keys 중 테이블에 이미 있는 키 조회 (SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회)
+    """
+    found = set()
+    keys = list(keys)
+    for start in range(0, len(keys), 500):
+        chunk = keys[start:start + 500]
+        placeholders = ", ".join(["?"] * len(chunk))
+        rows = conn.execute(f'SELECT "{key_column}" FROM "{table}" WHERE "{key_column}" IN ({placeholders})', chunk).fetchall()
+        found.update(row[0] for row in rows)
+    return found
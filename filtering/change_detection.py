@@ -0,0 +1,154 @@
+"""
+정제 데이터 변경 감지 (이전 수집 결과 대비 바뀐 필드만 추출)
+- 필드별 해시와 기업별 fingerprint(필드 해시 전체의 해시)를 SQLite에 저장
+- fingerprint가 같으면 필드 비교 없이 "변경 없음"으로 판단
+- 저장된 상태는 DB 저장이 끝난 뒤 save_fingerprints()로 갱신 (저장 실패 시 다음 실행에서 다시 변경으로 감지)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from common.common_field_template import COMPANY_FIELDS
+from common.json_output import decimal_default_encoder
+from common.tracing import traced
+from config.setting import CHANGE_DETECTION_ENABLED, CHANGE_STATE_PATH
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS company_fingerprint (
+    company_name TEXT NOT NULL PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    field_hashes TEXT NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+_initialized_paths = set()
+
+def _connect():
+    """
+    상태 DB 연결 생성 (호출마다 새 연결: 스레드/프로세스 간에 연결을 공유하지 않음)
+    """
+    directory = os.path.dirname(CHANGE_STATE_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(CHANGE_STATE_PATH, timeout=30)
+    if CHANGE_STATE_PATH not in _initialized_paths:
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.commit()
+        _initialized_paths.add(CHANGE_STATE_PATH)
+    return conn
+
+def hash_value(value) -> str:
+    """
+    필드 값 하나의 해시 (Decimal은 문자열로, dict는 키 정렬 후 직렬화)
+    """
+    serialized = json.dumps(value, ensure_ascii=False, sort_keys=True, default=decimal_default_encoder)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()[:16]
+
+def field_hashes(record: dict) -> dict:
+    """
+    기본 템플릿 필드별 해시 (템플릿 순서)
+    """
+    return {key: hash_value(record.get(key)) for key in COMPANY_FIELDS}
+
+def record_fingerprint(hashes: dict) -> str:
+    """
+    필드 해시 전체를 하나로 묶은 기업 fingerprint
+    """
+    return hashlib.sha1("|".join(hashes[key] for key in COMPANY_FIELDS).encode("utf-8")).hexdigest()
+
+def load_fingerprint(company_name: str):
+    """
+    저장된 fingerprint와 필드 해시 조회
+
+    Returns:
+        tuple: (fingerprint, field_hashes dict). 저장된 상태가 없거나 조회에 실패하면 None.
+    """
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT fingerprint, field_hashes FROM company_fingerprint WHERE company_name = ?",
+                (company_name,),
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"⚠️ 변경 감지 상태 조회 오류: {e}")
+        return None
+
+    if not row:
+        return None
+    return row[0], json.loads(row[1])
+
+@traced("change_detection")
+def compute_delta(company_name: str, filtered_data: dict) -> dict:
+    """
+    정제 데이터를 이전 수집 결과와 비교하여 변경된 필드 추출
+
+    Args:
+        company_name (str): 수집한 기업명 (DB의 company_name 키와 동일)
+        filtered_data (dict): filtering_company_info 결과
+
+    Returns:
+        dict: 변경 내역
+            {
+                'is_new': bool,           # 이전 상태가 없음 (전체 필드 저장 필요)
+                'changed': bool,          # 저장할 변경 사항 존재 여부
+                'changed_fields': dict,   # 변경된 필드명 → 새 값 (is_new면 전체 필드)
+                'fingerprint': str,
+                'field_hashes': dict
+            }
+    """
+    hashes = field_hashes(filtered_data)
+    fingerprint = record_fingerprint(hashes)
+    delta = {
+        "is_new": True,
+        "changed": True,
+        "changed_fields": {key: filtered_data.get(key) for key in COMPANY_FIELDS},
+        "fingerprint": fingerprint,
+        "field_hashes": hashes,
+    }
+    if not CHANGE_DETECTION_ENABLED:
+        return delta
+
+    stored = load_fingerprint(company_name)
+    if stored is None:
+        return delta
+
+    stored_fingerprint, stored_hashes = stored
+    delta["is_new"] = False
+    if stored_fingerprint == fingerprint:
+        delta["changed"] = False
+        delta["changed_fields"] = {}
+        return delta
+
+    delta["changed_fields"] = {
+        key: filtered_data.get(key) for key in COMPANY_FIELDS if stored_hashes.get(key) != hashes[key]
+    }
+    delta["changed"] = bool(delta["changed_fields"])
+    return delta
+
+def save_fingerprints(deltas: dict) -> None:
+    """
+    DB 저장이 끝난 기업들의 fingerprint를 한 번에 갱신
+
+    Args:
+        deltas (dict): 기업명 → compute_delta() 결과
+    """
+    if not CHANGE_DETECTION_ENABLED or not deltas:
+        return
+
+    now = time.time()
+    rows = [
+        (company_name, delta["fingerprint"], json.dumps(delta["field_hashes"]), now)
+        for company_name, delta in deltas.items()
+    ]
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO company_fingerprint (company_name, fingerprint, field_hashes, updated_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+    except sqlite3.Error as e:
+        print(f"⚠️ 변경 감지 상태 저장 오류: {e}")
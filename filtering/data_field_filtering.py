@@ -4,14 +4,104 @@
 import json
 import re
 from decimal import Decimal, InvalidOperation
-from copy import deepcopy
-from common.common_field_template import basic_template
+from functools import lru_cache
+from common.common_field_template import new_company_data
+from common.tracing import traced
+
+# 금액 문자열 정규화: 공백, 쉼표, '원' 제거 (한 번의 translate로 처리)
+_CURRENCY_STRIP_TABLE = str.maketrans("", "", " ,원")
+
+# 정규화된 금액 문자열 패턴: [-][N조][N억][N만][N] (정수만, 각 단위는 최대 한 번)
+_CURRENCY_PATTERN = re.compile(r'(-?)(?:(\d+)조)?(?:(\d+)억)?(?:(\d+)만)?(\d*)', re.ASCII) # 전각 등 유니코드 숫자는 기존 구현과 같이 0 처리
+
+# fast path에서 정확히 표현 가능한 최대값 (Decimal 기본 정밀도 28자리 이내)
+_FAST_PATH_LIMIT = 10 ** 27
+
+def _parse_currency_int(currency_str: str):
+    """
+    금액 문자열을 정수(원)로 변환하는 single-pass tokenizer.
+    패턴에 맞지 않으면 None (일반 경로에서 처리)
+
+    Returns:
+        tuple: (is_negative, value). 패턴 불일치 시 None
+    """
+    match = _CURRENCY_PATTERN.fullmatch(currency_str.strip().translate(_CURRENCY_STRIP_TABLE))
+    if not match:
+        return None
+    sign, jo, eok, man, rest = match.groups()
+    value = (
+        int(jo or 0) * 1000000000000
+        + int(eok or 0) * 100000000
+        + int(man or 0) * 10000
+        + int(rest or 0)
+    )
+    if value >= _FAST_PATH_LIMIT:
+        return None
+    return bool(sign), value
+
+@lru_cache(maxsize=4096)
+def _korean_currency_to_number_cached(currency_str: str):
+    parsed = _parse_currency_int(currency_str)
+    if parsed is None:
+        return _korean_currency_to_number_slow(currency_str)
+    is_negative, value = parsed
+    total_value = Decimal(value)
+    return -total_value if is_negative else total_value
 
 # 금액 단위 숫자 변환
 def korean_currency_to_number(currency_str):
     """
     한국 숫자 단위를 포함하는 금액 문자열을 Decimal 타입 숫자로 변환.
     예: "1조 4천억 원", "1,123억 8천만원", "- 262억 4,876만원"
+    - 조/억/만/원 정수 금액은 미리 컴파일한 패턴으로 한 번에 변환, 그 외 형식은 일반 경로로 변환
+    - 같은 문자열의 변환 결과는 LRU 캐시에 보관 (Decimal은 불변이므로 공유해도 안전)
+    """
+    if not isinstance(currency_str, str) or not currency_str.strip():
+        return None
+    return _korean_currency_to_number_cached(currency_str)
+
+def korean_currency_to_int(currency_str):
+    """
+    금액 문자열을 정수(원)로 변환 (Decimal을 거치지 않는 fast path).
+    fast path 패턴에 맞지 않는 형식은 Decimal 변환 후 정수로 변환 (소수점 이하 원 단위는 버림).
+    예: "- 262억 4,876만원" -> -26248760000
+    """
+    if not isinstance(currency_str, str) or not currency_str.strip():
+        return None
+    parsed = _parse_currency_int(currency_str)
+    if parsed is not None:
+        is_negative, value = parsed
+        return -value if is_negative else value
+    return int(_korean_currency_to_number_cached(currency_str))
+
+def convert_financial_history(financial_history: dict, as_int: bool = False) -> dict:
+    """
+    연도 × 재무 항목 테이블의 금액 문자열을 한 번에 숫자 문자열로 변환.
+    예: {"2023": {"매출액": "1억 2,000만원"}} -> {"2023": {"매출액": "120000000"}}
+
+    Args:
+        financial_history (dict): {연도: {항목: 금액 문자열}}
+        as_int (bool): True면 정수 fast path(korean_currency_to_int) 사용
+
+    Returns:
+        dict: {연도: {항목: 숫자 문자열 또는 None}}
+    """
+    convert = korean_currency_to_int if as_int else korean_currency_to_number
+    converted = {}
+    for year, data in financial_history.items():
+        year_data = {}
+        for key, value in data.items():
+            number = convert(value)
+            year_data[key] = str(number) if number is not None else None
+        converted[year] = year_data
+    return converted
+
+# 금액 단위 숫자 변환 (일반 경로)
+def _korean_currency_to_number_slow(currency_str):
+    """
+    한국 숫자 단위를 포함하는 금액 문자열을 Decimal 타입 숫자로 변환.
+    예: "1조 4천억 원", "1,123억 8천만원", "- 262억 4,876만원"
+    소수점, '천' 등 fast path 패턴에 맞지 않는 형식을 처리.
     """
     if not isinstance(currency_str, str) or not currency_str.strip():
         return None
@@ -93,11 +183,12 @@ def to_json_string(data):
     except TypeError:
         return None
 
+@traced("filtering_company_info")
 def filtering_company_info(integration_result: dict) -> dict:
     """
     통합된 기업 정보를 MySQL 스키마에 맞춰 정제.
     """
-    final_data = deepcopy(basic_template) # 최종 정제 데이터
+    final_data = new_company_data() # 최종 정제 데이터
 
     # name : varchar(100) 
     final_data['name'] = integration_result.get('name', '').strip()
@@ -170,12 +261,7 @@ def filtering_company_info(integration_result: dict) -> dict:
 
     # financial_history: json 
     # 내부 값도 숫자로 변환하여 저장
-    financial_history_data = {}
-    for year, data in integration_result.get('financial_history', {}).items():
-        year_data = {}
-        for key, value in data.items():
-            year_data[key] = str(korean_currency_to_number(value)) if korean_currency_to_number(value) is not None else None
-        financial_history_data[year] = year_data
+    financial_history_data = convert_financial_history(integration_result.get('financial_history', {}))
     final_data['financial_history'] = to_json_string(financial_history_data)
 
     # total_funding: decimal(20,2)
@@ -0,0 +1,146 @@
+"""
+여러 사이트의 수집 데이터를 하나로 병합하는 엔진
+- 필드별 병합 규칙을 모듈 로딩 시 한 번만 컴파일 (필드마다 key 비교 분기를 반복하지 않음)
+- 소스 개수에 제한이 없음 (우선순위 순서로 전달, 앞쪽 소스의 값이 우선)
+- 기업 여러 개를 한 번에 병합하는 배치 API 제공
+
+병합 규칙:
+- first_non_empty: 우선순위 순서로 처음 나오는 비어있지 않은 값 (모두 비어 있으면 기본 템플릿 값)
+- any_true: 하나라도 True면 True (is_listed)
+- per_year_fill: 연도별로 병합, 앞쪽 소스에 없는 연도/항목만 뒤쪽 소스 값으로 보완 (financial_history)
+"""
+from common.common_field_template import COMPANY_FIELDS, basic_template, empty_field_value, new_company_data
+from common.tracing import traced
+
+# 사이트 우선순위 (raw_dict 병합 시 이 순서대로 우선, 목록에 없는 사이트는 뒤에 추가)
+SOURCE_PRIORITY = ("jobkorea", "saramin")
+
+# 기본 규칙(first_non_empty) 이외의 규칙을 사용하는 필드
+FIELD_RULES = {
+    "is_listed": "any_true",
+    "financial_history": "per_year_fill",
+}
+
+# 빈 값으로 판단하는 값
+_EMPTY_VALUES = ("", None, {}, [], "null")
+
+def is_empty(value) -> bool:
+    return value in _EMPTY_VALUES
+
+def _compile_first_non_empty(key: str):
+    default = basic_template[key]
+    mutable_default = isinstance(default, (dict, list))
+
+    def merge(sources):
+        for source in sources:
+            value = source.get(key)
+            if value not in _EMPTY_VALUES:
+                return value
+        return empty_field_value(key) if mutable_default else default
+    return merge
+
+def _compile_any_true(key: str):
+    def merge(sources):
+        for source in sources:
+            if source.get(key):
+                return True
+        return False
+    return merge
+
+def _compile_per_year_fill(key: str):
+    def merge(sources):
+        merged = {}
+        for source in sources:
+            history = source.get(key)
+            if not isinstance(history, dict):
+                continue
+            for year, year_data in history.items():
+                if year not in merged:
+                    merged[year] = year_data.copy() if isinstance(year_data, dict) else year_data
+                    continue
+                merged_year = merged[year]
+                for metric, value in year_data.items():
+                    if metric not in merged_year or merged_year[metric] in _EMPTY_VALUES:
+                        merged_year[metric] = value
+        return merged
+    return merge
+
+_RULE_COMPILERS = {
+    "first_non_empty": _compile_first_non_empty,
+    "any_true": _compile_any_true,
+    "per_year_fill": _compile_per_year_fill,
+}
+
+def compile_merge_rules(field_rules: dict = None) -> tuple:
+    """
+    필드별 병합 규칙 테이블 생성 (기본 템플릿 필드 순서)
+
+    Args:
+        field_rules (dict, optional): 필드명 → 규칙명. 지정하지 않은 필드는 first_non_empty. 없으면 FIELD_RULES 사용.
+
+    Returns:
+        tuple: (필드명, 병합 함수) 튜플 목록. 병합 함수는 소스 dict 리스트를 받아 병합 값을 반환.
+
+    Raises:
+        ValueError: 알 수 없는 규칙명이 있는 경우
+    """
+    field_rules = FIELD_RULES if field_rules is None else field_rules
+    rules = []
+    for key in COMPANY_FIELDS:
+        rule_name = field_rules.get(key, "first_non_empty")
+        if rule_name not in _RULE_COMPILERS:
+            raise ValueError(f"알 수 없는 병합 규칙: {key}={rule_name}")
+        rules.append((key, _RULE_COMPILERS[rule_name](key)))
+    return tuple(rules)
+
+_DEFAULT_RULES = compile_merge_rules()
+
+def _valid_sources(sources) -> list:
+    # 데이터 수집이 실패된 소스 제외 (dict가 아니거나, 에러 포함, 빈 딕셔너리)
+    return [source for source in sources if isinstance(source, dict) and source and "error" not in source]
+
+def merge_sources(sources: list, rules: tuple = None) -> dict:
+    """
+    여러 소스의 회사 정보를 우선순위 순서로 병합
+
+    Args:
+        sources (list): 회사 정보 dict 리스트 (앞쪽일수록 우선)
+        rules (tuple, optional): compile_merge_rules()로 만든 규칙 테이블. 없으면 기본 규칙.
+
+    Returns:
+        dict: 병합된 회사 정보. 모든 소스가 실패한 경우 기본 템플릿.
+    """
+    sources = _valid_sources(sources)
+    if not sources:
+        return new_company_data()
+
+    return {key: merge(sources) for key, merge in (rules or _DEFAULT_RULES)}
+
+def merge_batch(source_lists, rules: tuple = None) -> list:
+    """
+    여러 기업을 한 번에 병합
+
+    Args:
+        source_lists (iterable): 기업별 소스 리스트. ex: zip(jobkorea_results, saramin_results)
+        rules (tuple, optional): compile_merge_rules()로 만든 규칙 테이블
+
+    Returns:
+        list: 기업별 병합 결과 (입력 순서)
+    """
+    rules = rules or _DEFAULT_RULES
+    return [merge_sources(sources, rules) for sources in source_lists]
+
+def order_site_results(raw_dict: dict) -> list:
+    """
+    raw_dict({'jobkorea': dict, 'saramin': dict, ...})를 SOURCE_PRIORITY 순서의 소스 리스트로 변환
+    """
+    ordered = [raw_dict[site] for site in SOURCE_PRIORITY if site in raw_dict]
+    ordered.extend(data for site, data in raw_dict.items() if site not in SOURCE_PRIORITY)
+    return ordered
+
+@traced("merge_site_results")
+def merge_site_results(raw_dict: dict) -> dict:
+    """
+    사이트별 수집 결과(raw_dict)를 사이트 우선순위대로 병합
+    """
+    return merge_sources(order_site_results(raw_dict))
@@ -1,51 +1,165 @@
 # main.py
-from crawl.jobkorea import smart_crawl_jobkorea
-from crawl.ooai import enrich_company_data
-from crawl.saramin import crawl_from_saramin
-# from db.db_mysql import save_raw_data
-from integration.integration_company_info import merge_company_info
-from filtering.data_field_filtering import filtering_company_info
-from decimal import Decimal, InvalidOperation
+from pipeline.company_pipeline import run_company_pipeline
+from pipeline.batch_runner import load_company_names, run_batch
+from pipeline.staged_pipeline import run_staged
+from pipeline.work_queue import open_work_queue, run_queue_workers
+from pipeline.checkpoint import load_completed_results
+from config.setting import BATCH_WORKERS, DB_SAVE_ENABLED, OUTPUT_FORMAT, OUTPUT_STAGES, WORK_QUEUE_URL
+from common.tracing import profile_run
+from common.company_record import CompanyRecord
+from common.json_output import decimal_default_encoder, NdjsonWriter
+from db.db_sink import DatabaseSink
+import argparse
 import json
+import sys
 
-company_name = input("회사명을 입력하세요: ")
+def run_single(company_name: str, output_format: str = OUTPUT_FORMAT, ndjson_path: str = None):
+    """
+    기업 한 곳에 대해 파이프라인을 실행하고 단계별 결과를 출력
+    output_format이 "ndjson"이면 OUTPUT_STAGES 단계를 한 줄씩 ndjson_path(없으면 stdout)에 기록
+    """
+    if output_format == "ndjson":
+        # 파이프라인 실행 전에 열어야 stdout 출력 시 실행 중 로그가 stderr로 분리됨
+        with NdjsonWriter(ndjson_path, OUTPUT_STAGES) as writer:
+            result = run_company_pipeline(company_name)
+            writer.write_result(company_name, result)
+    else:
+        result = run_company_pipeline(company_name)
+        print_pretty_result(result)
 
-# 각 사이트 크롤링
-jobkorea_data = smart_crawl_jobkorea(company_name)
-saramin_data = crawl_from_saramin(company_name)
+    # raw/정제 데이터 DB 저장 (DB_SAVE_ENABLED 설정 시)
+    if DB_SAVE_ENABLED:
+        with DatabaseSink(batch_size=1) as sink:
+            sink.add_result(company_name, result)
 
-# raw 데이터 통합
-raw_dict = {
-    "jobkorea" : jobkorea_data,
-    "saramin" : saramin_data
-}
+def print_pretty_result(result: dict):
+    """
+    단계별 결과를 들여쓰기 JSON으로 출력
+    """
+    print("raw 데이터=" + json.dumps(result["raw"], indent=2, ensure_ascii=False) + "\n")
 
-# raw 데이터 DB 저장
-# company_id = save_raw_data(company_name, raw_dict)
-print("raw 데이터=" + json.dumps(raw_dict, indent=2, ensure_ascii=False) + "\n")
+    # 병합 결과 출력 (작업 완료 시, 삭제)
+    print("병합 데이터 출력=" + json.dumps(result["merged"], indent=2, ensure_ascii=False) + "\n")
 
-# 수집 데이터 병합
-integration_result = merge_company_info(jobkorea_data, saramin_data)
+    print("\n=== 정제된 회사 정보 ===\n")
+    print(json.dumps(result["filtered"], indent=2, ensure_ascii=False, default=decimal_default_encoder))
+    print("\n========================\n")
 
-# 병합 결과 출력 (작업 완료 시, 삭제)
-print("병합 데이터 출력=" + json.dumps(integration_result, indent=2, ensure_ascii=False) + "\n")
+def make_result_collector(writer=None, sink=None, records: list = None, flush_each: bool = False):
+    """
+    배치/작업 큐 실행의 on_result 콜백 생성 (성공한 기업만 ndjson 출력, DB 저장, CompanyRecord 목록에 추가)
+    flush_each=True면 기업마다 DB에 바로 저장 (작업 큐는 콜백이 끝나면 완료 처리하므로 저장까지 마쳐야 함)
+    """
+    def collect(outcome):
+        if not outcome["ok"]:
+            return
+        if records is not None:
+            records.append(CompanyRecord.from_dict(outcome["result"]["filtered"]))
+        if writer:
+            writer.write_result(outcome["company_name"], outcome["result"])
+        if sink:
+            sink.add_result(outcome["company_name"], outcome["result"])
+            if flush_each:
+                sink.flush()
 
-# 병합 결과에서 oo.ai 크롤링으로 정성적인 필드 정보 수집
-ooai_data_result = enrich_company_data(integration_result.get('name'), integration_result)
+    return collect
 
-# JSON 직렬화 시 Decimal 객체를 처리하기 위한 사용자 정의 함수
-def decimal_default_encoder(obj):
-    if isinstance(obj, Decimal):
-        # Decimal 객체를 float 또는 str으로 변환.
-        # 정밀도를 유지하려면 str이 더 안전합니다.
-        return str(obj) 
-    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+def run_batch_file(file_path: str, workers: int, output_path: str = None,
+                   output_format: str = OUTPUT_FORMAT, ndjson_path: str = None, staged: bool = False,
+                   checkpoint_run: str = None):
+    """
+    기업명 목록 파일에 대해 배치 파이프라인을 실행
+    staged=True면 프로세스 풀 대신 단계별 워커/큐 파이프라인(run_staged)으로 실행 (워커 수는 STAGED_* 설정)
+    output_path가 주어지면 정제 데이터 목록을 JSON 파일로 저장
+    output_format이 "ndjson"이면 기업 하나가 끝날 때마다 단계별 결과를 한 줄씩 ndjson_path(없으면 stdout)에 기록
+    DB_SAVE_ENABLED 설정 시 raw/정제 데이터를 DB_BATCH_SIZE 개씩 모아 DB에 저장
+    (결과는 저장 전까지 CompanyRecord로 보관하여 대량 배치의 메모리 사용량을 줄임)
+    checkpoint_run이 주어지면 같은 ID로 이전에 중단된 실행을 이어서 진행
+    (이전 실행에서 완료된 기업은 다시 수집/저장하지 않고, output_path 결과 파일에는 저널의 정제 데이터로 포함)
+    """
+    company_names = load_company_names(file_path)
+    filtered_results = [] if output_path else None
+    if output_path and checkpoint_run:
+        filtered_results.extend(CompanyRecord.from_dict(filtered) for _, filtered in load_completed_results(checkpoint_run, company_names))
+    sink = DatabaseSink() if DB_SAVE_ENABLED else None
+    writer = NdjsonWriter(ndjson_path, OUTPUT_STAGES) if output_format == "ndjson" else None
+    collect = make_result_collector(writer, sink, filtered_results)
 
-# 정제 로직 실행
-filtered_data = filtering_company_info(ooai_data_result)
-print("\n=== 정제된 회사 정보 ===\n")
-print(json.dumps(filtered_data, indent=2, ensure_ascii=False, default=decimal_default_encoder))
-print("\n========================\n")
+    try:
+        if staged:
+            summary = run_staged(company_names, on_result=collect, checkpoint_run=checkpoint_run)
+        else:
+            summary = run_batch(company_names, workers=workers, on_result=collect, checkpoint_run=checkpoint_run)
+    finally:
+        if writer:
+            writer.close()
+        if sink:
+            sink.close()
 
-# 정제된 데이터 DB 저장
-# company_id = save_raw_data(company_name, filtered_data)
\ No newline at end of file
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump([record.to_dict() for record in filtered_results], f, indent=2, ensure_ascii=False, default=decimal_default_encoder)
+        print(f"💾 정제 데이터 {len(filtered_results)}건 저장: {output_path}")
+
+    return summary
+
+def enqueue_file(file_path: str, queue_url: str = WORK_QUEUE_URL) -> int:
+    """
+    기업명 목록 파일을 작업 큐에 추가
+    (대기/처리 중인 기업은 그대로 두고, 처리가 끝난 done/failed 기업은 시도 횟수를 초기화해 다시 대기 상태로)
+    """
+    work_queue = open_work_queue(queue_url)
+    added = work_queue.enqueue(load_company_names(file_path))
+    print(f"📥 작업 큐에 {added}건 추가 / 큐 상태 {work_queue.stats()}")
+    return added
+
+def run_queue_worker(queue_url: str, workers: int, output_format: str = OUTPUT_FORMAT,
+                     ndjson_path: str = None, wait_for_work: bool = False):
+    """
+    작업 큐 워커 노드 실행 (여러 서버에서 같은 queue_url로 실행하면 기업을 나눠서 처리)
+    결과 출력/DB 저장은 배치 실행과 동일
+    """
+    work_queue = open_work_queue(queue_url)
+    sink = DatabaseSink() if DB_SAVE_ENABLED else None
+    writer = NdjsonWriter(ndjson_path, OUTPUT_STAGES) if output_format == "ndjson" else None
+
+    try:
+        return run_queue_workers(work_queue, workers=workers, on_result=make_result_collector(writer, sink, flush_each=True),
+                                 wait_for_work=wait_for_work)
+    finally:
+        if writer:
+            writer.close()
+        if sink:
+            sink.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기업 정보 수집 파이프라인")
+    parser.add_argument("--batch", metavar="FILE", help="기업명 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS, help="배치 실행 워커 프로세스 수")
+    parser.add_argument("--output", metavar="FILE", help="배치 정제 결과를 저장할 JSON 파일")
+    parser.add_argument("--staged", action="store_true", help="배치를 단계별 워커/큐 파이프라인으로 실행 (STAGED_* 설정 사용)")
+    parser.add_argument("--format", choices=["pretty", "ndjson"], default=OUTPUT_FORMAT, help="결과 출력 형식")
+    parser.add_argument("--ndjson-out", metavar="FILE", help="ndjson 출력 파일 (기본: stdout)")
+    parser.add_argument("--checkpoint", metavar="RUN_ID", help="배치 체크포인트 실행 ID (같은 ID로 다시 실행하면 중단된 지점부터 이어서 실행)")
+    parser.add_argument("--queue", metavar="URL", default=WORK_QUEUE_URL, help="작업 큐 URL (sqlite:///경로 또는 mysql://...)")
+    parser.add_argument("--enqueue", metavar="FILE", help="기업명 목록 파일을 작업 큐에 추가")
+    parser.add_argument("--worker", action="store_true", help="작업 큐 워커 노드로 실행 (--workers 개 스레드)")
+    parser.add_argument("--wait", action="store_true", help="워커 노드가 큐가 비어도 종료하지 않고 새 작업을 대기")
+    args = parser.parse_args()
+
+    # PROFILE_MODE 설정 시 실행 단위 프로파일 저장 (cprofile / tracemalloc)
+    if args.enqueue:
+        enqueue_file(args.enqueue, args.queue)
+    elif args.worker:
+        with profile_run("worker"):
+            run_queue_worker(args.queue, args.workers, args.format, args.ndjson_out, args.wait)
+    elif args.batch:
+        with profile_run("batch"):
+            run_batch_file(args.batch, args.workers, args.output, args.format, args.ndjson_out, args.staged, args.checkpoint)
+    else:
+        # ndjson 모드에서는 입력 안내도 stderr로 출력 (stdout에는 NDJSON 줄만 기록)
+        prompt_stream = sys.stderr if args.format == "ndjson" else sys.stdout
+        print("회사명을 입력하세요: ", end="", flush=True, file=prompt_stream)
+        company_name = input()
+        with profile_run(company_name):
+            run_single(company_name, args.format, args.ndjson_out)
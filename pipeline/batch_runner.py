@@ -0,0 +1,148 @@
+"""
+기업명 목록 파일을 읽어 여러 워커 프로세스에서 파이프라인을 병렬 실행
+"""
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from common.rate_limiter import create_shared_buckets, install_shared_buckets
+from config.setting import BATCH_WORKERS
+from pipeline.checkpoint import resume_plan, mark_completed
+from pipeline.company_pipeline import run_company_pipeline
+
+def load_company_names(file_path: str) -> list:
+    """
+    기업명 목록 파일을 읽어 리스트로 반환
+    - 한 줄에 기업명 하나
+    - 빈 줄과 '#'으로 시작하는 줄은 무시
+    - 중복된 기업명은 처음 한 번만 사용 (순서 유지)
+
+    Args:
+        file_path (str): 기업명 목록 파일 경로 (UTF-8)
+
+    Returns:
+        list: 기업명 리스트
+    """
+    names = []
+    seen = set()
+    with open(file_path, encoding="utf-8") as f:
+        for line in f:
+            name = line.strip()
+            if not name or name.startswith("#") or name in seen:
+                continue
+            seen.add(name)
+            names.append(name)
+    return names
+
+def run_one(company_name: str, checkpoint_run: str = None) -> dict:
+    """
+    한 기업의 파이프라인을 실행 (배치 워커 프로세스, 작업 큐 워커 스레드에서 사용)
+    예외는 워커 밖으로 던지지 않고 결과 딕셔너리에 담아 반환 (한 기업의 실패가 배치 전체를 멈추지 않도록)
+    """
+    started = time.perf_counter()
+    try:
+        result = run_company_pipeline(company_name, checkpoint_run)
+        return {
+            "company_name": company_name,
+            "ok": True,
+            "result": result,
+            "error": None,
+            "elapsed": time.perf_counter() - started,
+        }
+    except Exception as e:
+        return {
+            "company_name": company_name,
+            "ok": False,
+            "result": None,
+            "error": f"{type(e).__name__}: {e}\n{traceback.format_exc()}",
+            "elapsed": time.perf_counter() - started,
+        }
+
+def run_batch(company_names: list, workers: int = BATCH_WORKERS, on_result=None, checkpoint_run: str = None) -> dict:
+    """
+    여러 기업에 대해 파이프라인을 프로세스 풀에서 병렬 실행
+
+    Args:
+        company_names (list): 수집할 기업명 리스트
+        workers (int): 워커 프로세스 수
+        on_result (callable, optional): 기업 하나가 끝날 때마다 호출되는 콜백. `run_one`의 결과 딕셔너리를 인자로 받음.
+        checkpoint_run (str, optional): 체크포인트 실행 ID. 주어지면 이미 완료된 기업은 건너뛰고,
+            나머지 기업은 기록된 단계 다음부터 실행 (on_result까지 끝난 기업을 완료로 기록)
+
+    Returns:
+        dict: 배치 실행 요약
+            {
+                'total': int,            # 실행한 기업 수 (체크포인트로 건너뛴 기업 제외)
+                'skipped': int,          # 체크포인트에서 완료로 확인되어 건너뛴 기업 수
+                'succeeded': int,        # 성공 기업 수
+                'failed': list,          # 실패 목록 [{'company_name': str, 'error': str}, ...]
+                'elapsed': float,        # 전체 소요 시간(초)
+                'throughput': float      # 처리량 (기업/분)
+            }
+    """
+    skipped = 0
+    if checkpoint_run:
+        remaining = resume_plan(checkpoint_run, company_names)
+        skipped = len(company_names) - len(remaining)
+        company_names = remaining
+
+    total = len(company_names)
+    succeeded = 0
+    failed = []
+    started = time.perf_counter()
+
+    print(f"=== 배치 실행 시작: 기업 {total}개, 워커 {workers}개 ===")
+
+    # 사이트별 요청 속도 제한은 모든 워커 프로세스가 같은 token bucket을 사용
+    with ProcessPoolExecutor(max_workers=max(1, workers), initializer=install_shared_buckets,
+                             initargs=(create_shared_buckets(),)) as executor:
+        futures = {executor.submit(run_one, name, checkpoint_run): name for name in company_names}
+
+        for done_count, future in enumerate(as_completed(futures), start=1):
+            name = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as e:
+                # 워커 프로세스 자체가 죽은 경우 (BrokenProcessPool 등)
+                outcome = {
+                    "company_name": name,
+                    "ok": False,
+                    "result": None,
+                    "error": f"{type(e).__name__}: {e}",
+                    "elapsed": 0.0,
+                }
+
+            if outcome["ok"]:
+                succeeded += 1
+                print(f"✅ [{done_count}/{total}] '{name}' 완료 ({outcome['elapsed']:.1f}초)")
+            else:
+                failed.append({"company_name": name, "error": outcome["error"]})
+                print(f"❌ [{done_count}/{total}] '{name}' 실패: {outcome['error'].splitlines()[0]}")
+
+            if on_result:
+                try:
+                    on_result(outcome)
+                except Exception as e:
+                    print(f"⚠️ 결과 처리 콜백 오류 ('{name}'): {e}")
+                    continue
+
+            # 수집 실패 사이트가 있으면 completed로 기록하지 않아 재개 시 실패한 사이트를 다시 크롤링
+            if checkpoint_run and outcome["ok"] and not outcome["result"]["failed_sites"]:
+                mark_completed(checkpoint_run, name, outcome["result"]["filtered"])
+
+    elapsed = time.perf_counter() - started
+    throughput = (total / elapsed * 60) if elapsed > 0 else 0.0
+
+    print(f"\n=== 배치 실행 완료: 성공 {succeeded}/{total}, 실패 {len(failed)} ===")
+    print(f"⏱ 소요 시간 {elapsed:.1f}초, 처리량 {throughput:.2f} 기업/분")
+    for item in failed:
+        print(f"  - {item['company_name']}: {item['error'].splitlines()[0]}")
+
+    return {
+        "total": total,
+        "skipped": skipped,
+        "succeeded": succeeded,
+        "failed": failed,
+        "elapsed": elapsed,
+        "throughput": throughput,
+    }
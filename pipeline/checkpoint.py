@@ -0,0 +1,146 @@
+"""
+배치 실행 체크포인트 저널 (SQLite)
+- 실행 ID(run_id)별로 기업마다 끝난 단계와 그 결과를 기록: raw(사이트별 원본) → merged(병합) → enriched(oo.ai 보완)
+- 결과 처리(출력/DB 저장 콜백)까지 끝난 기업은 completed로 기록하고 정제 데이터를 함께 보관
+- 같은 run_id로 다시 실행하면 completed 기업은 건너뛰고, 나머지는 기록된 마지막 단계 다음부터 실행
+  (재시작 비용은 배치 크기가 아니라 남은 작업량에 비례)
+- 정제/변경 감지 단계는 빠르고 이전 상태(fingerprint)에 의존하므로 기록하지 않고 다시 실행
+"""
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from common.json_output import decimal_default_encoder
+from config.setting import CHECKPOINT_PATH
+
+# 기록하는 파이프라인 단계 (실행 순서)
+STAGES = ("raw", "merged", "enriched")
+COMPLETED = "completed"
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS checkpoint_stage (
+    run_id TEXT NOT NULL,
+    company_name TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (run_id, company_name, stage)
+)
+"""
+
+_initialized_paths = set()
+
+def _connect():
+    """
+    저널 DB 연결 생성 (호출마다 새 연결: 스레드/프로세스 간에 연결을 공유하지 않음)
+    """
+    directory = os.path.dirname(CHECKPOINT_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(CHECKPOINT_PATH, timeout=30)
+    if CHECKPOINT_PATH not in _initialized_paths:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.commit()
+        _initialized_paths.add(CHECKPOINT_PATH)
+    return conn
+
+def save_stage(run_id: str, company_name: str, stage: str, data) -> None:
+    """
+    기업 하나의 단계 결과 기록 (기록 실패는 경고만 출력하고 파이프라인은 계속 진행)
+    """
+    try:
+        serialized = json.dumps(data, ensure_ascii=False, default=decimal_default_encoder)
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoint_stage (run_id, company_name, stage, data, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (run_id, company_name, stage, serialized, time.time()),
+            )
+    except (sqlite3.Error, TypeError, ValueError) as e:
+        print(f"⚠️ 체크포인트 기록 오류 ('{company_name}' {stage}): {e}")
+
+def load_stages(run_id: str, company_name: str) -> dict:
+    """
+    기업 하나의 기록된 단계 결과 조회
+
+    Returns:
+        dict: 단계명 → 결과 (STAGES 순서대로 앞 단계부터 연속으로 기록된 것만 반환, 없으면 빈 dict)
+    """
+    try:
+        with closing(_connect()) as conn:
+            rows = conn.execute(
+                "SELECT stage, data FROM checkpoint_stage WHERE run_id = ? AND company_name = ?",
+                (run_id, company_name),
+            ).fetchall()
+    except sqlite3.Error as e:
+        print(f"⚠️ 체크포인트 조회 오류 ('{company_name}'): {e}")
+        return {}
+
+    recorded = dict(rows)
+    stages = {}
+    for stage in STAGES:
+        if stage not in recorded:
+            break
+        stages[stage] = json.loads(recorded[stage])
+    return stages
+
+def mark_completed(run_id: str, company_name: str, filtered_data: dict) -> None:
+    """
+    결과 처리까지 끝난 기업을 completed로 기록 (정제 데이터 보관)
+    """
+    save_stage(run_id, company_name, COMPLETED, filtered_data)
+
+def completed_companies(run_id: str) -> set:
+    """
+    completed로 기록된 기업명 집합
+    """
+    try:
+        with closing(_connect()) as conn:
+            rows = conn.execute(
+                "SELECT company_name FROM checkpoint_stage WHERE run_id = ? AND stage = ?",
+                (run_id, COMPLETED),
+            ).fetchall()
+    except sqlite3.Error as e:
+        print(f"⚠️ 체크포인트 조회 오류: {e}")
+        return set()
+    return {row[0] for row in rows}
+
+def load_completed_results(run_id: str, company_names: list) -> list:
+    """
+    completed 기업의 정제 데이터 조회 (이어서 실행할 때 이전에 끝난 기업도 결과 파일에 포함하기 위해 사용)
+
+    Returns:
+        list: (기업명, 정제 데이터 dict) 리스트 (company_names 순서, completed가 아닌 기업은 제외)
+    """
+    try:
+        with closing(_connect()) as conn:
+            rows = dict(conn.execute(
+                "SELECT company_name, data FROM checkpoint_stage WHERE run_id = ? AND stage = ?",
+                (run_id, COMPLETED),
+            ).fetchall())
+    except sqlite3.Error as e:
+        print(f"⚠️ 체크포인트 조회 오류: {e}")
+        return []
+    return [(name, json.loads(rows[name])) for name in company_names if name in rows]
+
+def resume_plan(run_id: str, company_names: list) -> list:
+    """
+    이어서 실행할 기업 목록 (completed 기업 제외, 순서 유지)
+    """
+    done = completed_companies(run_id)
+    remaining = [name for name in company_names if name not in done]
+    if done:
+        print(f"♻️ 체크포인트 '{run_id}': 완료된 기업 {len(company_names) - len(remaining)}개 건너뜀, 남은 기업 {len(remaining)}개")
+    return remaining
+
+def clear_run(run_id: str) -> int:
+    """
+    실행 ID의 체크포인트 전체 삭제
+
+    Returns:
+        int: 삭제한 행 수
+    """
+    with closing(_connect()) as conn, conn:
+        return conn.execute("DELETE FROM checkpoint_stage WHERE run_id = ?", (run_id,)).rowcount
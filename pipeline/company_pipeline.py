@@ -0,0 +1,245 @@
+"""
+단일 기업에 대한 수집 → 병합 → 보완 → 정제 파이프라인
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from common.capture import capture, is_capture_enabled
+from common.common_field_template import new_company_data
+from common.resilience import is_circuit_open
+from common.tracing import start_trace, span, bind_trace, dump_trace
+from config.setting import SITE_CRAWL_TIMEOUTS, SARAMIN_HTTP_FIRST
+from crawl.driver_pool import borrowed_driver, lazy_borrowed_driver
+from crawl.jobkorea import smart_crawl_jobkorea
+from crawl.ooai import enrich_company_data
+from crawl.saramin import crawl_from_saramin
+from integration.merge_engine import merge_site_results
+from filtering.data_field_filtering import filtering_company_info
+from filtering.change_detection import compute_delta
+from pipeline.checkpoint import load_stages, save_stage
+
+# 사이트명 → 크롤링 함수 (raw_dict의 키 순서와 동일)
+SITE_CRAWLERS = {
+    "jobkorea": smart_crawl_jobkorea,
+    "saramin": crawl_from_saramin,
+}
+
+# HTTP로 먼저 수집하고 필요할 때만 드라이버를 빌리는 사이트 (크롤링 함수가 driver_factory 인자를 받음)
+LAZY_DRIVER_SITES = {"saramin"} if SARAMIN_HTTP_FIRST else set()
+
+_running_crawls = 0 # 실행 중인 사이트 크롤링 수 (제한 시간을 넘겨 포기한 크롤링 포함)
+_running_lock = threading.Lock()
+
+def running_crawl_count() -> int:
+    """
+    이 프로세스에서 아직 실행 중인 사이트 크롤링 수
+    """
+    with _running_lock:
+        return _running_crawls
+
+def _crawl_site(site: str, crawler, company_name: str, timeout: float = None) -> dict:
+    """
+    드라이버 풀에서 드라이버를 빌려 사이트 크롤링 함수 한 개를 실행
+    LAZY_DRIVER_SITES의 사이트는 브라우저로 대체할 때만 드라이버를 빌림
+    timeout은 드라이버의 페이지 로딩/스크립트 제한 시간으로 적용되고, 넘겨서 끝난 드라이버는 풀에 반납하지 않음
+    """
+    global _running_crawls
+    with _running_lock:
+        _running_crawls += 1
+    try:
+        if site in LAZY_DRIVER_SITES:
+            with lazy_borrowed_driver(site, timeout) as get_driver:
+                return crawler(company_name, driver_factory=get_driver)
+        with borrowed_driver(site, timeout) as driver:
+            return crawler(company_name, driver=driver)
+    finally:
+        with _running_lock:
+            _running_crawls -= 1
+
+def crawl_sites(company_name: str, sites: list = None, timeouts: dict = None) -> tuple:
+    """
+    사이트별 크롤러를 스레드 풀에서 동시에 실행하고 결과와 실패한 사이트 목록을 반환
+    - 사이트마다 자신의 드라이버를 사용
+    - 회로가 차단되었거나 제한 시간을 넘기거나 예외가 발생한 사이트는 기본 템플릿으로 대체하고 실패로 기록
+    - 전체 소요 시간은 두 사이트의 합이 아니라 느린 사이트 기준
+
+    Args:
+        company_name (str): 수집할 기업명
+        sites (list, optional): 수집할 사이트 목록. 없으면 SITE_CRAWLERS 전체
+        timeouts (dict, optional): 사이트별 제한 시간(초). 없으면 SITE_CRAWL_TIMEOUTS 사용
+
+    Returns:
+        tuple: (raw_dict, failed_sites)
+            raw_dict (dict): 사이트별 수집 결과 ({'jobkorea': dict, 'saramin': dict})
+            failed_sites (list): 수집에 실패해 기본 템플릿으로 대체된 사이트 목록
+    """
+    timeouts = timeouts or SITE_CRAWL_TIMEOUTS
+    sites = list(sites or SITE_CRAWLERS)
+    raw_dict, failed_sites = {}, []
+
+    # 회로가 차단된 사이트는 드라이버를 빌리지 않고 실패로 기록
+    for site in sites:
+        if is_circuit_open(site):
+            print(f"⛔ [{site}] 회로 차단 중: '{company_name}' 수집 생략")
+            raw_dict[site] = new_company_data()
+            failed_sites.append(site)
+    sites = [site for site in sites if site not in raw_dict]
+    if not sites:
+        return raw_dict, failed_sites
+
+    executor = ThreadPoolExecutor(max_workers=len(sites), thread_name_prefix="site-crawl")
+    started = time.monotonic()
+
+    try:
+        futures = {
+            site: executor.submit(bind_trace(_crawl_site), site, SITE_CRAWLERS[site], company_name, timeouts.get(site))
+            for site in sites
+        }
+
+        for site, future in futures.items():
+            # 모든 사이트가 동시에 시작했으므로 사이트별 마감 시각 = 시작 시각 + 제한 시간
+            remaining = max(0.0, started + timeouts.get(site, 0) - time.monotonic())
+            try:
+                raw_dict[site] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                print(f"⏱ [{site}] '{company_name}' 크롤링 제한 시간({timeouts.get(site)}초) 초과 "
+                      f"(실행 중인 크롤링 {running_crawl_count()}개)")
+                raw_dict[site] = new_company_data()
+                failed_sites.append(site)
+            except Exception as e:
+                print(f"[예외 발생] {site} 크롤링: {e}")
+                raw_dict[site] = new_company_data()
+                failed_sites.append(site)
+
+        return raw_dict, failed_sites
+
+    finally:
+        # 제한 시간을 넘긴 크롤러는 기다리지 않음
+        # (드라이버의 페이지 로딩 제한 시간으로 곧 끝나며, 끝난 드라이버는 풀에 반납하지 않고 종료됨)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def crawl_sites_concurrently(company_name: str, timeouts: dict = None) -> dict:
+    """
+    모든 사이트를 동시에 크롤링하고 raw_dict만 반환 (실패한 사이트는 기본 템플릿)
+
+    Returns:
+        dict: raw_dict 형태의 사이트별 수집 결과 ({'jobkorea': dict, 'saramin': dict})
+    """
+    raw_dict, _ = crawl_sites(company_name, timeouts=timeouts)
+    return raw_dict
+
+def crawl_missing_sites(company_name: str, saved_raw: dict = None, checkpoint_run: str = None) -> tuple:
+    """
+    체크포인트에 기록되지 않은 사이트만 크롤링해 raw_dict를 완성
+    - 성공한 사이트만 'raw' 단계로 기록하고, 실패한 사이트는 기록하지 않아 재개 시 다시 크롤링
+
+    Args:
+        company_name (str): 수집할 기업명
+        saved_raw (dict, optional): 체크포인트에 기록된 사이트별 수집 결과 (일부 사이트만 있을 수 있음)
+        checkpoint_run (str, optional): 체크포인트 실행 ID
+
+    Returns:
+        tuple: (raw_dict, failed_sites, crawled)
+            raw_dict (dict): 모든 사이트의 수집 결과
+            failed_sites (list): 이번 실행에서 수집에 실패한 사이트 목록
+            crawled (bool): 이번 실행에서 크롤링한 사이트가 있는지 여부 (있으면 이후 단계 기록은 무효)
+    """
+    saved_raw = saved_raw or {}
+    missing = [site for site in SITE_CRAWLERS if site not in saved_raw]
+    if not missing:
+        return {site: saved_raw[site] for site in SITE_CRAWLERS}, [], False
+
+    if saved_raw:
+        print(f"♻️ '{company_name}' 체크포인트에 없는 사이트만 다시 크롤링: {', '.join(missing)}")
+    with span("pipeline.crawl_sites"):
+        crawled_raw, failed_sites = crawl_sites(company_name, missing)
+
+    raw_dict = {site: saved_raw[site] if site in saved_raw else crawled_raw[site] for site in SITE_CRAWLERS}
+    if checkpoint_run:
+        succeeded = {site: data for site, data in raw_dict.items() if site not in failed_sites}
+        if succeeded:
+            save_stage(checkpoint_run, company_name, "raw", succeeded)
+    if failed_sites:
+        print(f"⚠️ '{company_name}' 수집 실패 사이트: {', '.join(failed_sites)} (체크포인트 재개 시 다시 크롤링)")
+    return raw_dict, failed_sites, True
+
+def merge_raw_data(company_name: str, raw_dict: dict) -> dict:
+    """
+    사이트별 수집 결과 병합 (capture 모드면 병합 결과를 fixture로 저장)
+    """
+    integration_result = merge_site_results(raw_dict)
+    if is_capture_enabled():
+        capture("pipeline", "merged", company_name, json.dumps(integration_result, ensure_ascii=False), "json")
+    return integration_result
+
+def run_company_pipeline(company_name: str, checkpoint_run: str = None) -> dict:
+    """
+    한 기업에 대해 전체 파이프라인을 실행
+    (잡코리아/사람인 크롤링 → 병합 → oo.ai 보완 → 정제)
+
+    Args:
+        company_name (str): 수집할 기업명
+        checkpoint_run (str, optional): 체크포인트 실행 ID. 주어지면 단계 결과를 저널에 기록하고,
+            이미 기록된 단계(raw/merged/enriched)는 다시 실행하지 않고 기록된 결과를 사용
+
+    TRACE_DIR이 설정되어 있으면 단계별 소요 시간(span)을 기업별 JSON 파일로 저장.
+
+    Returns:
+        dict: 단계별 결과
+            {
+                'raw': {'jobkorea': dict, 'saramin': dict},  # 사이트별 원본 데이터
+                'merged': dict,                              # 병합 데이터
+                'enriched': dict,                            # oo.ai 보완 데이터
+                'filtered': dict,                            # 정제 데이터
+                'delta': dict,                               # 이전 수집 대비 변경 내역 (compute_delta 결과)
+                'failed_sites': list                         # 수집에 실패한 사이트 (있으면 merged 이후 단계는 기록하지 않음)
+            }
+    """
+    saved = load_stages(checkpoint_run, company_name) if checkpoint_run else {}
+    if saved:
+        print(f"♻️ '{company_name}' 체크포인트에서 이어서 실행 (완료 단계: {', '.join(saved)})")
+
+    with start_trace(company_name) as trace:
+        # 각 사이트 동시 크롤링 (사이트별 드라이버, 풀의 warm 드라이버 재사용)
+        raw_dict, failed_sites, crawled = crawl_missing_sites(company_name, saved.get("raw"), checkpoint_run)
+        if crawled:
+            # 새로 크롤링한 사이트가 있으면 이전에 기록된 이후 단계는 사용하지 않음
+            saved = {"raw": saved.get("raw")}
+        # 실패한 사이트가 있으면 불완전한 병합/보완 결과를 기록하지 않음 (재개 시 다시 계산)
+        record = checkpoint_run if not failed_sites else None
+
+        # 수집 데이터 병합
+        integration_result = saved.get("merged")
+        if integration_result is None:
+            integration_result = merge_raw_data(company_name, raw_dict)
+            if record:
+                save_stage(record, company_name, "merged", integration_result)
+
+        # 병합 결과에서 oo.ai 크롤링으로 정성적인 필드 정보 수집
+        ooai_data_result = saved.get("enriched")
+        if ooai_data_result is None:
+            ooai_data_result = enrich_company_data(integration_result.get('name'), integration_result)
+            if record:
+                save_stage(record, company_name, "enriched", ooai_data_result)
+
+        # 정제 로직 실행
+        filtered_data = filtering_company_info(ooai_data_result)
+
+        # 이전 수집 결과 대비 변경된 필드 추출
+        delta = compute_delta(company_name, filtered_data)
+
+    # 단계별 소요 시간 저장 (TRACE_DIR 설정 시)
+    trace_path = dump_trace(trace)
+    if trace_path:
+        print(f"⏱ 단계별 소요 시간 저장: {trace_path}")
+
+    return {
+        "raw": raw_dict,
+        "merged": integration_result,
+        "enriched": ooai_data_result,
+        "filtered": filtered_data,
+        "delta": delta,
+        "failed_sites": failed_sites,
+    }
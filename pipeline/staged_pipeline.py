@@ -0,0 +1,221 @@
+"""
+단계별 워커와 큐로 구성된 파이프라인 (staged pipeline)
+- 크롤링+병합 → oo.ai 보완 → 정제 단계를 크기 제한 큐로 연결하고, 단계마다 워커 스레드 수를 따로 지정
+- 느린 oo.ai 보완이 진행되는 동안에도 크롤링 워커는 다음 기업의 브라우저 작업을 계속 진행
+- 다음 단계 큐가 가득 차면 앞 단계가 대기 (backpressure: 처리되지 않은 결과가 메모리에 쌓이지 않음)
+- 입력이 끝나면 단계 순서대로 종료 신호를 전달하여 큐에 남은 기업까지 모두 처리한 뒤 종료 (graceful drain)
+- checkpoint_run이 주어지면 단계 결과를 체크포인트 저널에 기록하고, 기록된 단계는 다시 실행하지 않음
+"""
+import queue
+import threading
+import time
+import traceback
+
+from common.tracing import Trace, use_trace, span, dump_trace
+from config.setting import (
+    STAGED_CRAWL_WORKERS, STAGED_ENRICH_WORKERS, STAGED_FILTER_WORKERS, STAGED_QUEUE_SIZE, DRIVER_POOL_SIZE,
+    OOAI_CONCURRENCY,
+)
+from crawl.driver_pool import close_all_drivers
+from crawl.ooai import enrich_company_data, ensure_default_pool_size
+from filtering.data_field_filtering import filtering_company_info
+from filtering.change_detection import compute_delta
+from pipeline.checkpoint import load_stages, save_stage, mark_completed, resume_plan
+from pipeline.company_pipeline import SITE_CRAWLERS, crawl_missing_sites, merge_raw_data
+
+_STOP = object() # 워커 종료 신호
+
+def _run_step(item: dict, stage: str, func, *args) -> None:
+    # 체크포인트에 기록된 단계면 기록된 결과 사용, 아니면 실행 후 기록 (수집 실패 사이트가 있으면 기록하지 않음)
+    if stage in item["saved"]:
+        item["result"][stage] = item["saved"][stage]
+        return
+    item["result"][stage] = func(*args)
+    if item["checkpoint_run"] and not item["result"]["failed_sites"]:
+        save_stage(item["checkpoint_run"], item["company_name"], stage, item["result"][stage])
+
+def _crawl_stage(item: dict) -> None:
+    name = item["company_name"]
+    # 체크포인트에 없는 사이트만 크롤링 (성공한 사이트만 'raw' 단계로 기록됨)
+    raw_dict, failed_sites, crawled = crawl_missing_sites(name, item["saved"].get("raw"), item["checkpoint_run"])
+    item["result"]["raw"] = raw_dict
+    item["result"]["failed_sites"] = failed_sites
+    if crawled:
+        # 새로 크롤링한 사이트가 있으면 이전에 기록된 이후 단계는 사용하지 않음
+        item["saved"] = {}
+    _run_step(item, "merged", merge_raw_data, name, item["result"]["raw"])
+
+def _enrich_stage(item: dict) -> None:
+    merged = item["result"]["merged"]
+    _run_step(item, "enriched", enrich_company_data, merged.get('name'), merged)
+
+def _filter_stage(item: dict) -> None:
+    item["result"]["filtered"] = filtering_company_info(item["result"]["enriched"])
+    item["result"]["delta"] = compute_delta(item["company_name"], item["result"]["filtered"])
+
+class _Stage:
+    """
+    단계 하나 (입력 큐 + 워커 스레드)
+    마지막 워커가 종료될 때 다음 단계 워커 수만큼 종료 신호를 전달
+    """
+    def __init__(self, name: str, handler, workers: int, input_queue: queue.Queue):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.input_queue = input_queue
+        self.next_stage = None
+        self.threads = []
+        self._alive = self.workers
+        self._lock = threading.Lock()
+
+    def worker_exited(self) -> None:
+        with self._lock:
+            self._alive -= 1
+            last = self._alive == 0
+        if last and self.next_stage:
+            for _ in range(self.next_stage.workers):
+                self.next_stage.input_queue.put(_STOP)
+
+def run_staged(company_names: list, crawl_workers: int = STAGED_CRAWL_WORKERS, enrich_workers: int = STAGED_ENRICH_WORKERS,
+               filter_workers: int = STAGED_FILTER_WORKERS, queue_size: int = STAGED_QUEUE_SIZE, on_result=None,
+               checkpoint_run: str = None) -> dict:
+    """
+    여러 기업에 대해 단계별 파이프라인을 실행 (한 프로세스 안에서 단계별 스레드 워커 사용)
+
+    Args:
+        company_names (list): 수집할 기업명 리스트
+        crawl_workers (int): 크롤링+병합 워커 수 (동시에 사용하는 Chrome 드라이버 수 = 워커 수 x 사이트 수)
+        enrich_workers (int): oo.ai 보완 워커 수
+        filter_workers (int): 정제 워커 수 (on_result 콜백도 이 단계에서 호출)
+        queue_size (int): 단계 사이 큐 최대 크기
+        on_result (callable, optional): 기업 하나가 끝날 때마다 호출되는 콜백.
+            batch_runner.run_batch와 같은 결과 딕셔너리({'company_name', 'ok', 'result', 'error', 'elapsed'})를 인자로 받음.
+            여러 워커에서 호출되더라도 한 번에 하나씩만 실행됨.
+        checkpoint_run (str, optional): 체크포인트 실행 ID (batch_runner.run_batch와 동일)
+
+    Returns:
+        dict: 실행 요약 (batch_runner.run_batch와 같은 형식)
+    """
+    skipped = 0
+    if checkpoint_run:
+        remaining = resume_plan(checkpoint_run, company_names)
+        skipped = len(company_names) - len(remaining)
+        company_names = remaining
+
+    total = len(company_names)
+    succeeded = 0
+    failed = []
+    done_count = 0
+    result_lock = threading.Lock()
+    started = time.perf_counter()
+
+    if DRIVER_POOL_SIZE < crawl_workers * len(SITE_CRAWLERS):
+        print(f"⚠️ DRIVER_POOL_SIZE({DRIVER_POOL_SIZE})가 동시 사용 드라이버 수({crawl_workers * len(SITE_CRAWLERS)})보다 작아 드라이버가 재사용되지 않고 다시 생성됩니다.")
+
+    # enrich 워커마다 최대 OOAI_CONCURRENCY개의 oo.ai 요청을 동시에 보내므로 커넥션 풀도 그만큼 확보
+    ensure_default_pool_size(max(1, enrich_workers) * max(1, OOAI_CONCURRENCY))
+
+    stages = [
+        _Stage("crawl", _crawl_stage, crawl_workers, queue.Queue(maxsize=queue_size)),
+        _Stage("enrich", _enrich_stage, enrich_workers, queue.Queue(maxsize=queue_size)),
+        _Stage("filter", _filter_stage, filter_workers, queue.Queue(maxsize=queue_size)),
+    ]
+    for stage, next_stage in zip(stages, stages[1:]):
+        stage.next_stage = next_stage
+
+    def complete(item: dict, error: str = None) -> None:
+        nonlocal succeeded, done_count
+        name = item["company_name"]
+        outcome = {
+            "company_name": name,
+            "ok": error is None,
+            "result": item["result"] if error is None else None,
+            "error": error,
+            "elapsed": time.perf_counter() - item["started"],
+        }
+
+        # 단계별 소요 시간 저장 (TRACE_DIR 설정 시, 큐 대기 시간 포함)
+        dump_trace(item["trace"])
+
+        with result_lock:
+            done_count += 1
+            if outcome["ok"]:
+                succeeded += 1
+                print(f"✅ [{done_count}/{total}] '{name}' 완료 ({outcome['elapsed']:.1f}초)")
+            else:
+                failed.append({"company_name": name, "error": error})
+                print(f"❌ [{done_count}/{total}] '{name}' 실패: {error.splitlines()[0]}")
+
+            if on_result:
+                try:
+                    on_result(outcome)
+                except Exception as e:
+                    print(f"⚠️ 결과 처리 콜백 오류 ('{name}'): {e}")
+                    return
+
+        # 수집 실패 사이트가 있으면 completed로 기록하지 않아 재개 시 실패한 사이트를 다시 크롤링
+        if checkpoint_run and outcome["ok"] and not outcome["result"]["failed_sites"]:
+            mark_completed(checkpoint_run, name, outcome["result"]["filtered"])
+
+    def work(stage: _Stage) -> None:
+        try:
+            while True:
+                item = stage.input_queue.get()
+                if item is _STOP:
+                    return
+
+                try:
+                    with use_trace(item["trace"]), span(f"staged.{stage.name}"):
+                        stage.handler(item)
+                except Exception as e:
+                    complete(item, f"[{stage.name}] {type(e).__name__}: {e}\n{traceback.format_exc()}")
+                    continue
+
+                if stage.next_stage:
+                    stage.next_stage.input_queue.put(item) # 다음 단계 큐가 가득 차 있으면 대기
+                else:
+                    complete(item)
+        finally:
+            stage.worker_exited()
+
+    print(f"=== 단계별 실행 시작: 기업 {total}개, 워커 crawl {stages[0].workers} / enrich {stages[1].workers} / filter {stages[2].workers} ===")
+
+    for stage in stages:
+        for i in range(stage.workers):
+            thread = threading.Thread(target=work, args=(stage,), name=f"staged-{stage.name}-{i}", daemon=True)
+            thread.start()
+            stage.threads.append(thread)
+
+    try:
+        for name in company_names:
+            item = {
+                "company_name": name, "trace": Trace(name), "started": time.perf_counter(), "result": {},
+                "checkpoint_run": checkpoint_run, "saved": load_stages(checkpoint_run, name) if checkpoint_run else {},
+            }
+            stages[0].input_queue.put(item) # 크롤링 큐가 가득 차 있으면 대기
+    except KeyboardInterrupt:
+        print("⏹ 중단 요청: 새 기업 투입을 멈추고 진행 중인 기업만 마무리합니다.")
+    finally:
+        for _ in range(stages[0].workers):
+            stages[0].input_queue.put(_STOP)
+        for stage in stages:
+            for thread in stage.threads:
+                thread.join()
+        close_all_drivers()
+
+    elapsed = time.perf_counter() - started
+    throughput = (done_count / elapsed * 60) if elapsed > 0 else 0.0
+
+    print(f"\n=== 단계별 실행 완료: 성공 {succeeded}/{total}, 실패 {len(failed)} ===")
+    print(f"⏱ 소요 시간 {elapsed:.1f}초, 처리량 {throughput:.2f} 기업/분")
+    for item in failed:
+        print(f"  - {item['company_name']}: {item['error'].splitlines()[0]}")
+
+    return {
+        "total": total,
+        "skipped": skipped,
+        "succeeded": succeeded,
+        "failed": failed,
+        "elapsed": elapsed,
+        "throughput": throughput,
+    }